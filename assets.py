@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Content-hashed CSS/JS bundles for index.html
+Concatenates and minifies the page's stylesheets and scripts into
+assets/site.<hash>.css and assets/site.<hash>.js, so they can be cached
+forever and the scripts can load with defer instead of blocking the head
+"""
+
+import hashlib
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_DIR = 'assets'
+STYLESHEETS = ('css/default.css',)
+SCRIPTS = ('js/fb_share.js', 'js/open_secret.js', 'js/navigation.js')
+# Loaded after the scripts but never bundled: index.js is an ES module (it ends in an export) that the
+# page includes as a classic script, so browsers reject it; bundling it would make its loading-fade and
+# logging side effects run for the first time, only with --bundle
+UNBUNDLED_SCRIPTS = ('index.js',)
+
+CSS_TOKENS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/''', re.S)
+CSS_SPACES = re.compile(r'\s+')
+CSS_PUNCTUATION = re.compile(r' ?([{};,>]) ?')
+JS_LINE_BREAKS = re.compile(r'[ \t]*\n\s*')
+JS_SPACES = re.compile(r'[ \t]+')
+# A '/' after one of these starts a regular expression literal, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {''}
+
+def collapse_css(code):
+    """Whitespace of a code chunk: runs become one space, none around punctuation"""
+    code = CSS_PUNCTUATION.sub(r'\1', CSS_SPACES.sub(' ', code))
+    return code.replace(': ', ':').replace(';}', '}')
+
+def minify_css(text):
+    """Drop comments and insignificant whitespace; quoted strings are kept verbatim"""
+    out = []
+    code = []
+    position = 0
+    for match in CSS_TOKENS.finditer(text):
+        code.append(text[position:match.start()])
+        if match.group(1):
+            out.append(collapse_css(''.join(code)))
+            out.append(match.group(1))
+            code = []
+        else:
+            code.append(' ')
+        position = match.end()
+    code.append(text[position:])
+    out.append(collapse_css(''.join(code)))
+    return ''.join(out).strip()
+
+def collapse_js(code):
+    """Whitespace of a code chunk: indentation and blank lines go, line breaks stay (for ASI)"""
+    return JS_SPACES.sub(' ', JS_LINE_BREAKS.sub('\n', code))
+
+def minify_js(text):
+    """Drop comments, indentation and blank lines; strings, template literals and regexes are kept verbatim"""
+    out = []
+    code = []
+    last = ''
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in '\'"`' or (c == '/' and last in REGEX_PRECEDERS and text[i + 1:i + 2] not in ('/', '*')):
+            j = i + 1
+            in_class = False
+            while j < n:
+                if text[j] == '\\':
+                    j += 2
+                    continue
+                if c == '/' and text[j] in '[]':
+                    in_class = text[j] == '['
+                elif text[j] == c and not in_class:
+                    break
+                j += 1
+            out.append(collapse_js(''.join(code)))
+            out.append(text[i:j + 1])
+            code = []
+            last = c
+            i = j + 1
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = n if end < 0 else end
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            code.append(' ')
+        else:
+            code.append(c)
+            if not c.isspace():
+                last = c
+            i += 1
+    out.append(collapse_js(''.join(code)))
+    return ''.join(out).strip()
+
+def read_sources(paths, root=ROOT):
+    """Contents of the given site-relative files"""
+    sources = []
+    for path in paths:
+        with open(os.path.join(root, path), 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    return sources
+
+def write_bundle(content, name, extension, output_dir):
+    """Write content as <name>.<hash>.<extension> unless it already exists; remove stale bundles"""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    filename = f'{name}.{digest}.{extension}'
+    os.makedirs(output_dir, exist_ok=True)
+    target = os.path.join(output_dir, filename)
+    if not os.path.exists(target):
+        with open(target + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(target + '.tmp', target)
+    for other in os.listdir(output_dir):
+        if other != filename and other.startswith(name + '.') and other.endswith('.' + extension):
+            os.remove(os.path.join(output_dir, other))
+    return filename
+
+def build_bundles(site_dir, root=ROOT):
+    """Build the CSS and JS bundles under site_dir/assets; returns their site-relative hrefs"""
+    output_dir = os.path.join(site_dir, BUNDLE_DIR)
+    css = '\n'.join(minify_css(source) for source in read_sources(STYLESHEETS, root)) + '\n'
+    js = ';\n'.join(minify_js(source) for source in read_sources(SCRIPTS, root)) + '\n'
+    return {
+        'stylesheets': (f'{BUNDLE_DIR}/{write_bundle(css, "site", "css", output_dir)}',),
+        'scripts': (f'{BUNDLE_DIR}/{write_bundle(js, "site", "js", output_dir)}',),
+    }
+
+def asset_slots(bundles=None):
+    """<link>/<script> tags for the template: the deferred bundles if given, otherwise the separate files"""
+    if bundles is None:
+        stylesheets, scripts, defer = STYLESHEETS, SCRIPTS, ''
+    else:
+        stylesheets, scripts, defer = bundles['stylesheets'], bundles['scripts'], ' defer'
+    return {
+        'stylesheets': '\n'.join(f'    <link rel="stylesheet" href="{href}">' for href in stylesheets),
+        'scripts': '\n'.join(f'    <script{defer} src="{href}"></script>' for href in scripts + UNBUNDLED_SCRIPTS),
+    }
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Highlighting of the CV owner in author lists, driven by the personal data
+The owner's name variants (display name, full name, each given name and
+its initials) are compiled once into a single matcher; every author list
+is split into names once and cached, then rendered for HTML or LaTeX
+"""
+
+import re
+from functools import lru_cache
+
+from escaping import CACHE_SIZE
+
+# "A, B, and C" / "A, B and C": the separators between names are kept as written
+SEPARATOR = re.compile(r'(,\s*and\s+|,\s*|\s+and\s+)')
+# Bold markup some author lists carry from older data
+LEGACY_BOLD = re.compile(r'^<b>(.*)</b>$', re.S)
+
+def initials(given):
+    """'Spyridon Chrysovalantis' -> 'S. C.'"""
+    return ' '.join(f'{part[0]}.' for part in given.split())
+
+def author_key(personal):
+    """Hashable tuple of the owner's name variants
+
+    personal.authorNames, when present, lists the variants explicitly;
+    otherwise they are derived from displayName, firstName and lastName.
+    """
+    personal = personal or {}
+    if personal.get('authorNames'):
+        return tuple(personal['authorNames'])
+
+    display = personal.get('displayName', '').strip()
+    first = personal.get('firstName', '').strip()
+    last = personal.get('lastName', '').strip()
+    variants = [display] if display else []
+    if not last:
+        return tuple(variants)
+
+    given_names = first.split()
+    if first:
+        given_names.insert(0, first)
+    if display.endswith(' ' + last):
+        given_names.insert(0, display[:-len(last)].strip())
+    for given in given_names:
+        variants += [f'{given} {last}', f'{initials(given)} {last}']
+    return tuple(dict.fromkeys(variants))
+
+def variant_pattern(variant):
+    """Regex for one variant: dots after initials optional, any spacing between parts"""
+    pattern = re.sub(r'(?:\\ )+', r'\\s+', re.escape(variant))
+    return re.sub(r'\\\.(\\s\+)?', lambda m: r'\.?\s*' if m.group(1) else r'\.?', pattern)
+
+@lru_cache(maxsize=64)
+def compile_authors(key):
+    """One case-insensitive full-name matcher for all variants, longest first"""
+    if not key:
+        return None
+    variants = sorted(key, key=len, reverse=True)
+    return re.compile('|'.join(variant_pattern(variant) for variant in variants), re.I)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_authors(text, key):
+    """Split an author list into (segment, is_owner) pairs; separators are (separator, None)"""
+    matcher = compile_authors(key)
+    parts = []
+    for index, segment in enumerate(SEPARATOR.split(text)):
+        if index % 2:
+            parts.append((segment, None))
+            continue
+        legacy = LEGACY_BOLD.match(segment)
+        name = legacy.group(1) if legacy else segment
+        parts.append((name, bool(matcher and matcher.fullmatch(name.strip())) or bool(legacy)))
+    return tuple(parts)
+
+def clear_caches():
+    """Drop all memoized results"""
+    compile_authors.cache_clear()
+    parse_authors.cache_clear()
+
+def highlight_authors(text, personal, escape, bold):
+    """Escape an author list, wrapping the owner's names with the bold format string"""
+    if not text:
+        return ''
+    return ''.join(bold.format(escape(segment)) if owner else escape(segment)
+                   for segment, owner in parse_authors(text, author_key(personal)))
+
+def highlight_html(text, personal, escape):
+    """Author list for HTML with the owner in <b>"""
+    return highlight_authors(text, personal, escape, '<b>{}</b>')
+
+def highlight_latex(text, personal, escape):
+    """Author list for LaTeX with the owner in \\textbf"""
+    return highlight_authors(text, personal, escape, '\\textbf{{{}}}')
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Render index.html and cv.tex for many CVs in parallel
+Takes a directory of CV JSON files (or a JSON manifest listing them) and
+renders every CV in its own output directory using a process pool
+With --pdf every CV is also compiled, all of them loading one precompiled
+preamble format
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import generate_html
+import generate_latex
+from pdf_compile import FORMAT_DIR, compile_pdf
+from schema import SchemaError
+
+# CV names become output directory names: one path component, not '.' or '..'
+NAME = re.compile(r'[\w.-]+')
+
+def load_jobs(source):
+    """Collect (name, data path) jobs from a directory or a manifest file
+
+    A manifest is a JSON list whose items are either paths or objects with
+    "data" and an optional "name"; relative paths are resolved against the
+    manifest's directory. Names pick the output directories, so they must
+    match NAME and a name used twice is an error; problems are raised as
+    ValueError naming the manifest item.
+    """
+    if os.path.isdir(source):
+        return [(os.path.splitext(name)[0], os.path.join(source, name))
+                for name in sorted(os.listdir(source)) if name.endswith('.json')]
+
+    with open(source, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, list):
+        raise ValueError(f'{source}: manifest must be a JSON list of CV files')
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    jobs = []
+    seen = {}
+    for index, item in enumerate(manifest):
+        if isinstance(item, str):
+            item = {'data': item}
+        if not isinstance(item, dict) or not isinstance(item.get('data'), str):
+            raise ValueError(f'{source}: item {index} must be a path or an object with a "data" path')
+        path = os.path.join(base_dir, item['data'])
+        name = item.get('name') or os.path.splitext(os.path.basename(path))[0]
+        if not isinstance(name, str) or not NAME.fullmatch(name) or not name.strip('.'):
+            raise ValueError(f'{source}: item {index}: CV name {json.dumps(name)} may only use letters, digits, '
+                             f'"_", "-" and "." (and not be "." or "..")')
+        if name in seen:
+            raise ValueError(f'{source}: CV name "{name}" is used by both {seen[name]} and {path}; '
+                             f'give one of them a "name"')
+        seen[name] = path
+        jobs.append((name, path))
+    return jobs
+
+def render_job(name, data_path, output_dir, incremental=False, pdf=False):
+    """Render one CV into its own directory; errors are returned, not raised"""
+    started = time.perf_counter()
+    job_dir = os.path.join(output_dir, name)
+    try:
+        os.makedirs(job_dir, exist_ok=True)
+        cache_dir = os.path.join(job_dir, '.cache') if incremental else None
+        data = generate_html.load_data(data_path)
+        generate_html.render_html(data, os.path.join(job_dir, 'index.html'), cache_dir)
+        generate_latex.render_latex(data, os.path.join(job_dir, 'cv.tex'), cache_dir)
+        if pdf:
+            compile_pdf(os.path.join(job_dir, 'cv.tex'), build_dir=os.path.join(job_dir, 'latex'),
+                        format_dir=FORMAT_DIR)
+        error = None
+    except (SchemaError, OSError) as known_error:
+        error = str(known_error)
+    except Exception:
+        error = traceback.format_exc()
+    return {'name': name, 'seconds': time.perf_counter() - started, 'error': error}
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+def render_all(jobs, output_dir, workers=None, incremental=False, pdf=False):
+    """Render all jobs across a process pool and return their results"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_job, name, path, output_dir, incremental, pdf) for name, path in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            if result['error']:
+                print(f'FAILED {result["name"]}:\n{result["error"]}', file=sys.stderr)
+            results.append(result)
+    return results
+
+def summarize(results, wall_seconds):
+    """Throughput and latency summary of a batch run"""
+    times = [r['seconds'] for r in results if not r['error']]
+    return {
+        'jobs': len(results),
+        'succeeded': len(times),
+        'failed': len(results) - len(times),
+        'wallSeconds': round(wall_seconds, 3),
+        'cvsPerSecond': round(len(times) / wall_seconds, 2) if wall_seconds else 0.0,
+        'p50Ms': round(percentile(times, 0.50) * 1000, 2),
+        'p99Ms': round(percentile(times, 0.99) * 1000, 2),
+    }
+
+def main(argv=None):
+    """Main function to render a batch of CVs"""
+    parser = argparse.ArgumentParser(description='Render many CVs in parallel')
+    parser.add_argument('source', help='directory of CV JSON files, or a JSON manifest listing them')
+    parser.add_argument('-o', '--output-dir', default='build/cvs', help='output root (default: %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--incremental', action='store_true', help='keep a section cache in every job directory')
+    parser.add_argument('--pdf', action='store_true',
+                        help=f'compile every cv.tex against a shared precompiled preamble (cached in {FORMAT_DIR})')
+    parser.add_argument('--summary', help='also write the summary as JSON to this file')
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_jobs(args.source)
+    except (OSError, ValueError) as error:
+        sys.exit(str(error))
+    print(f'Rendering {len(jobs)} CVs...')
+
+    started = time.perf_counter()
+    results = render_all(jobs, args.output_dir, args.jobs, args.incremental, args.pdf)
+    summary = summarize(results, time.perf_counter() - started)
+
+    print(f'Rendered {summary["succeeded"]}/{summary["jobs"]} CVs in {summary["wallSeconds"]}s '
+          f'({summary["cvsPerSecond"]} CVs/sec, p50 {summary["p50Ms"]} ms, p99 {summary["p99Ms"]} ms)')
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'jobs': results}, f, indent=2)
+    return 1 if summary['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the shared escapers against the previous chained-replace versions
+Run from the repository root: python benchmarks/bench_escaping.py
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import escaping
+
+def legacy_escape_latex(text):
+    """escape_latex as it was before escaping.py (ten chained passes)"""
+    if not text:
+        return ''
+    text = str(text).replace('∼', '~').replace('–', '-').replace('—', '--')
+    text = text.replace('\\', '\\textbackslash{}')
+    text = text.replace('&', '\\&')
+    text = text.replace('%', '\\%')
+    text = text.replace('$', '\\$')
+    text = text.replace('#', '\\#')
+    text = text.replace('^', '\\textasciicircum{}')
+    text = text.replace('_', '\\_')
+    text = text.replace('{', '\\{')
+    text = text.replace('}', '\\}')
+    text = text.replace('~', '\\textasciitilde{}')
+    return text
+
+def legacy_abbreviate_months(text):
+    """Month abbreviation as it was before escaping.py (twelve passes)"""
+    for full, abbrev in escaping.MONTH_ABBREVIATIONS.items():
+        text = text.replace(full, abbrev)
+    return text
+
+def legacy_escape_html(text):
+    """escape_html as it was before escaping.py"""
+    if not text:
+        return ''
+    return escape(str(text))
+
+WORDS = ('University', 'of', 'Crete', 'Computer', 'Science', 'Department', 'ICS-FORTH',
+         'Information', 'Systems', 'Laboratory', 'Knowledge', 'Graph', 'Zervos', 'research')
+SPECIALS = ('&', '%', '$', '#', '_', '~', '–', '<', '>', '"')
+MONTHS = tuple(escaping.MONTH_ABBREVIATIONS)
+
+def synthetic_strings(count, distinct, special_ratio, seed=0):
+    """Strings resembling CV fields; only `distinct` of them are unique"""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(4, 40))]
+        for i in range(len(words)):
+            if rng.random() < special_ratio:
+                words[i] += rng.choice(SPECIALS)
+        if rng.random() < 0.3:
+            words.insert(0, f'{rng.choice(MONTHS)} {rng.randint(1990, 2030)}')
+        pool.append(' '.join(words))
+    return [rng.choice(pool) for _ in range(count)]
+
+def throughput(function, strings, repeat):
+    """Best-of-repeat MB/s of applying function to every string"""
+    size = sum(len(s) for s in strings) / 1e6
+    best = float('inf')
+    for _ in range(repeat):
+        escaping.clear_caches()
+        started = time.perf_counter()
+        for s in strings:
+            function(s)
+        best = min(best, time.perf_counter() - started)
+    return size / best
+
+def main(argv=None):
+    """Run the escaping micro-benchmark and print a table"""
+    parser = argparse.ArgumentParser(description='Benchmark escaping.py against the legacy escapers')
+    parser.add_argument('--count', type=int, default=200000, help='strings per run (default: %(default)s)')
+    parser.add_argument('--distinct', type=int, default=2000, help='unique strings among them (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, best is kept (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    cases = [
+        ('latex', legacy_escape_latex, escaping.escape_latex.__wrapped__, escaping.escape_latex),
+        ('months', legacy_abbreviate_months, escaping.abbreviate_months.__wrapped__, escaping.abbreviate_months),
+        ('html', legacy_escape_html, escaping.escape_html.__wrapped__, escaping.escape_html),
+    ]
+    print(f'{args.count} strings, {args.distinct} distinct; throughput in MB/s')
+    print(f'{"escaper":<8} {"specials":>8} {"legacy":>10} {"current":>10} {"memoized":>10}')
+    for special_ratio in (0.02, 0.3):
+        strings = synthetic_strings(args.count, args.distinct, special_ratio)
+        for name, legacy, current, memoized in cases:
+            row = [throughput(f, strings, args.repeat) for f in (legacy, current, memoized)]
+            print(f'{name:<8} {special_ratio:>8.0%} ' + ' '.join(f'{value:>10.1f}' for value in row))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark of both renderers on synthetic CVs from 10 to 100k entries
+Times every section function and full main() runs, records peak memory
+and writes the results as JSON for plotting scaling curves
+Run from the repository root: python benchmarks/bench_scaling.py -o bench-scaling.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import authors
+import dates
+import escaping
+import generate_html
+import generate_latex
+import linker
+from cv_loader import snapshot_path
+from synthetic import make_cv
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+SUPERLINEAR_EXPONENT = 1.2
+
+def html_sections():
+    """(name, section) pairs of the HTML generator"""
+    return [(name, section) for name, section, _keys in generate_html.SECTIONS]
+
+def latex_sections():
+    """(name, section) pairs of the LaTeX generator"""
+    return [('header', lambda data: [generate_latex.generate_header(data)])] + [
+        (name, section) for name, section, _keys in generate_latex.SECTIONS]
+
+def clear_caches(data_path=None):
+    """Drop every memoized result, and the parsed snapshot of data_path, before a cold run"""
+    for module in (escaping, dates, authors, linker):
+        module.clear_caches()
+    if data_path is not None:
+        with contextlib.suppress(OSError):
+            os.remove(snapshot_path(data_path))
+
+def best_time(function, repeat, data_path=None):
+    """Best wall time of repeat cold runs (memoized results and the data snapshot cleared)"""
+    best = float('inf')
+    for _ in range(repeat):
+        clear_caches(data_path)
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def peak_memory(function, data_path=None):
+    """Peak traced allocation of one cold run, in bytes"""
+    clear_caches(data_path)
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_generator(label, sections, module, data_path, data, repeat):
+    """Time each section and a full main() run of one generator"""
+    timings = {name: best_time(lambda: ''.join(section(data)), repeat) for name, section in sections}
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'out')
+        argv = ['--data', data_path, '--output', output]
+
+        def run_main():
+            with contextlib.redirect_stdout(io.StringIO()):
+                module.main(argv)
+
+        total = best_time(run_main, repeat, data_path)
+        peak = peak_memory(run_main, data_path)
+        size = os.path.getsize(output)
+    print(f'  {label:<6} main {total * 1000:10.1f} ms   peak {peak / 1e6:8.1f} MB   output {size / 1e6:8.2f} MB')
+    return {'sections': timings, 'mainSeconds': total, 'peakBytes': peak, 'outputBytes': size}
+
+def scaling_exponents(results, label):
+    """Log-log slope of each section's time between consecutive sizes"""
+    exponents = {}
+    for previous, current in zip(results, results[1:]):
+        ratio = math.log(current['entries'] / previous['entries'])
+        for name, seconds in current[label]['sections'].items():
+            before = previous[label]['sections'][name]
+            if before > 0 and seconds > 0:
+                exponents.setdefault(name, []).append(round(math.log(seconds / before) / ratio, 2))
+    return exponents
+
+def main(argv=None):
+    """Run the scaling benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark how both renderers scale with CV size')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated entry counts (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, best is kept (default: %(default)s)')
+    parser.add_argument('-o', '--output', default='bench-scaling.json', help='results file (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for entries in (int(size) for size in args.sizes.split(',')):
+            data = make_cv(entries)
+            data_path = os.path.join(tmp, f'cv-{entries}.json')
+            with open(data_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            print(f'{entries} entries ({os.path.getsize(data_path) / 1e6:.2f} MB of JSON)')
+            results.append({
+                'entries': entries,
+                'jsonBytes': os.path.getsize(data_path),
+                'html': bench_generator('html', html_sections(), generate_html, data_path, data, args.repeat),
+                'latex': bench_generator('latex', latex_sections(), generate_latex, data_path, data, args.repeat),
+            })
+
+    report = {'python': sys.version.split()[0], 'results': results, 'exponents': {}}
+    for label in ('html', 'latex'):
+        report['exponents'][label] = exponents = scaling_exponents(results, label)
+        for name, slopes in exponents.items():
+            if slopes and max(slopes[-2:]) > SUPERLINEAR_EXPONENT:
+                print(f'super-linear: {label} {name} (exponents {slopes})')
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f'Results written to {args.output}')
+
+if __name__ == '__main__':
+    main()
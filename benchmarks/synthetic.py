@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Synthetic CV data following the cv-data.json schema, at any scale
+Run from the repository root: python benchmarks/synthetic.py 10000 -o /tmp/cv-10000.json
+"""
+
+import argparse
+import json
+import os
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REAL_DATA = os.path.join(ROOT, 'data', 'cv-data.json')
+
+MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December')
+WORDS = ('semantic', 'knowledge', 'graph', 'data', 'management', 'language', 'model',
+         'retrieval', 'system', 'analysis', 'web', 'ontology', 'learning', 'query',
+         'summarization', 'transcription', 'earthquakes', 'integration', 'FORTH', 'ISL')
+NAMES = ('Yannis Tzitzikas', 'Sophia Sideri', 'Michalis Mountantonakis', 'Pavlos Fafalios',
+         'Yannis Marketakis', 'Iordanis Sapidis', 'Kiki Miniadou', 'Haridimos Kondylakis')
+INSTITUTIONS = ('University of Crete', 'ICS-FORTH', 'INGENIUM', 'EPFL', 'TUIASI, Romania')
+
+# Share of the requested entries that goes to each list in the schema
+WEIGHTS = {
+    'publications': 0.25,
+    'technicalReports': 0.05,
+    'honorsAwards': 0.05,
+    'contests': 0.03,
+    'workExperience': 0.07,
+    'researchProfessional': 0.05,
+    'courseProjects': 0.2,
+    'schoolsSeminars': 0.05,
+    'academicVolunteering': 0.05,
+    'otherVolunteering': 0.05,
+    'references': 0.05,
+    'education': 0.02,
+    'languages': 0.04,
+    'hobbies': 0.04,
+}
+
+def sentence(rng, low=6, high=30):
+    """A random sentence of CV-like words"""
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return ' '.join(words).capitalize() + '.'
+
+def date(rng):
+    """A single month-year date"""
+    return f'{rng.choice(MONTHS)} {rng.randint(2015, 2026)}'
+
+def date_range(rng):
+    """A date range such as 'March 2021 - Present'"""
+    return f'{date(rng)} - {rng.choice(("Present", date(rng)))}'
+
+def authors(rng, name):
+    """An author list that includes the CV owner about half the time"""
+    people = rng.sample(NAMES, rng.randint(2, len(NAMES)))
+    if rng.random() < 0.5:
+        people.insert(rng.randrange(len(people) + 1), name)
+    return ', '.join(people[:-1]) + ' and ' + people[-1]
+
+def dated_entry(rng):
+    """A date/title/institution/description entry"""
+    return {
+        'date': date(rng),
+        'title': sentence(rng, 3, 8),
+        'institution': rng.choice(INSTITUTIONS),
+        'description': sentence(rng),
+    }
+
+def work_entry(rng):
+    """A work experience entry with nested work items or courses"""
+    entry = dict(dated_entry(rng), date=date_range(rng))
+    if rng.random() < 0.3:
+        entry['courses'] = [sentence(rng, 2, 5) for _ in range(rng.randint(1, 6))]
+    else:
+        entry['workItems'] = [
+            sentence(rng) if rng.random() < 0.6 else {
+                'title': sentence(rng, 3, 8),
+                'items': [sentence(rng) for _ in range(rng.randint(1, 5))],
+                'note': sentence(rng, 3, 10),
+            }
+            for _ in range(rng.randint(1, 6))
+        ]
+    return entry
+
+def by_year(rng, items):
+    """Group items under publication years"""
+    grouped = {}
+    for item in items:
+        grouped.setdefault(str(rng.randint(2015, 2026)), []).append(item)
+    return grouped
+
+def make_cv(entries, seed=0):
+    """Build a CV with roughly `entries` list items spread over every section"""
+    rng = random.Random(seed)
+    with open(REAL_DATA, 'r', encoding='utf-8') as f:
+        real = json.load(f)
+    name = real['personal'].get('displayName', 'Valantis Zervos')
+    count = {key: max(1, int(entries * weight)) for key, weight in WEIGHTS.items()}
+
+    publications = []
+    for _ in range(count['publications']):
+        pub = {'authors': authors(rng, name), 'title': sentence(rng, 5, 15),
+               'status': f'Accepted at {rng.choice(WORDS).upper()} {rng.randint(2015, 2026)}'}
+        if rng.random() < 0.5:
+            pub['url'] = f'https://example.org/papers/{rng.getrandbits(32):08x}.pdf'
+        publications.append(pub)
+
+    return {
+        'personal': real['personal'],
+        'shortBio': real['shortBio'],
+        'education': {'entries': [
+            {'title': f'{rng.choice(("BSc", "MSc"))} in Computer Science ({rng.randint(2015, 2022)}–{rng.randint(2023, 2026)})',
+             'school': rng.choice(INSTITUTIONS), 'grade': f'Grade: {rng.randint(6, 10)}/10'}
+            for _ in range(count['education'])
+        ]},
+        'honorsAwards': {
+            'entries': [dated_entry(rng) for _ in range(count['honorsAwards'])],
+            'contests': [dated_entry(rng) for _ in range(count['contests'])],
+        },
+        'publications': {'byYear': by_year(rng, publications)},
+        'technicalReports': {'byYear': by_year(rng, [
+            {'authors': authors(rng, name), 'title': sentence(rng, 5, 15), 'status': f'Delivered, {date(rng)}'}
+            for _ in range(count['technicalReports'])
+        ])},
+        'workExperience': {'entries': [work_entry(rng) for _ in range(count['workExperience'])]},
+        'softwareProjects': {
+            'researchProfessional': [dict(dated_entry(rng), date=date_range(rng)) for _ in range(count['researchProfessional'])],
+            'courseProjects': {
+                'note': sentence(rng, 4, 10),
+                'entries': [dict(dated_entry(rng), date=date_range(rng)) for _ in range(count['courseProjects'])],
+            },
+        },
+        'schoolsSeminars': {'entries': [
+            dict(dated_entry(rng), subtitle=sentence(rng, 2, 5)) for _ in range(count['schoolsSeminars'])
+        ]},
+        'volunteering': {
+            'academic': [dated_entry(rng) for _ in range(count['academicVolunteering'])],
+            'other': {'note': sentence(rng, 4, 10), 'entries': [dated_entry(rng) for _ in range(count['otherVolunteering'])]},
+        },
+        'languages': {'entries': [{'name': rng.choice(WORDS).capitalize(), 'level': rng.choice(('Native', 'C2', 'B2'))}
+                                  for _ in range(count['languages'])]},
+        'hobbies': {'entries': [{'title': rng.choice(WORDS).capitalize(), 'description': sentence(rng)}
+                                for _ in range(count['hobbies'])]},
+        'references': {'entries': [
+            {'name': rng.choice(NAMES), 'email': f'ref{i}@example.org',
+             'positions': [sentence(rng, 3, 8) for _ in range(rng.randint(1, 3))]}
+            for i in range(count['references'])
+        ]},
+        'contact': real['contact'],
+    }
+
+def main(argv=None):
+    """Write a synthetic CV to a file"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic cv-data.json')
+    parser.add_argument('entries', type=int, help='approximate number of list entries')
+    parser.add_argument('-o', '--output', required=True, help='output JSON file')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: %(default)s)')
+    args = parser.parse_args(argv)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(make_cv(args.entries, args.seed), f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
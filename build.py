@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Build index.html, cv.tex and cv.pdf in one go
+Loads the CV once, renders HTML and LaTeX concurrently in worker processes,
+compiles the PDF (incrementally) as soon as cv.tex is ready, and reports the critical path
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import generate_html
+import generate_latex
+from compress import precompress
+from cv_loader import load_cv
+from dates import parse_dates
+from pdf_compile import compile_pdf
+from schema import SchemaError, check_cv
+from section_cache import CACHE_DIR
+
+_data = None
+
+def set_data(data):
+    """Worker initializer: keep the CV data loaded by the parent"""
+    global _data
+    _data = data
+
+def render_html_stage(output_path, cache_dir, bundle=False, images=False, lazy=False, search=False):
+    """Render index.html from the worker's data; returns (start, end) timestamps"""
+    started = time.time()
+    generate_html.render_html(_data, output_path, cache_dir, bundle=bundle, images=images, lazy=lazy, search=search)
+    return started, time.time()
+
+def render_latex_stage(output_path, cache_dir):
+    """Render cv.tex from the worker's data; returns (start, end) timestamps"""
+    started = time.time()
+    generate_latex.render_latex(_data, output_path, cache_dir)
+    return started, time.time()
+
+def critical_path(stages):
+    """Longest chain of dependent stages, as (names, seconds)"""
+    load = stages['load']
+    html = stages['html']
+    latex_chain = ['latex'] + (['pdf'] if 'pdf' in stages else [])
+    latex_end = stages[latex_chain[-1]][1]
+    chain = ['load', 'spawn'] + (['html'] if html[1] >= latex_end else latex_chain)
+    if 'compress' in stages:
+        chain.append('compress')
+    return chain, stages[chain[-1]][1] - load[0]
+
+def print_timeline(stages, origin, failed=()):
+    """Print when each stage ran relative to the start of the build, marking the failed ones"""
+    print('\nStage timeline:')
+    for name, (started, ended) in sorted(stages.items(), key=lambda item: item[1][0]):
+        print(f'  {name:<8} {(started - origin) * 1000:8.1f} -> {(ended - origin) * 1000:8.1f} ms '
+              f'({(ended - started) * 1000:.1f} ms){" FAILED" if name in failed else ""}')
+    names, seconds = critical_path(stages)
+    print(f'Critical path: {" -> ".join(names)} ({seconds * 1000:.1f} ms)')
+
+def build(data_path, html_output, latex_output, cache_dir=None, pdf=True, threads=False, bundle=False, images=False,
+          compress=False, lazy=False, search=False):
+    """Run the whole build and return the stage timestamps
+
+    A failed pdflatex run is marked in the timeline and then raised as
+    RuntimeError (naming its log) once the other stages are done.
+    """
+    origin = time.time()
+    data = check_cv(load_cv(data_path), data_path)
+    parse_dates(data)
+    stages = {'load': (origin, time.time())}
+    pdf_error = None
+
+    if threads:
+        set_data(data)
+        pool = ThreadPoolExecutor(max_workers=2)
+    else:
+        pool = ProcessPoolExecutor(max_workers=2, initializer=set_data, initargs=(data,))
+    with pool:
+        html = pool.submit(render_html_stage, html_output, cache_dir, bundle, images, lazy, search)
+        latex = pool.submit(render_latex_stage, latex_output, cache_dir)
+        pending = {html, latex}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future is latex:
+                    stages['latex'] = latex.result()
+                    print(f'Generated {latex_output}')
+                    if pdf:
+                        started = time.time()
+                        try:
+                            if compile_pdf(latex_output) is not None:
+                                stages['pdf'] = (started, time.time())
+                        except RuntimeError as error:
+                            stages['pdf'] = (started, time.time())
+                            pdf_error = error
+                else:
+                    stages['html'] = html.result()
+                    print(f'Generated {html_output}')
+
+    stages['spawn'] = (stages['load'][1], min(stages['html'][0], stages['latex'][0]))
+    if compress:
+        started = time.time()
+        written, reused = precompress(os.path.dirname(os.path.abspath(html_output)))
+        stages['compress'] = (started, time.time())
+        print(f'Precompressed {written} files ({reused} unchanged)')
+    print_timeline(stages, origin, {'pdf'} if pdf_error is not None else ())
+    if pdf_error is not None:
+        raise pdf_error
+    return stages
+
+def main(argv=None):
+    """Main function to build every output"""
+    parser = argparse.ArgumentParser(description='Build index.html, cv.tex and cv.pdf from cv-data.json')
+    parser.add_argument('--data', default=generate_html.DATA_PATH, help='CV data file (default: %(default)s)')
+    parser.add_argument('--html-output', default=generate_html.OUTPUT_PATH, help='HTML output (default: %(default)s)')
+    parser.add_argument('--latex-output', default=generate_latex.OUTPUT_PATH, help='LaTeX output (default: %(default)s)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='re-render only the sections whose data changed since the last run')
+    parser.add_argument('--no-pdf', action='store_true', help='skip PDF compilation')
+    parser.add_argument('--bundle', action='store_true', help='serve CSS/JS as content-hashed bundles (see assets.py)')
+    parser.add_argument('--images', action='store_true', help='serve resized image variants (see images.py)')
+    parser.add_argument('--lazy', action='store_true', help='load the lower sections on demand (see generate_html.py --lazy)')
+    parser.add_argument('--search', action='store_true', help='add the search box and its index (see search_index.py)')
+    parser.add_argument('--compress', action='store_true',
+                        help='write .gz/.br siblings and the content manifest afterwards (see compress.py)')
+    parser.add_argument('--threads', action='store_true', help='render in threads instead of processes')
+    args = parser.parse_args(argv)
+
+    try:
+        build(args.data, args.html_output, args.latex_output,
+              CACHE_DIR if args.incremental else None, not args.no_pdf, args.threads, args.bundle, args.images,
+              args.compress, args.lazy, args.search)
+    except (SchemaError, RuntimeError) as error:
+        sys.exit(str(error))
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Precompressed siblings and a content manifest for the site's outputs
+Writes deterministic .gz (and .br when the brotli module is installed) next
+to every text output, recompressing only files whose content hash changed,
+and a manifest of hashes, sizes, strong ETags and SRI integrity values for
+the static server and CDN uploads
+"""
+
+import argparse
+import base64
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_PATH = 'asset-manifest.json'
+DEFAULT_PATTERNS = ('*.html', '*.pdf', 'index.js', 'css/*.css', 'js/*.js', 'assets/*.css', 'assets/*.js',
+                    'sections/*.html', 'search-index.json')
+
+def gzip_bytes(data):
+    """Gzip with a zero timestamp and no file name, so equal input gives equal output"""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def brotli_bytes(data):
+    """Brotli at maximum quality (deterministic by construction)"""
+    return brotli.compress(data, quality=11)
+
+ENCODINGS = [('gz', gzip_bytes)] + ([('br', brotli_bytes)] if brotli is not None else [])
+
+def describe(data):
+    """Size, hash, strong ETag and SRI integrity of some bytes"""
+    digest = hashlib.sha256(data).hexdigest()
+    return {
+        'size': len(data),
+        'sha256': digest,
+        'etag': f'"{digest[:32]}"',
+        'integrity': 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii'),
+    }
+
+def load_manifest(path):
+    """Previous manifest entries, or none"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('files', {})
+    except (OSError, ValueError):
+        return {}
+
+def write_atomic(path, data):
+    """Replace path with data in one step"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def file_size(path):
+    """Size of a file, or None if it does not exist"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+def compress_file(site_dir, relative_path, previous):
+    """Manifest entry for one file, recompressing only when its content changed"""
+    path = os.path.join(site_dir, relative_path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    entry = describe(data)
+    entry['encodings'] = {}
+    for suffix, compress in ENCODINGS:
+        old = previous.get('encodings', {}).get(suffix) if previous.get('sha256') == entry['sha256'] else None
+        if old is not None and file_size(f'{path}.{suffix}') == old['size']:
+            entry['encodings'][suffix] = old
+            continue
+        compressed = compress(data)
+        write_atomic(f'{path}.{suffix}', compressed)
+        entry['encodings'][suffix] = describe(compressed)
+    return entry
+
+def precompress(site_dir='.', patterns=DEFAULT_PATTERNS, manifest_path=MANIFEST_PATH):
+    """Compress every matching file under site_dir and write the manifest; returns (written, reused)"""
+    manifest_path = os.path.join(site_dir, manifest_path)
+    previous = load_manifest(manifest_path)
+    files = {}
+    written = reused = 0
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(site_dir, pattern))):
+            relative_path = os.path.relpath(path, site_dir).replace(os.sep, '/')
+            if relative_path in files or not os.path.isfile(path):
+                continue
+            entry = compress_file(site_dir, relative_path, previous.get(relative_path, {}))
+            files[relative_path] = entry
+            if entry['encodings'] == previous.get(relative_path, {}).get('encodings'):
+                reused += 1
+            else:
+                written += 1
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'encodings': [suffix for suffix, _ in ENCODINGS], 'files': files}, f, indent=2, sort_keys=True)
+    return written, reused
+
+def main(argv=None):
+    """Precompress the site's outputs"""
+    parser = argparse.ArgumentParser(description='Write .gz/.br siblings and a content manifest for the site')
+    parser.add_argument('site', nargs='?', default='.', help='site directory (default: %(default)s)')
+    parser.add_argument('--manifest', default=MANIFEST_PATH,
+                        help='manifest path, relative to the site (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        print('brotli module not installed, writing .gz only')
+    written, reused = precompress(args.site, manifest_path=args.manifest)
+    print(f'Compressed {written} files, {reused} unchanged; manifest: {os.path.join(args.site, args.manifest)}')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Shared CV data loader with a pre-parsed snapshot next to the source
+The snapshot is a marshal dump of the parsed JSON, keyed by the source's
+size, mtime and content hash; a stale snapshot falls back to a full parse
+"""
+
+import gc
+import hashlib
+import json
+import marshal
+import os
+
+SNAPSHOT_VERSION = 1
+
+def snapshot_path(path):
+    """Location of the snapshot of a CV data file (hidden, in the same directory)"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f'.{name}.snapshot')
+
+def read_snapshot(path):
+    """Return (header, file) of a snapshot positioned at its data, or (None, None)"""
+    try:
+        f = open(snapshot_path(path), 'rb')
+    except OSError:
+        return None, None
+    try:
+        header = marshal.load(f)
+        if isinstance(header, tuple) and len(header) == 4 and header[0] == SNAPSHOT_VERSION:
+            return header, f
+    except (EOFError, ValueError, TypeError):
+        pass
+    f.close()
+    return None, None
+
+def load_marshal(f):
+    """Unmarshal the rest of f in one read, with cyclic GC paused while the tree is built"""
+    payload = f.read()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return marshal.loads(payload)
+    finally:
+        if enabled:
+            gc.enable()
+
+def write_snapshot(path, stat, digest, data):
+    """Store data as the snapshot of path; failures only cost the next parse"""
+    target = snapshot_path(path)
+    tmp_path = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            marshal.dump((SNAPSHOT_VERSION, stat.st_size, stat.st_mtime_ns, digest), f)
+            marshal.dump(data, f)
+        os.replace(tmp_path, target)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load_cv(path, use_snapshot=True):
+    """Load CV data from a JSON file, reusing its snapshot when it is still fresh"""
+    if not use_snapshot:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    stat = os.stat(path)
+    header, f = read_snapshot(path)
+    if header is not None:
+        with f:
+            if header[1:3] == (stat.st_size, stat.st_mtime_ns):
+                try:
+                    return load_marshal(f)
+                except (EOFError, ValueError, TypeError):
+                    header = None
+
+    with open(path, 'rb') as source:
+        raw = source.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    data = None
+    if header is not None and header[3] == digest:
+        # Same content with a new mtime (touch, checkout): reuse the parsed data
+        _, f = read_snapshot(path)
+        if f is not None:
+            with f:
+                try:
+                    data = load_marshal(f)
+                except (EOFError, ValueError, TypeError):
+                    data = None
+    if data is None:
+        data = json.loads(raw.decode('utf-8'))
+    write_snapshot(path, stat, digest, data)
+    return data
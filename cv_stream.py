@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Streaming ingestion of cv-data.json for very large documents
+The top-level object is read in chunks and decoded one member at a time;
+every section is rendered as soon as the keys it reads have arrived, and
+a key is dropped once no pending section needs it, so peak memory follows
+the largest section instead of the whole file
+Rendered sections are spooled (to a temporary file past a few MB) and
+written out in document order at the end, and only if the whole document
+passed the schema
+"""
+
+import codecs
+import json
+import re
+import tempfile
+
+from dates import parse_dates
+from schema import SchemaError, missing_sections, validate_section
+from section_cache import render_section
+
+CHUNK_SIZE = 1 << 16
+SPOOL_SIZE = 8 << 20
+READ_SIZE = 1 << 20
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+
+class MemberReader:
+    """Incremental reader of the members of a top-level JSON object"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self):
+        """Read more text, at least as much as is buffered (so retries stay linear); False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.position))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def next_char(self):
+        """The next non-whitespace character, or '' at EOF"""
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        """Consume char (after whitespace) or fail"""
+        found = self.next_char()
+        if found != char:
+            raise ValueError(f'expected {char!r}, found {found or "end of file"!r}')
+        self.position += 1
+
+    def decode(self):
+        """Decode the next complete JSON value, reading until it is all buffered"""
+        self.next_char()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number cut by the end of the buffer ("-1." of "-1.5e3") may continue in the next chunk
+            if isinstance(value, (int, float)) and NUMBER_TAIL.fullmatch(self.buffer, end) and self.fill():
+                continue
+            # Drop the decoded text so it is not kept while the value is rendered
+            self.buffer = self.buffer[end:]
+            self.position = 0
+            return value
+
+    def members(self):
+        """Yield (key, value) for each member of the object"""
+        self.expect('{')
+        if self.next_char() == '}':
+            return
+        while True:
+            key = self.decode()
+            if not isinstance(key, str):
+                raise ValueError(f'expected an object key, found {key!r}')
+            self.expect(':')
+            yield key, self.decode()
+            if self.next_char() == '}':
+                return
+            self.expect(',')
+
+def iter_members(path, chunk_size=CHUNK_SIZE):
+    """Yield the top-level (key, value) pairs of a JSON object file, reading it incrementally"""
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from MemberReader(f, chunk_size).members()
+
+class SectionSpool:
+    """Rendered sections kept by position and read back in order"""
+
+    def __init__(self, max_size=SPOOL_SIZE):
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_size)
+        self.spans = {}
+
+    def write(self, index, fragments):
+        """Store the fragments of the rendered section at position index"""
+        start = self.file.tell()
+        for fragment in fragments:
+            self.file.write(fragment.encode('utf-8'))
+        self.spans[index] = (start, self.file.tell() - start)
+
+    def read(self, index):
+        """Yield the text of the section at position index in blocks"""
+        offset, size = self.spans[index]
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while size:
+            self.file.seek(offset)
+            block = self.file.read(min(size, READ_SIZE))
+            offset += len(block)
+            size -= len(block)
+            yield decoder.decode(block, final=not size)
+        self.file.seek(0, 2)
+
+    def sections(self):
+        """Yield each section, in index order, as an iterator over its text"""
+        for index in sorted(self.spans):
+            yield self.read(index)
+
+    def close(self):
+        """Discard the spooled sections"""
+        self.file.close()
+
+def render_streaming(path, sections, keep=(), cache=None, profiler=None, wrap=None, chunk_size=CHUNK_SIZE):
+    """Render a (name, section, keys) table from a streamed document
+
+    Returns (spool, kept): the rendered sections in table order and the
+    data of the keep keys. wrap(name, text), if given, post-processes each
+    rendered section. Raises SchemaError listing every problem of the whole
+    document; nothing is returned for a document with errors.
+    """
+    pending = list(enumerate(sections))
+    users = {}
+    for _index, (_name, _section, keys) in pending:
+        for key in keys:
+            users[key] = users.get(key, 0) + 1
+
+    data = {}
+    seen = []
+    errors = []
+    spool = SectionSpool()
+    try:
+        for key, value in iter_members(path, chunk_size):
+            seen.append(key)
+            errors += validate_section(key, value)
+            if errors or (key not in users and key not in keep):
+                continue
+            parse_dates(value)
+            data[key] = value
+            ready = [item for item in pending if all(k in data for k in item[1][2])]
+            for item in ready:
+                index, (name, section, keys) = item
+                pending.remove(item)
+                fragments = render_section(cache, name, section, keys, data, profiler)
+                spool.write(index, [wrap(name, ''.join(fragments))] if wrap else fragments)
+                for used in keys:
+                    users[used] -= 1
+                    if not users[used] and used not in keep:
+                        del data[used]
+        errors += missing_sections(seen)
+        if errors:
+            raise SchemaError(path, errors)
+    except BaseException:
+        spool.close()
+        raise
+    return spool, data
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Structured dates for the HTML and LaTeX generators
+Every free-form date string ("July 2023 - Present", "9 - 14 Feb 2025",
+"2026, 2025, 2024") is parsed once into start/end points and its display
+forms, and memoized, since the generators, the sorter and the filters all
+ask for the same strings
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from escaping import CACHE_SIZE, MONTH_ABBREVIATIONS, abbreviate_months
+
+# year, month (0 = unknown), day (0 = unknown); compares chronologically
+Point = namedtuple('Point', 'year month day')
+# text: as written; long: for the page; short: months abbreviated, for the CV
+ParsedDate = namedtuple('ParsedDate', 'text start end long short')
+
+PRESENT = Point(9999, 12, 31)
+UNKNOWN = Point(0, 0, 0)
+MONTHS = {name.lower(): number for number, name in enumerate(MONTH_ABBREVIATIONS, 1)}
+MONTHS.update({abbr.lower(): MONTHS[name.lower()] for name, abbr in MONTH_ABBREVIATIONS.items()})
+MONTHS['sept'] = 9
+WORD = re.compile(r'[A-Za-z]+|\d+')
+RANGE_SEPARATOR = re.compile(r'\s*[-–—]\s*')
+
+def parse_point(text):
+    """[year, month, day] of one side of a range (None for missing parts), or PRESENT"""
+    year = month = day = None
+    for word in WORD.findall(text):
+        if word.isdigit():
+            if len(word) == 4:
+                year = int(word)
+            elif len(word) <= 2:
+                day = int(word)
+        elif word.lower() == 'present':
+            return PRESENT
+        elif word.lower() in MONTHS:
+            month = MONTHS[word.lower()]
+    return [year, month, day]
+
+def parse_range(text):
+    """(start, end) Points of a single date or range; the start inherits a missing month/year"""
+    sides = [parse_point(side) for side in RANGE_SEPARATOR.split(text)]
+    points = []
+    following = None
+    for side in reversed(sides):
+        if side is not PRESENT and following is not None and following is not PRESENT:
+            if side[1] is None and side[2] is not None:
+                side[1] = following.month
+            if side[0] is None:
+                side[0] = following.year
+        point = side if side is PRESENT else Point(side[0] or 0, side[1] or 0, side[2] or 0)
+        points.append(point)
+        following = point
+    points = [point for point in reversed(points) if point.year]
+    if not points:
+        return UNKNOWN, UNKNOWN
+    return points[0], points[-1]
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(text):
+    """Parse a date string once; lists ("2025, 2024") span their earliest to latest entry"""
+    text = text or ''
+    spans = [parse_range(part) for part in text.split(',')]
+    spans = [span for span in spans if span[0] != UNKNOWN] or [(UNKNOWN, UNKNOWN)]
+    start = min(span[0] for span in spans)
+    end = max(span[1] for span in spans)
+    return ParsedDate(text, start, end, text, abbreviate_months(text))
+
+def clear_caches():
+    """Drop all memoized results"""
+    parse_date.cache_clear()
+
+def long_date(text):
+    """Date as shown on the page"""
+    return parse_date(text).long
+
+def short_date(text):
+    """Date with abbreviated months, as shown in the CV"""
+    return parse_date(text).short
+
+def start_year(text, default=None):
+    """Earliest year of a date (or of any text containing one)"""
+    year = parse_date(text).start.year
+    return year if year else default
+
+def year_range(text, default=None):
+    """'2021-2025' from a date, or default if it does not span two years"""
+    parsed = parse_date(text)
+    if not parsed.start.year or parsed.end in (PRESENT, parsed.start) or parsed.end.year == parsed.start.year:
+        return default
+    return f'{parsed.start.year}-{parsed.end.year}'
+
+def sort_key(text):
+    """Chronological key: by end (ongoing last), then by start"""
+    parsed = parse_date(text)
+    return parsed.end, parsed.start
+
+def sort_by_date(entries, field='date', reverse=True):
+    """Entries ordered by their date field, most recent first by default"""
+    return sorted(entries, key=lambda entry: sort_key(entry.get(field, '')), reverse=reverse)
+
+def filter_by_date(entries, since=None, until=None, field='date'):
+    """Entries whose date overlaps the years [since, until]; undated entries are kept"""
+    kept = []
+    for entry in entries:
+        parsed = parse_date(entry.get(field, ''))
+        if parsed.start == UNKNOWN:
+            kept.append(entry)
+        elif (since is None or parsed.end.year >= since) and (until is None or parsed.start.year <= until):
+            kept.append(entry)
+    return kept
+
+def parse_dates(data, field='date'):
+    """Parse every date field of the CV data up front; returns how many distinct dates there are
+
+    The parse_date cache grows to hold all of them (and CACHE_SIZE more for
+    titles and year keys), so none is evicted and parsed again while the
+    document is rendered.
+    """
+    global parse_date
+    found = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if isinstance(value.get(field), str):
+                found.add(value[field])
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    needed = len(found) + CACHE_SIZE
+    if parse_date.cache_info().maxsize < needed:
+        parse_date = lru_cache(maxsize=needed)(parse_date.__wrapped__)
+    for text in found:
+        parse_date(text)
+    return len(found)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Shared escaping for the HTML and LaTeX generators
+Every escaper is memoized, since the same institution names, author lists
+and dates repeat across entries; LaTeX escaping runs one C-level
+str.replace per special character, month names are replaced in one regex
+scan
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+
+CACHE_SIZE = 1 << 14
+
+LATEX_ESCAPES = {
+    '\\': '\\textbackslash{}',
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '^': '\\textasciicircum{}',
+    '_': '\\_',
+    '{': '\\{',
+    '}': '\\}',
+    '~': '\\textasciitilde{}',
+    '∼': '\\textasciitilde{}',
+    '–': '-',
+    '—': '--',
+}
+
+MONTH_ABBREVIATIONS = {
+    'January': 'Jan', 'February': 'Feb', 'March': 'Mar', 'April': 'Apr',
+    'May': 'May', 'June': 'Jun', 'July': 'Jul', 'August': 'Aug',
+    'September': 'Sep', 'October': 'Oct', 'November': 'Nov', 'December': 'Dec'
+}
+
+# LATEX_ESCAPES but the backslash, braces first so the braces of
+# \textasciicircum{} and \textasciitilde{} are not escaped again
+LATEX_STEPS = sorted(((char, escaped) for char, escaped in LATEX_ESCAPES.items() if char != '\\'),
+                     key=lambda step: step[0] not in '{}')
+
+def compile_replacer(mapping):
+    """Build a function replacing every key of mapping in one scan of the text"""
+    keys = sorted(mapping, key=len, reverse=True)
+    pattern = re.compile('|'.join(re.escape(key) for key in keys))
+    lookup = mapping.__getitem__
+    return lambda text: pattern.sub(lambda match: lookup(match.group()), text)
+
+def _replace_latex(text):
+    """Apply LATEX_ESCAPES; the text is split on backslashes first, so the ones the escapes insert stay"""
+    if '\\' in text:
+        return LATEX_ESCAPES['\\'].join(map(_replace_latex, text.split('\\')))
+    for char, escaped in LATEX_STEPS:
+        text = text.replace(char, escaped)
+    return text
+
+_replace_months = compile_replacer(MONTH_ABBREVIATIONS)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def escape_html(text):
+    """Escape HTML special characters"""
+    if not text:
+        return ''
+    return escape(str(text))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def escape_latex(text):
+    """Escape LaTeX special characters and fix Unicode issues"""
+    if not text:
+        return ''
+    return _replace_latex(str(text))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def abbreviate_months(text):
+    """Abbreviate full month names (January -> Jan)"""
+    if not text:
+        return ''
+    return _replace_months(text)
+
+def clear_caches():
+    """Drop all memoized results"""
+    escape_html.cache_clear()
+    escape_latex.cache_clear()
+    abbreviate_months.cache_clear()
@@ -4,93 +4,126 @@ Generate complete index.html from cv-data.json
 Simple Python script - no dependencies required
 """
 
-import json
-from html import escape
-
-def escape_html(text):
-    """Escape HTML special characters"""
-    if not text:
-        return ''
-    return escape(str(text))
+import argparse
+import itertools
+import os
+import re
+import sys
+from html import unescape
+
+from assets import asset_slots, build_bundles
+from authors import highlight_html
+from cv_loader import load_cv
+from cv_stream import render_streaming
+from dates import long_date, parse_dates
+from escaping import escape_html
+from images import build_images, picture_html
+from linker import link_html
+from page_template import load_template, render_template
+from schema import SchemaError, check_cv, check_sections
+from search_index import INDEX_PATH, build_index, write_index
+from section_cache import CACHE_DIR, open_cache, render_section
+from section_registry import SHARED_KEYS, SectionRegistry, section_keys, split_names
 
 def clean_latex_artifacts(text):
     """Remove LaTeX commands from text"""
-    import re
     if not text:
         return ''
     text = re.sub(r'\\hyperref\[\]{}', '', text)
     return text
 
-def bold_author_name(text):
-    """Bold 'Valantis Zervos' in author lists"""
-    if not text:
-        return ''
-    text = text.replace('Valantis Zervos', '<b>Valantis Zervos</b>')
-    text = text.replace('&lt;b&gt;Valantis Zervos&lt;/b&gt;', '<b>Valantis Zervos</b>')
-    return text
-
-def load_data():
-    """Load CV data from JSON file"""
-    with open('data/cv-data.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
-
+DATA_PATH = 'data/cv-data.json'
+OUTPUT_PATH = 'index.html'
+PREVIEW_PATH = 'preview.html'
+AVATAR_PATH = 'resources/me.png'
+# Rendered width of .logo (320px/200px tall, width from the aspect ratio) per breakpoint
+AVATAR_SIZES = '(max-width: 768px) 170px, 270px'
+# Sections that stay inline with --lazy; the others become fragment files loaded by navigation.js
+INLINE_SECTIONS = ('education',)
+FRAGMENT_DIR = 'sections'
+SECTION_ID = re.compile(r'<section id="([^"]+)"')
+SECTION_HEADING = re.compile(r'<h2>(.*?)</h2>', re.S)
+HTML_TAG = re.compile(r'<[^>]+>')
+SEARCH_FORM = f'''
+            <form class="cv-search" role="search" data-index="{INDEX_PATH}">
+                <input type="search" class="form-control form-control-sm" placeholder="Search the CV"
+                       aria-label="Search the CV" autocomplete="off">
+                <ul class="cv-search-results list-unstyled" hidden></ul>
+            </form>
+            <script defer src="js/search.js"></script>'''
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'index.html')
+# Sections of the page, in page order; each registers below with the cv-data.json keys it reads
+REGISTRY = SectionRegistry(('short_bio', 'education', 'publications', 'honors_awards', 'work_experience',
+                            'software_projects', 'schools_seminars', 'volunteering', 'languages_hobbies_references',
+                            'contact_me'))
+# Sections placed in their own slot of the page header rather than in <main>
+HEADER_SECTIONS = ('short_bio',)
+
+def load_data(path=DATA_PATH, keys=None):
+    """Load CV data from JSON file (through its parsed snapshot when fresh), validated and dates parsed
+
+    With keys, only those top-level keys are kept, validated and parsed,
+    for partial renders; the file itself is still read (or unmarshalled)
+    whole.
+    """
+    data = load_cv(path)
+    if keys is None:
+        check_cv(data, path)
+    else:
+        data = check_sections({key: data[key] for key in keys if key in data}, keys, path)
+    parse_dates(data)
+    return data
+
+@REGISTRY.register('short_bio', ('shortBio',))
 def generate_short_bio(data):
-    """Generate Short Bio section"""
-    paragraphs = []
-    for p in data['shortBio']['paragraphs']:
-        cleaned = clean_latex_artifacts(p)
-        paragraphs.append(f'<p>{escape_html(cleaned)}</p>')
-    
-    paragraphs_html = '\n        '.join(paragraphs)
-    
-    return f'''<section id="short">
+    """Yield Short Bio section fragments"""
+    yield '''<section id="short">
     <h2>Short Bio</h2>
     <div class="section-content">
-        {paragraphs_html}
+        '''
+    links = data['shortBio'].get('links', [])
+    for idx, p in enumerate(data['shortBio']['paragraphs']):
+        if idx:
+            yield '\n        '
+        cleaned = clean_latex_artifacts(p)
+        yield f'<p>{link_html(cleaned, links, escape_html)}</p>'
+    yield '''
     </div>
 </section>'''
 
+@REGISTRY.register('education', ('education',))
 def generate_education(data):
-    """Generate Education section"""
-    entries = []
-    for entry in data['education']['entries']:
-        html = f'''                <div class="entry">
+    """Yield Education section fragments"""
+    yield '''<section id="education">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="section-content col-12 col-md">
+                <h2><i class="fa-solid fa-graduation-cap"> </i> Studies</h2>
+'''
+    for idx, entry in enumerate(data['education']['entries']):
+        if idx:
+            yield '\n'
+        yield f'''                <div class="entry">
                     <div class="title">{escape_html(entry['title'])}</div>
                     <div class="details">
                         <p class="school">{escape_html(entry['school'])}</p>'''
         if 'grade' in entry:
-            html += f'\n                        <p class="grade">{escape_html(entry["grade"])}</p>'
+            yield f'\n                        <p class="grade">{escape_html(entry["grade"])}</p>'
         if 'note' in entry:
-            html += f'\n                        <p class="note">{escape_html(entry["note"])}</p>'
-        html += '''\n                    </div>
+            yield f'\n                        <p class="note">{escape_html(entry["note"])}</p>'
+        yield '''\n                    </div>
                 </div>'''
-        entries.append(html)
-    
-    entries_html = '\n'.join(entries)
-    return f'''<section id="education">
-    <div class="container-fluid">
-        <div class="row">
-            <div class="section-content col-12 col-md">
-                <h2><i class="fa-solid fa-graduation-cap"> </i> Studies</h2>
-{entries_html}
+    yield '''
             </div>
         </div>
     </div>
 </section>'''
 
-def generate_honors_awards(data):
-    """Generate Honors & Awards section"""
-    html = '''<section id="honorsawards">
-    <div class="container-fluid">
-        <div class="row">
-            <div class="section-content col-12 col-md">
-                <h2><i class="fa-solid fa-award"></i> Honors & Awards</h2>'''
-    
-    entries = []
-    for entry in data['honorsAwards']['entries']:
-        entry_html = f'''                <div class="entry">
+def generate_dated_entry(entry):
+    """Yield fragments for a date/title/institution/description entry"""
+    yield f'''                <div class="entry">
                     <div class="left-col">
-                        <div class="date">{escape_html(entry['date'])}</div>
+                        <div class="date">{escape_html(long_date(entry['date']))}</div>
                     </div>
                     <div class="right-col">
                         <div class="title">
@@ -105,51 +138,42 @@ def generate_honors_awards(data):
                         </div>
                     </div>
                 </div>'''
-        entries.append(entry_html)
-    
-    entries_html = '\n\n'.join(entries)
-    html += f'\n{entries_html}'
-    html += '''\n            </div>
+
+@REGISTRY.register('honors_awards', ('honorsAwards',))
+def generate_honors_awards(data):
+    """Yield Honors & Awards section fragments"""
+    yield '''<section id="honorsawards">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="section-content col-12 col-md">
+                <h2><i class="fa-solid fa-award"></i> Honors & Awards</h2>
+'''
+    for idx, entry in enumerate(data['honorsAwards']['entries']):
+        if idx:
+            yield '\n\n'
+        yield from generate_dated_entry(entry)
+    yield '''\n            </div>
         </div>'''
-    
+
     if 'contests' in data['honorsAwards'] and data['honorsAwards']['contests']:
-        html += '''\n        <div class="row">
+        yield '''\n        <div class="row">
             <div class="section-content col-12 col-md">
-                <h2><i class="fa-solid fa-trophy"></i> Contests</h2>'''
-        
-        contest_entries = []
-        for contest in data['honorsAwards']['contests']:
-            contest_html = f'''                <div class="entry">
-                    <div class="left-col">
-                        <div class="date">{escape_html(contest['date'])}</div>
-                    </div>
-                    <div class="right-col">
-                        <div class="title">
-                            {escape_html(contest['title'])}
-                        </div>
-                        <div class="institution">
-                            {escape_html(contest['institution'])}
-                        </div>
-                        <div class="details">
-                            <p>{escape_html(contest['description'])}
-                            </p>
-                        </div>
-                    </div>
-                </div>'''
-            contest_entries.append(contest_html)
-        
-        contests_html = '\n\n'.join(contest_entries)
-        html += f'\n{contests_html}'
-        html += '''\n            </div>
+                <h2><i class="fa-solid fa-trophy"></i> Contests</h2>
+'''
+        for idx, contest in enumerate(data['honorsAwards']['contests']):
+            if idx:
+                yield '\n\n'
+            yield from generate_dated_entry(contest)
+        yield '''\n            </div>
         </div>'''
-    
-    html += '''\n    </div>
+
+    yield '''\n    </div>
 </section>'''
-    return html
 
+@REGISTRY.register('publications', ('publications', 'technicalReports', 'personal'))
 def generate_publications(data):
-    """Generate Publications section"""
-    html = '''<section id="publicationsresearch">
+    """Yield Publications section fragments"""
+    yield '''<section id="publicationsresearch">
     <div class="container-fluid">
         <div class="row">
             <div class="section-content col-12 col-md">
@@ -157,41 +181,39 @@ def generate_publications(data):
 
     years = sorted(data['publications']['byYear'].keys(), reverse=True)
     for year in years:
-        html += f'\n                <div class="year-section">\n                    <h3>{year}</h3>'
+        yield f'\n                <div class="year-section">\n                    <h3>{year}</h3>'
         for pub in data['publications']['byYear'][year]:
-            authors_escaped = escape_html(pub['authors'])
-            authors_html = bold_author_name(authors_escaped)
+            authors_html = highlight_html(pub['authors'], data.get('personal'), escape_html)
             has_link = 'url' in pub and pub['url']
-            
-            html += '\n                    <div class="entry">\n                        <div class="left-col-rev">\n                            <div class="publication">'
+
+            yield '\n                    <div class="entry">\n                        <div class="left-col-rev">\n                            <div class="publication">'
             if has_link:
-                html += f'\n                                <a target="_blank" href="{escape_html(pub["url"])}">'
-            html += f'\n                                    <div class="paper-authors">{authors_html}</div>\n                                    <div class="paper-title">\n                                        {escape_html(pub["title"])}\n                                    </div>'
+                yield f'\n                                <a target="_blank" href="{escape_html(pub["url"])}">'
+            yield f'\n                                    <div class="paper-authors">{authors_html}</div>\n                                    <div class="paper-title">\n                                        {escape_html(pub["title"])}\n                                    </div>'
             if has_link:
-                html += '\n                                </a>'
-            html += '\n                            </div>\n                        </div>\n                        <div class="right-col-rev">'
+                yield '\n                                </a>'
+            yield '\n                            </div>\n                        </div>\n                        <div class="right-col-rev">'
             if 'status' in pub:
-                html += f'\n                            <div class="status-accepted">\n                                {escape_html(pub["status"])}\n                            </div>'
+                yield f'\n                            <div class="status-accepted">\n                                {escape_html(pub["status"])}\n                            </div>'
             if 'status2' in pub:
-                html += f'\n                            <div class="status-to_submit">\n                                {escape_html(pub["status2"])}\n                            </div>'
+                yield f'\n                            <div class="status-to_submit">\n                                {escape_html(pub["status2"])}\n                            </div>'
             if has_link and 'status' not in pub:
-                html += '\n                            <i class="fa-solid fa-arrow-up-right-from-square"></i>'
-            html += '\n                        </div>\n                    </div>'
-        html += '\n                </div>'
-    
-    html += '''\n            </div>
+                yield '\n                            <i class="fa-solid fa-arrow-up-right-from-square"></i>'
+            yield '\n                        </div>\n                    </div>'
+        yield '\n                </div>'
+
+    yield '''\n            </div>
         </div>
         <div class="row">
             <div class="section-content col-12 col-md">
                 <h2><i class="fa-solid fa-pen-nib"></i> Technical Reports</h2>'''
-    
+
     report_years = sorted(data['technicalReports']['byYear'].keys(), reverse=True)
     for year in report_years:
-        html += f'\n                <div class="year-section">\n                    <h3>{year}</h3>'
+        yield f'\n                <div class="year-section">\n                    <h3>{year}</h3>'
         for report in data['technicalReports']['byYear'][year]:
-            authors_escaped = escape_html(report['authors'])
-            authors_html = bold_author_name(authors_escaped)
-            html += f'''\n                    <div class="entry">
+            authors_html = highlight_html(report['authors'], data.get('personal'), escape_html)
+            yield f'''\n                    <div class="entry">
                         <div class="left-col-rev">
                             <div class="publication">
                                 <div class="paper-authors">{authors_html}</div>
@@ -206,20 +228,28 @@ def generate_publications(data):
                             </div>
                         </div>
                     </div>'''
-        html += '\n                </div>'
-    
-    html += '''\n            </div>
+        yield '\n                </div>'
+
+    yield '''\n            </div>
         </div>
     </div>
 </section>'''
-    return html
 
+@REGISTRY.register('work_experience', ('workExperience',))
 def generate_work_experience(data):
-    """Generate Work Experience section"""
-    entries = []
-    for entry in data['workExperience']['entries']:
-        date_html = escape_html(entry['date'])
-        html = f'''                    <div class="entry">
+    """Yield Work Experience section fragments"""
+    yield '''<section id="workexperience">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="section-content col-12 col-md">
+                <div>
+                    <h2><i class="fa-solid fa-building"></i> Work Experience</h2>
+'''
+    for idx, entry in enumerate(data['workExperience']['entries']):
+        if idx:
+            yield '\n'
+        date_html = escape_html(long_date(entry['date']))
+        yield f'''                    <div class="entry">
                         <div class="left-col">
                             <div class="date">{date_html}</div>
                         </div>
@@ -233,55 +263,37 @@ def generate_work_experience(data):
                             <div class="details">
                                 <p>{escape_html(entry['description'])}'''
         if 'courses' in entry:
-            html += '\n                                    <ul>'
+            yield '\n                                    <ul>'
             for course in entry['courses']:
-                html += f'\n                                        <li>{escape_html(course)}</li>'
-            html += '\n                                    </ul>'
+                yield f'\n                                        <li>{escape_html(course)}</li>'
+            yield '\n                                    </ul>'
         if 'workItems' in entry:
-            html += '\n                                    <ul>'
+            yield '\n                                    <ul>'
             for item in entry['workItems']:
                 if isinstance(item, str):
-                    html += f'\n                                        <li>{escape_html(item)}</li>'
+                    yield f'\n                                        <li>{escape_html(item)}</li>'
                 elif isinstance(item, dict) and 'title' in item:
-                    html += f'\n                                        <li>{escape_html(item["title"])}\n                                            <ul>'
+                    yield f'\n                                        <li>{escape_html(item["title"])}\n                                            <ul>'
                     for sub_item in item.get('items', []):
-                        html += f'\n                                                <li>{escape_html(sub_item)}</li>'
-                    html += f'\n                                            </ul>\n                                            {escape_html(item.get("note", ""))}\n                                        </li>'
-            html += '\n                                    </ul>'
-        html += '''\n                                </p>
+                        yield f'\n                                                <li>{escape_html(sub_item)}</li>'
+                    yield f'\n                                            </ul>\n                                            {escape_html(item.get("note", ""))}\n                                        </li>'
+            yield '\n                                    </ul>'
+        yield '''\n                                </p>
                             </div>
                         </div>
                     </div>'''
-        entries.append(html)
-    
-    entries_html = '\n'.join(entries)
-    return f'''<section id="workexperience">
-    <div class="container-fluid">
-        <div class="row">
-            <div class="section-content col-12 col-md">
-                <div>
-                    <h2><i class="fa-solid fa-building"></i> Work Experience</h2>
-{entries_html}
+    yield '''
                 </div>
             </div>
         </div>
     </div>
 </section>'''
 
-def generate_software_projects(data):
-    """Generate Software Projects section"""
-    html = '''<section id="softwareprojects">
-    <div class="container-fluid">
-        <div class="row">
-            <div class="section-content col-12 col-md">
-                <div>
-                    <h2><i class="fa-solid fa-laptop-code"></i> Research/Professional Software Projects</h2>'''
-    
-    for project in data['softwareProjects']['researchProfessional']:
-        date_html = escape_html(project['date'])
-        html += f'''\n                    <div class="entry">
+def generate_project_entry(project):
+    """Yield fragments for a software project entry"""
+    yield f'''\n                    <div class="entry">
                         <div class="left-col">
-                            <div class="date">{date_html}</div>
+                            <div class="date">{escape_html(long_date(project['date']))}</div>
                         </div>
                         <div class="right-col">
                             <div class="title">
@@ -296,58 +308,62 @@ def generate_software_projects(data):
                             </div>
                         </div>
                     </div>'''
-    
-    html += '''\n                </div>
+
+@REGISTRY.register('software_projects', ('softwareProjects',))
+def generate_software_projects(data):
+    """Yield Software Projects section fragments"""
+    yield '''<section id="softwareprojects">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="section-content col-12 col-md">
+                <div>
+                    <h2><i class="fa-solid fa-laptop-code"></i> Research/Professional Software Projects</h2>'''
+
+    for project in data['softwareProjects']['researchProfessional']:
+        yield from generate_project_entry(project)
+
+    yield '''\n                </div>
             </div>
         </div>
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-pen"></i> Course Projects</h2>'''
-    
+
     if 'courseProjects' in data['softwareProjects']:
-        html += f'\n                    <div class="institution">\n                        {escape_html(data["softwareProjects"]["courseProjects"]["note"])}\n                    </div>'
-        
+        yield f'\n                    <div class="institution">\n                        {escape_html(data["softwareProjects"]["courseProjects"]["note"])}\n                    </div>'
+
         for project in data['softwareProjects']['courseProjects']['entries']:
-            date_html = escape_html(project['date'])
-            html += f'''\n                    <div class="entry">
-                        <div class="left-col">
-                            <div class="date">{date_html}</div>
-                        </div>
-                        <div class="right-col">
-                            <div class="title">
-                                {escape_html(project['title'])}
-                            </div>
-                            <div class="institution">
-                                {escape_html(project['institution'])}
-                            </div>
-                            <div class="details">
-                                <p>{escape_html(project['description'])}
-                                </p>
-                            </div>
-                        </div>
-                    </div>'''
-    
-    html += '''\n                </div>
+            yield from generate_project_entry(project)
+
+    yield '''\n                </div>
             </div>
         </div>
     </div>
 </section>'''
-    return html
 
+@REGISTRY.register('schools_seminars', ('schoolsSeminars',))
 def generate_schools_seminars(data):
-    """Generate Schools & Seminars section"""
-    entries = []
-    for entry in data['schoolsSeminars']['entries']:
-        date_html = escape_html(entry['date'])
-        html = f'''                    <div class="entry">
+    """Yield Schools & Seminars section fragments"""
+    yield '''<section id="schoolsseminars">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="section-content col-12 col-md">
+                <div>
+                    <h2><i class="fa-solid fa-school"></i> Schools</h2>
+'''
+    for idx, entry in enumerate(data['schoolsSeminars']['entries']):
+        if idx:
+            yield '\n'
+        date_html = escape_html(long_date(entry['date']))
+        yield f'''                    <div class="entry">
                         <div class="left-col">
                             <div class="date">{date_html}</div>
                         </div>
                         <div class="right-col">'''
         if 'subtitle' in entry:
-            html += f'\n                            <div class="subtitle">\n                                {escape_html(entry["subtitle"])}\n                            </div>'
-        html += f'''\n                            <div class="title">
+            yield f'\n                            <div class="subtitle">\n                                {escape_html(entry["subtitle"])}\n                            </div>'
+        yield f'''\n                            <div class="title">
                                 {escape_html(entry['title'])}
                             </div>
                             <div class="institution">
@@ -359,40 +375,32 @@ def generate_schools_seminars(data):
                             </div>
                         </div>
                     </div>'''
-        entries.append(html)
-    
-    entries_html = '\n'.join(entries)
-    return f'''<section id="schoolsseminars">
-    <div class="container-fluid">
-        <div class="row">
-            <div class="section-content col-12 col-md">
-                <div>
-                    <h2><i class="fa-solid fa-school"></i> Schools</h2>
-{entries_html}
+    yield '''
                 </div>
             </div>
         </div>
     </div>
 </section>'''
 
+@REGISTRY.register('volunteering', ('volunteering',))
 def generate_volunteering(data):
-    """Generate Volunteering section"""
-    html = '''<section id="volunteering">
+    """Yield Volunteering section fragments"""
+    yield '''<section id="volunteering">
     <div class="container-fluid">
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-person-chalkboard"></i> Academic Volunteering</h2>'''
-    
+
     for entry in data['volunteering']['academic']:
-        html += f'''\n                    <div class="entry">
+        yield f'''\n                    <div class="entry">
                         <div class="left-col">
-                            <div class="date">{escape_html(entry['date'])}</div>
+                            <div class="date">{escape_html(long_date(entry['date']))}</div>
                         </div>
                         <div class="right-col">'''
         if 'subtitle' in entry:
-            html += f'\n                            <div class="subtitle">\n                                {escape_html(entry["subtitle"])}\n                            </div>'
-        html += f'''\n                            <div class="title">
+            yield f'\n                            <div class="subtitle">\n                                {escape_html(entry["subtitle"])}\n                            </div>'
+        yield f'''\n                            <div class="title">
                                 {escape_html(entry['title'])}
                             </div>
                             <div class="institution">
@@ -404,8 +412,8 @@ def generate_volunteering(data):
                             </div>
                         </div>
                     </div>'''
-    
-    html += f'''\n                </div>
+
+    yield f'''\n                </div>
             </div>
             <div class="row">
                 <div class="section-content col-12 col-md">
@@ -414,11 +422,11 @@ def generate_volunteering(data):
                         <div class="institution">
                             {escape_html(data['volunteering']['other']['note'])}
                         </div>'''
-    
+
     for entry in data['volunteering']['other']['entries']:
-        html += f'''\n                        <div class="entry">
+        yield f'''\n                        <div class="entry">
                             <div class="left-col">
-                                <div class="date">{escape_html(entry['date'])}</div>
+                                <div class="date">{escape_html(long_date(entry['date']))}</div>
                             </div>
                             <div class="right-col">
                                 <div class="title">
@@ -433,26 +441,26 @@ def generate_volunteering(data):
                                 </div>
                             </div>
                         </div>'''
-    
-    html += '''\n                    </div>
+
+    yield '''\n                    </div>
                 </div>
             </div>
         </div>
     </div>
 </section>'''
-    return html
 
+@REGISTRY.register('languages_hobbies_references', ('languages', 'hobbies', 'references'))
 def generate_languages_hobbies_references(data):
-    """Generate Languages, Hobbies & References section"""
-    html = '''<section id="languageshobbiesreferences">
+    """Yield Languages, Hobbies & References section fragments"""
+    yield '''<section id="languageshobbiesreferences">
     <div class="container-fluid">
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-language"></i> Languages</h2>'''
-    
+
     for lang in data['languages']['entries']:
-        html += f'''\n                    <div class="entry">
+        yield f'''\n                    <div class="entry">
                         <div class="title">
                             {escape_html(lang['name'])}
                         </div>
@@ -460,17 +468,17 @@ def generate_languages_hobbies_references(data):
                             {escape_html(lang['level'])}
                         </div>
                     </div>'''
-    
-    html += '''\n                </div>
+
+    yield '''\n                </div>
             </div>
         </div>
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-gamepad"></i> Hobbies</h2>'''
-    
+
     for hobby in data['hobbies']['entries']:
-        html += f'''\n                    <div class="entry">
+        yield f'''\n                    <div class="entry">
                         <div class="title">
                             {escape_html(hobby['title'])}
                         </div>
@@ -478,17 +486,17 @@ def generate_languages_hobbies_references(data):
                             {escape_html(hobby['description'])}
                         </div>
                     </div>'''
-    
-    html += '''\n                </div>
+
+    yield '''\n                </div>
             </div>
         </div>
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-square-check"></i> References</h2>'''
-    
+
     for ref in data['references']['entries']:
-        html += f'''\n                    <div class="entry">
+        yield f'''\n                    <div class="entry">
                         <div class="left-col">
                             <div class="title"> {escape_html(ref['name'])}</div>
                             <div class="subtitle"><a target="_blank" href="mailto:{escape_html(ref['email'])}"> {escape_html(ref['email'].replace('@', ' (at) '))} <i class="fa-solid fa-envelope"></i></a></div>
@@ -497,36 +505,36 @@ def generate_languages_hobbies_references(data):
                             <div class="details">
                                 <p>'''
         if len(ref['positions']) == 1:
-            html += f'\n                                        {escape_html(ref["positions"][0])} '
+            yield f'\n                                        {escape_html(ref["positions"][0])} '
         else:
-            html += '\n                                        <ul>'
+            yield '\n                                        <ul>'
             for pos in ref['positions']:
-                html += f'\n                                            <li>{escape_html(pos)}</li>'
-            html += '\n                                        </ul>'
-        html += '''\n                                </p>
+                yield f'\n                                            <li>{escape_html(pos)}</li>'
+            yield '\n                                        </ul>'
+        yield '''\n                                </p>
                             </div>
                         </div>
                     </div>'''
-    
-    html += '''\n                </div>
+
+    yield '''\n                </div>
             </div>
         </div>
     </div>
 </section>'''
-    return html
 
+@REGISTRY.register('contact_me', ('contact',))
 def generate_contact_me(data):
-    """Generate Contact Me section"""
-    html = '''<section id="contactme">
+    """Yield Contact Me section fragments"""
+    yield '''<section id="contactme">
     <div class="container-fluid">
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-envelope"></i> Contact Me</h2>'''
-    
+
     for email in data['contact']['emails']:
         email_display = email['address'].replace('@', ' (at) ')
-        html += f'''\n                    <a target="_blank" href="mailto:{escape_html(email['address'])}">
+        yield f'''\n                    <a target="_blank" href="mailto:{escape_html(email['address'])}">
                         <div class="entry">
                             <div class="title">
                                 {escape_html(email_display)}
@@ -536,17 +544,17 @@ def generate_contact_me(data):
                             </div>
                         </div>
                     </a>'''
-    
-    html += '''\n                </div>
+
+    yield '''\n                </div>
             </div>
         </div>
         <div class="row">
             <div class="section-content col-12 col-md">
                 <div>
                     <h2><i class="fa-solid fa-link"></i> Useful Links</h2>'''
-    
+
     for link in data['contact']['links']:
-        html += f'''\n                    <a target="_blank" href="{escape_html(link['url'])}">
+        yield f'''\n                    <a target="_blank" href="{escape_html(link['url'])}">
                         <div class="entry">
                             <div class="title">
                                 {escape_html(link['name'])}
@@ -556,232 +564,328 @@ def generate_contact_me(data):
                             </div>
                         </div>
                     </a>'''
-    
-    html += '''\n                </div>
-            </div>
-        </div>
-    </div>
-</section>'''
-    return html
 
-def generate_index_html(data):
-    """Generate complete index.html file"""
-    
-    short_bio = generate_short_bio(data)
-    education = generate_education(data)
-    honors_awards = generate_honors_awards(data)
-    publications = generate_publications(data)
-    work_experience = generate_work_experience(data)
-    software_projects = generate_software_projects(data)
-    schools_seminars = generate_schools_seminars(data)
-    volunteering = generate_volunteering(data)
-    languages_hobbies_references = generate_languages_hobbies_references(data)
-    contact_me = generate_contact_me(data)
-    
-    html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta http-equiv="content-type" content="text/html; charset=UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <meta name="Author" content="Valantis Zervos">
-    <meta name="Description" content="Valantis's biography page">
-    <meta name="keywords" lang="en-us" content="valantis, zervos, csd4878, bio, biography">
-
-    <title>Valantis Zervos</title>
-
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
-
-    <link rel="stylesheet" href="css/default.css">
-    <!--    <link rel="stylesheet" href="css/tablet.css">-->
-    <!--    <link rel="stylesheet" href="css/mobile.css">-->
-
-    <script src="js/fb_share.js"></script>
-    <script src="js/open_secret.js"></script>
-    <script src="js/navigation.js"></script>
-    <script src="index.js"></script>
-
-</head>
-<body class="bg-body-secondary">
-<header>
-    <div class="container">
-        <div class="row align-items-center">
-            <div class="col-md-5 text-center mb-4 mb-md-0">
-                <img src="resources/me.png" alt="Valantis Zervos Photo" class="logo img-fluid rounded-circle mb-3">
-                <h1>Valantis Zervos</h1>
-                <h2 class="h5 fw-normal">MSc Student at Computer Science Department, University of Crete</h2>
-                <h2 class="h5 fw-normal">Graduate Research Fellow, Information Systems Laboratory, ICS-FORTH</h2>
-                <h2 class="h5 fw-normal">Member of the INGENIUM Student Board for the University of Crete</h2>
-                <div class="social-icons" aria-label="Quick access social links">
-                    <a class="social-icon" target="_blank" href="https://www.linkedin.com/in/vzervos/" aria-label="LinkedIn">
-                        <i class="fa-brands fa-linkedin"></i>
-                    </a>
-                    <a class="social-icon" target="_blank" href="https://github.com/VZervos" aria-label="GitHub">
-                        <i class="fa-brands fa-github"></i>
-                    </a>
-                    <a class="social-icon" target="_blank" href="https://scholar.google.com/citations?user=NiPG7QIAAAAJ" aria-label="Google Scholar">
-                        <img src="https://upload.wikimedia.org/wikipedia/commons/c/c7/Google_Scholar_logo.svg" alt="Google Scholar">
-                    </a>
-                </div>
+    yield '''\n                </div>
             </div>
-
-            <div class="col-md-7" id="short-bio-container">
-'''
-    html += '                ' + short_bio.replace('\n', '\n                ') + '\n'
-    html += '''            </div>
         </div>
     </div>
-</header>
-
-
-<nav class="navbar navbar-expand-lg enhanced-nav" id="mainNavigation">
-    <div class="container-fluid navBarContent">
-        <!-- Mobile hamburger button -->
-        <button class="navbar-toggler d-lg-none" type="button" data-bs-toggle="collapse" data-bs-target="#navbarNav"
-                aria-controls="navbarNav" aria-expanded="false" aria-label="Toggle navigation">
-            <span class="navbar-toggler-icon"></span>
-        </button>
-
-        <!-- Navigation items -->
-        <div class="navbar-collapse collapse" id="navbarNav">
-            <div class="navbar-nav nav-items-container">
-                <a class="nav-link nav-item" href="#education" data-section="education">
-                    <i class="fa-solid fa-graduation-cap"></i>
-                    <span class="nav-text">Education</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#publicationsresearch" data-section="publicationsresearch">
-                    <i class="fa-solid fa-book"></i>
-                    <span class="nav-text">Publications & Research</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#honorsawards" data-section="honorsawards">
-                    <i class="fa-solid fa-award"></i>
-                    <span class="nav-text">Honors & Awards</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#workexperience" data-section="workexperience">
-                    <i class="fa-solid fa-building"></i>
-                    <span class="nav-text">Work Experience</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#softwareprojects" data-section="softwareprojects">
-                    <i class="fa-solid fa-laptop-code"></i>
-                    <span class="nav-text">Software Projects</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#schoolsseminars" data-section="schoolsseminars">
-                    <i class="fa-solid fa-school"></i>
-                    <span class="nav-text">Schools & Seminars</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#volunteering" data-section="volunteering">
-                    <i class="fa-solid fa-handshake-angle"></i>
-                    <span class="nav-text">Volunteering</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item" href="#languageshobbiesreferences"
-                   data-section="languageshobbiesreferences">
-                    <i class="fa-solid fa-language"></i>
-                    <span class="nav-text">Languages & Hobbies</span>
-                    <div class="nav-indicator"></div>
-                </a>
-                <a class="nav-link nav-item contact-nav" href="#contactme" data-section="contactme">
-                    <i class="fa-solid fa-envelope"></i>
-                    <span class="nav-text">Contact Me</span>
-                    <div class="nav-indicator"></div>
-                </a>
-            </div>
-        </div>
-    </div>
-</nav>
+</section>'''
 
-<main>
-'''
-    html += education + '\n\n'
-    html += publications + '\n\n'
-    html += honors_awards + '\n\n'
-    html += work_experience + '\n\n'
-    html += software_projects + '\n\n'
-    html += schools_seminars + '\n\n'
-    html += volunteering + '\n\n'
-    html += languages_hobbies_references + '\n\n'
-    html += contact_me + '\n\n'
-    html += '''</main>
-
-<footer>
-    <div class="footer-content">
-        <div class="container">
-            <div class="row d-flex justify-content-between align-items-center">
-                <div class="col-12 col-sm-auto text-center text-sm-start">
-                    <div class="col-12 col-sm-auto text-center text-sm-start">
-                        Contact me:
-                    </div>
-                    <div class="col-12 col-sm-auto text-center text-sm-start">
-                        <a target="_blank" href="mailto:zervosvalantis@gmail.com" style="color: white">
-                            zervosvalantis (at) gmail.com
-                        </a>
-                    </div>
-                    <div class="col-12 col-sm-auto text-center text-sm-start">
-                        <a target="_blank" href="mailto:vzervos@csd.uoc.gr" style="color: white">
-                            vzervos (at) csd.uoc.gr
-                        </a>
-                    </div>
-                    <div class="col-12 col-sm-auto text-center text-sm-start">
-                        <a target="_blank" href="mailto:vzervos@ics.forth.gr" style="color: white">
-                            vzervos (at) ics.forth.gr
-                        </a>
-                    </div>
-                </div>
-                <div class="col-12 col-sm-auto text-center">
-                    <p class="copyright">Spyridon Chrysovalantis Zervos <br> Personal Page</p>
-                </div>
-                <div class="col-12 col-sm-auto text-center text-sm-end">
-                    <a target="_blank" href="https://www.linkedin.com/in/vzervos/" target="_blank">
-                        <svg xmlns="http://www.w3.org/2000/svg" width="32" height="32" fill="currentColor"
+# Keys the page itself reads outside its sections (header, footer)
+PAGE_KEYS = ('personal', 'contact')
+
+# The registered sections, in page order
+SECTIONS = REGISTRY.table()
+
+# Navigation bar entries of the main sections: (section, anchor, icon, label, extra class)
+NAV_ITEMS = [
+    ('education', 'education', 'fa-graduation-cap', 'Education', ''),
+    ('publications', 'publicationsresearch', 'fa-book', 'Publications & Research', ''),
+    ('honors_awards', 'honorsawards', 'fa-award', 'Honors & Awards', ''),
+    ('work_experience', 'workexperience', 'fa-building', 'Work Experience', ''),
+    ('software_projects', 'softwareprojects', 'fa-laptop-code', 'Software Projects', ''),
+    ('schools_seminars', 'schoolsseminars', 'fa-school', 'Schools & Seminars', ''),
+    ('volunteering', 'volunteering', 'fa-handshake-angle', 'Volunteering', ''),
+    ('languages_hobbies_references', 'languageshobbiesreferences', 'fa-language', 'Languages & Hobbies', ''),
+    ('contact_me', 'contactme', 'fa-envelope', 'Contact Me', ' contact-nav'),
+]
+
+# Icons for known social links in contact.links, matched by URL
+SOCIAL_ICONS = [
+    {
+        'match': 'linkedin.com',
+        'label': 'LinkedIn',
+        'header': '<i class="fa-brands fa-linkedin"></i>',
+        'footer': '''<svg xmlns="http://www.w3.org/2000/svg" width="32" height="32" fill="currentColor"
                              class="bi bi-linkedin" viewBox="0 0 16 16">
                             <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854zm4.943 12.248V6.169H2.542v7.225zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248S2.4 3.226 2.4 3.934c0 .694.521 1.248 1.327 1.248zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016l.016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225z"/>
-                        </svg>
-                    </a>
-                    <a target="_blank" href="https://github.com/vzervos" target="_blank">
-                        <svg xmlns="http://www.w3.org/2000/svg" width="32" height="32" fill="currentColor"
+                        </svg>''',
+    },
+    {
+        'match': 'github.com',
+        'label': 'GitHub',
+        'header': '<i class="fa-brands fa-github"></i>',
+        'footer': '''<svg xmlns="http://www.w3.org/2000/svg" width="32" height="32" fill="currentColor"
                              class="bi bi-github github-icon" viewBox="0 0 16 16">
                             <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.54 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.13 0 0 .67-.21 2.2.82a7.548 7.548 0 012.01-.27c.68.003 1.36.092 2.01.27 1.53-1.04 2.2-.82 2.2-.82.44 1.11.16 1.93.08 2.13.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>
-                        </svg>
-                    </a>
-                    <a target="_blank" href="https://scholar.google.com/citations?user=NiPG7QIAAAAJ">
-                        <img src="https://upload.wikimedia.org/wikipedia/commons/c/c7/Google_Scholar_logo.svg"
-                             alt="Google Scholar" width="32" height="32">
-                    </a>
-                </div>
-            </div>
-        </div>
-    </div>
-</footer>
+                        </svg>''',
+    },
+    {
+        'match': 'scholar.google',
+        'label': 'Google Scholar',
+        'header': '<img src="https://upload.wikimedia.org/wikipedia/commons/c/c7/Google_Scholar_logo.svg" alt="Google Scholar">',
+        'footer': '''<img src="https://upload.wikimedia.org/wikipedia/commons/c/c7/Google_Scholar_logo.svg"
+                             alt="Google Scholar" width="32" height="32">''',
+    },
+]
+
+def nav_links(sections):
+    """Navigation bar links of the given main sections"""
+    names = [name for name, _section, _keys in sections]
+    items = sorted((item for item in NAV_ITEMS if item[0] in names), key=lambda item: names.index(item[0]))
+    links = []
+    for _name, anchor, icon, label, css_class in items:
+        opening = f'                <a class="nav-link nav-item{css_class}" href="#{anchor}" data-section="{anchor}">'
+        if len(opening) > 120:
+            opening = opening.replace(' data-section=', '\n                   data-section=')
+        links.append(f'''{opening}
+                    <i class="fa-solid {icon}"></i>
+                    <span class="nav-text">{label}</span>
+                    <div class="nav-indicator"></div>
+                </a>''')
+    return '\n'.join(links)
 
-<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"
-        integrity="sha384-YvpcrYf0tY3lHB60NNkmXc5s9fDVZLESaAA55NDzOxhy9GkcIdslK1eN7N6jIeHz"
-        crossorigin="anonymous"></script>
+def indent_fragments(fragments, prefix):
+    """Yield fragments with every line after the first indented by prefix"""
+    newline = '\n' + prefix
+    for fragment in fragments:
+        yield fragment.replace('\n', newline)
 
-</body>
-</html>'''
-    
-    return html
+def social_links(data):
+    """Yield (link, icon) for contact links that have a known social icon"""
+    for link in data['contact']['links']:
+        url = link['url'].lower()
+        icon = next((icon for icon in SOCIAL_ICONS if icon['match'] in url), None)
+        if icon:
+            yield link, icon
+
+def write_if_changed(path, text):
+    """Write text to path unless it already holds exactly that"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def lazy_section(name, html, site_dir):
+    """Write a rendered section to sections/<name>.html and return the placeholder that loads it"""
+    href = f'{FRAGMENT_DIR}/{name}.html'
+    os.makedirs(os.path.join(site_dir, FRAGMENT_DIR), exist_ok=True)
+    write_if_changed(os.path.join(site_dir, href), html + '\n')
+    section_id, title = section_heading(html)
+    # Headings are markup ("Honors & Awards" has a bare &): normalize to text, then escape once
+    title = escape_html(unescape(title)) or name
+    return f'''<section id="{section_id}" class="lazy-section" data-fragment="{href}" aria-busy="true">
+    <noscript><a href="{href}">{title}</a></noscript>
+</section>'''
 
-def main():
+def section_heading(html):
+    """(id, heading text) of a rendered <section>"""
+    heading = SECTION_HEADING.search(html)
+    return SECTION_ID.match(html).group(1), HTML_TAG.sub('', heading.group(1)).strip() if heading else ''
+
+def section_anchors(data):
+    """Page anchor and heading of every data key shown on the page, for search results"""
+    anchors = {}
+    for _name, section, keys in SECTIONS:
+        anchor = section_heading(next(iter(section(data))))
+        anchors.update((key, anchor) for key in keys if key not in SHARED_KEYS)
+    return anchors
+
+def page_slots(data, cache=None, profiler=None, bundles=None, images=None, lazy_dir=None, search=False,
+               sections=None):
+    """Data-driven slot values of the index.html template
+
+    sections (default SECTIONS) selects the sections shown: those in
+    HEADER_SECTIONS fill their own slot (left empty when not selected), the
+    others are the main sections, in the given order, with their navigation
+    links. With lazy_dir, main sections outside INLINE_SECTIONS are written
+    as fragment files under lazy_dir and replaced by placeholders.
+    """
+    sections = SECTIONS if sections is None else sections
+    header = {section.name: section for section in sections if section.name in HEADER_SECTIONS}
+    sections = [section for section in sections if section.name not in HEADER_SECTIONS]
+    personal = data.get('personal', {})
+    full_name = f"{personal.get('firstName', '')} {personal.get('lastName', '')}".strip()
+    name = personal.get('displayName') or full_name
+    headline = personal.get('headline') or personal.get('title', [])
+
+    short_bio = ()
+    if 'short_bio' in header:
+        short_bio = render_section(cache, *header['short_bio'], data, profiler)
+
+    def main_sections():
+        for section_name, section, keys in sections:
+            fragments = render_section(cache, section_name, section, keys, data, profiler)
+            if lazy_dir is not None and section_name not in INLINE_SECTIONS:
+                fragments = [lazy_section(section_name, ''.join(fragments), lazy_dir)]
+            yield from fragments
+            yield '\n\n'
+
+    return {
+        **asset_slots(bundles),
+        'nav': nav_links(sections),
+        'search': SEARCH_FORM if search else '',
+        'name': escape_html(name),
+        'full_name': escape_html(full_name),
+        'description': escape_html(personal.get('description') or f"{name}'s biography page"),
+        'keywords': escape_html(personal.get('keywords') or ', '.join(name.lower().split() + ['bio', 'biography'])),
+        'avatar': picture_html(AVATAR_PATH, f'{name} Photo', images, sizes=AVATAR_SIZES,
+                               css_class='logo img-fluid rounded-circle mb-3', loading='eager',
+                               fetchpriority='high', indent='                '),
+        'headline': '\n'.join(f'                <h2 class="h5 fw-normal">{escape_html(line)}</h2>' for line in headline),
+        'social_icons': '\n'.join(
+            f'''                    <a class="social-icon" target="_blank" href="{escape_html(link['url'])}" aria-label="{icon['label']}">
+                        {icon['header']}
+                    </a>''' for link, icon in social_links(data)),
+        'short_bio': indent_fragments(short_bio, '                '),
+        'main': main_sections(),
+        'footer_emails': '\n'.join(
+            f'''                    <div class="col-12 col-sm-auto text-center text-sm-start">
+                        <a target="_blank" href="mailto:{escape_html(email['address'])}" style="color: white">
+                            {escape_html(email['address'].replace('@', ' (at) '))}
+                        </a>
+                    </div>''' for email in data['contact']['emails']),
+        'footer_icons': '\n'.join(
+            f'''                    <a target="_blank" href="{escape_html(link['url'])}">
+                        {icon['footer']}
+                    </a>''' for link, icon in social_links(data)),
+    }
+
+def iter_index_html(data, cache=None, profiler=None, bundles=None, images=None, lazy_dir=None, search=False,
+                    sections=None):
+    """Yield the complete index.html page fragment by fragment"""
+    template = load_template(TEMPLATE_PATH)
+    slots = page_slots(data, cache, profiler, bundles, images, lazy_dir, search, sections)
+    yield from render_template(template, slots)
+
+def generate_index_html(data):
+    """Generate complete index.html file"""
+    return ''.join(iter_index_html(data))
+
+def write_fragments(path, fragments):
+    """Stream fragments straight into the output file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(fragments)
+
+def render_html(data, output_path=OUTPUT_PATH, cache_dir=None, profiler=None, bundle=False, images=False,
+                lazy=False, search=False, sections=None, cache=None):
+    """Render index.html for already loaded data; the flags add bundles, image variants, lazy sections and search
+
+    An open section cache can be passed instead of cache_dir, to share it
+    between several renders; it is then left for the caller to save.
+    """
+    shared = cache is not None
+    if not shared:
+        cache = open_cache(sys.modules[__name__], 'html', cache_dir) if cache_dir else None
+    site_dir = os.path.dirname(os.path.abspath(output_path))
+    bundles = build_bundles(site_dir) if bundle else None
+    variants = build_images(site_dir) if images else None
+    lazy_dir = site_dir if lazy else None
+    if search:
+        write_index(build_index(data, section_anchors(data), cache_dir), os.path.join(site_dir, INDEX_PATH))
+    write_fragments(output_path, iter_index_html(data, cache, profiler, bundles, variants, lazy_dir, search, sections))
+    if cache is not None and not shared:
+        cache.save()
+    return cache
+
+def render_html_streaming(data_path, output_path=OUTPUT_PATH, cache_dir=None, profiler=None, bundle=False,
+                          images=False, lazy=False, sections=None):
+    """Render index.html while reading the data section by section (see cv_stream.py)
+
+    Only the keys the page header and footer (PAGE_KEYS) and the
+    HEADER_SECTIONS read are kept until the end; the search index needs the
+    whole document and is not available in this mode.
+    """
+    cache = open_cache(sys.modules[__name__], 'html', cache_dir) if cache_dir else None
+    site_dir = os.path.dirname(os.path.abspath(output_path))
+    bundles = build_bundles(site_dir) if bundle else None
+    variants = build_images(site_dir) if images else None
+    wrap = None
+    if lazy:
+        wrap = lambda name, html: html if name in INLINE_SECTIONS else lazy_section(name, html, site_dir)
+    sections = SECTIONS if sections is None else sections
+    main_sections = [section for section in sections if section.name not in HEADER_SECTIONS]
+    keep = section_keys([section for section in sections if section.name in HEADER_SECTIONS], PAGE_KEYS)
+    spool, page_data = render_streaming(data_path, main_sections, keep, cache, profiler, wrap)
+    try:
+        slots = page_slots(page_data, cache, profiler, bundles, variants, sections=sections)
+        slots['main'] = itertools.chain.from_iterable(itertools.chain(section, ['\n\n'])
+                                                      for section in spool.sections())
+        write_fragments(output_path, render_template(load_template(TEMPLATE_PATH), slots))
+    finally:
+        spool.close()
+    if cache is not None:
+        cache.save()
+    return cache
+
+def main(argv=None):
     """Main function to generate complete index.html"""
-    print('Loading CV data...')
-    data = load_data()
-    
-    print('Generating complete index.html...')
-    
-    html = generate_index_html(data)
-    
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    print('Generated index.html successfully!')
+    parser = argparse.ArgumentParser(description='Generate index.html from cv-data.json')
+    parser.add_argument('--data', default=DATA_PATH, help='CV data file (default: %(default)s)')
+    parser.add_argument('--output', help=f'output file (default: {OUTPUT_PATH}, {PREVIEW_PATH} with --sections)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='re-render only the sections whose data changed since the last run')
+    parser.add_argument('--profile', action='store_true',
+                        help='report time, CPU, output size and allocations of every section')
+    parser.add_argument('--bundle', action='store_true',
+                        help='load CSS/JS from minified, content-hashed bundles in assets/ (scripts deferred)')
+    parser.add_argument('--images', action='store_true',
+                        help='serve resources/ images as resized AVIF/WebP/JPEG variants (needs ImageMagick or cwebp)')
+    parser.add_argument('--lazy', action='store_true',
+                        help=f'inline only the first sections and write the rest to {FRAGMENT_DIR}/ for on-demand loading')
+    parser.add_argument('--search', action='store_true',
+                        help=f'add a search box answered from a precomputed {INDEX_PATH}')
+    parser.add_argument('--stream', action='store_true',
+                        help='read the data section by section, for CV files too large to load at once')
+    parser.add_argument('--sections', type=split_names, metavar='NAMES',
+                        help=f'render only these sections (names or data keys, comma-separated) into a preview page; '
+                             f'available: {", ".join(REGISTRY.names())}')
+    parser.add_argument('--watch', action='store_true',
+                        help='rebuild on every change and serve a live preview from memory')
+    parser.add_argument('--port', type=int, default=8000, help='preview server port for --watch (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        import watch
+        watch.serve(args.data, port=args.port)
+        return
+
+    if args.stream and args.search:
+        parser.error('--search needs the whole document and cannot be combined with --stream')
+    if args.sections and args.search:
+        parser.error('--search needs the whole document and cannot be combined with --sections')
+    sections = None
+    if args.sections:
+        try:
+            sections = REGISTRY.select(args.sections)
+        except ValueError as error:
+            parser.error(str(error))
+    output = args.output or (PREVIEW_PATH if sections else OUTPUT_PATH)
+    target = f'{output} with {", ".join(section.name for section in sections)}' if sections else f'complete {output}'
+
+    profiler = None
+    if args.profile:
+        from profiling import SectionProfiler, print_profile
+        profiler = SectionProfiler()
+    cache_dir = CACHE_DIR if args.incremental else None
+    try:
+        if args.stream:
+            print(f'Generating {target} while streaming the CV data...')
+            if profiler is not None:
+                profiler.start()
+            cache = render_html_streaming(args.data, output, cache_dir, profiler,
+                                          args.bundle, args.images, args.lazy, sections)
+        else:
+            print('Loading CV data...')
+            data = load_data(args.data, None if sections is None else section_keys(sections, PAGE_KEYS))
+            print(f'Generating {target}...')
+            if profiler is not None:
+                profiler.start()
+            cache = render_html(data, output, cache_dir, profiler,
+                                args.bundle, args.images, args.lazy, args.search, sections)
+    except SchemaError as error:
+        sys.exit(str(error))
+    if cache is not None:
+        print(f'Sections re-rendered: {cache.misses}, reused from cache: {cache.hits}')
+    
+    print(f'Generated {output} successfully!')
+    if profiler is not None:
+        print_profile(profiler, output)
+        profiler.stop()
 
 if __name__ == '__main__':
     main()
@@ -4,52 +4,46 @@ Generate LaTeX CV from cv-data.json
 Uses ONLY data from JSON - nothing is hardcoded
 """
 
-import json
-import re
-
-def escape_latex(text):
-    """Escape LaTeX special characters and fix Unicode issues"""
-    if not text:
-        return ''
-    text = str(text).replace('∼', '~').replace('–', '-').replace('—', '--')
-    text = text.replace('\\', '\\textbackslash{}')
-    text = text.replace('&', '\\&')
-    text = text.replace('%', '\\%')
-    text = text.replace('$', '\\$')
-    text = text.replace('#', '\\#')
-    text = text.replace('^', '\\textasciicircum{}')
-    text = text.replace('_', '\\_')
-    text = text.replace('{', '\\{')
-    text = text.replace('}', '\\}')
-    text = text.replace('~', '\\textasciitilde{}')
-    return text
+import argparse
+import itertools
+import sys
+
+from authors import highlight_latex
+from cv_loader import load_cv
+from cv_stream import render_streaming
+from dates import parse_dates, short_date, start_year, year_range
+from escaping import escape_latex
+from linker import link_latex
+from pdf_compile import compile_pdf
+from schema import SchemaError, check_cv, check_sections
+from section_cache import CACHE_DIR, open_cache, render_section
+from section_registry import Section, SectionRegistry, section_keys, split_names
+
+DATA_PATH = 'data/cv-data.json'
+OUTPUT_PATH = 'cv.tex'
+PREVIEW_PATH = 'preview.tex'
+# Body sections of the CV; each registers below, in document order, with the cv-data.json keys it reads
+REGISTRY = SectionRegistry()
+
+def load_data(path=DATA_PATH, keys=None):
+    """Load CV data from JSON file (through its parsed snapshot when fresh), validated and dates parsed
+
+    With keys, only those top-level keys are kept, validated and parsed,
+    for partial renders.
+    """
+    data = load_cv(path)
+    if keys is None:
+        check_cv(data, path)
+    else:
+        data = check_sections({key: data[key] for key in keys if key in data}, keys, path)
+    parse_dates(data)
+    return data
 
 def format_date_for_latex(date_str):
-    """Format date string for LaTeX (abbreviate months)"""
-    if not date_str:
-        return ''
-    
-    month_map = {
-        'January': 'Jan', 'February': 'Feb', 'March': 'Mar', 'April': 'Apr',
-        'May': 'May', 'June': 'Jun', 'July': 'Jul', 'August': 'Aug',
-        'September': 'Sep', 'October': 'Oct', 'November': 'Nov', 'December': 'Dec'
-    }
-    
-    formatted = date_str
-    for full, abbrev in month_map.items():
-        formatted = formatted.replace(full, abbrev)
-    
-    return escape_latex(formatted)
-
-def format_date_range(date_str):
-    """Format date range for LaTeX"""
+    """Format a date or date range for LaTeX (abbreviated months)"""
     if not date_str:
         return ''
-    
-    parts = date_str.split(' - ')
-    if len(parts) == 2:
-        return f'{format_date_for_latex(parts[0].strip())} - {format_date_for_latex(parts[1].strip())}'
-    return format_date_for_latex(date_str)
+    return escape_latex(short_date(date_str))
 
 def generate_header(data):
     """Generate LaTeX header with personal data from JSON"""
@@ -113,6 +107,13 @@ def generate_header(data):
 \\usepackage{{hyperref}}
 \\setlength{{\\parskip}}{{0.5em}}
 
+% End of the static preamble (pdf_compile.py --format precompiles everything above)
+\\csname endofdump\\endcsname
+
+% Reproducible PDF: no creation/modification dates and a fixed trailer /ID
+\\ifdefined\\pdfinfoomitdate \\pdfinfoomitdate=1 \\fi
+\\ifdefined\\pdftrailerid \\pdftrailerid{{}}\\fi
+
 % Personal data
 \\name{{{escape_latex(first_name)}}}{{{escape_latex(last_name)}}}
 \\title{{
@@ -133,58 +134,28 @@ def generate_header(data):
 
 '''
 
+@REGISTRY.register('short_bio', ('shortBio',))
 def generate_short_bio(data):
-    """Generate Short Bio section with hyperrefs from JSON"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Short Bio section fragments with hyperrefs from JSON"""
+    yield '''%-------------------------------------------------------------------------------
 % Short Bio
 %-------------------------------------------------------------------------------
 \\label{sec:ShortBio}
 \\section{Short Bio}
 '''
     
-    hyperrefs = [
-        (r'BSc from the same department with a grade of 9\.57/10', 'ED:BSC', 'BSc from the same department with a grade of 9.57/10'),
-        (r'ranking second among the students of my year of admission', 'HA:KARAMITZOU2025', 'ranking second among the students of my year of admission in the school'),
-        (r'technological upgrade of the openABEKT system, commissioned by the National Documentation and Electronic Content Centre of Greece \(EKT\)', 'RPP:SP1', 'technological upgrade of the openABEKT system, commissioned by the National Documentation and Electronic Content Centre of Greece (EKT)'),
-        (r'conducted research on both national and international research projects at the Information Systems Laboratory \(ISL\) of ICS-FORTH', 'sec:Publications', 'conducted research on both national and international research projects at the Information Systems Laboratory (ISL) of ICS-FORTH'),
-        (r'8th nationwide for the HIAS scholarship \(2024\)', 'HA:HIAS2024', '8th nationwide for the HIAS scholarship (2024)'),
-        (r'top 13% of applicants for EPFL worldwide \(2025\)', 'HA:EPFL2025', 'top 13% of applicants for EPFL worldwide (2025)'),
-        (r'distinguished Undergraduate Teaching Assistant position in my department', 'HA:DEPROFOIT', 'distinguished Undergraduate Teaching Assistant position in my department'),
-        (r'a member of the INGENIUM Student Board, representative of the University of Crete', '', 'a member of the INGENIUM Student Board, representative of the University of Crete')
-    ]
-    
+    links = data['shortBio'].get('links', [])
     for idx, para in enumerate(data['shortBio']['paragraphs']):
-        processed = para
-        placeholders = []
-        placeholder_idx = 0
-        
-        for pattern, label, text in hyperrefs:
-            if pattern in processed:
-                placeholder = f'\uE000{placeholder_idx}\uE001'
-                text_escaped = text.replace('%', '\\%')
-                if label:
-                    placeholders.append((placeholder, f'\\hyperref[{label}]{{{text_escaped}}}'))
-                else:
-                    placeholders.append((placeholder, text_escaped))
-                processed = re.sub(pattern, placeholder, processed)
-                placeholder_idx += 1
-        
-        processed = processed.replace('\\hyperref[]{}', '')
-        escaped = escape_latex(processed)
-        
-        for placeholder, cmd in placeholders:
-            escaped = escaped.replace(placeholder, cmd)
-        
+        escaped = link_latex(para.replace('\\hyperref[]{}', ''), links, escape_latex)
         if idx < len(data['shortBio']['paragraphs']) - 1:
-            latex += escaped + ' \\\\\n\n'
+            yield escaped + ' \\\\\n\n'
         else:
-            latex += escaped + ' \\\\ \\\\\n\n'
-    
-    return latex
+            yield escaped + ' \\\\ \\\\\n\n'
 
+@REGISTRY.register('education', ('education',))
 def generate_education(data):
-    """Generate Education section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Education section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Education
 %-------------------------------------------------------------------------------
 \\label{sec:Education}
@@ -194,34 +165,28 @@ def generate_education(data):
     
     for entry in data['education']['entries']:
         if 'MSc' in entry['title']:
-            year_match = re.search(r'(\d{4})', entry['title'])
-            year = year_match.group(1) if year_match else '2025'
-            latex += f'\\label{{ED:MSC}}\n'
-            latex += f'\\cvitem{{MSc Candidate {year}-Present}}{{\n'
-            latex += '  \\textbf{Currently pursuing Master\\\'s Degree in Computer Science}\\newline\n'
-            latex += f'  School: \\textbf{{{escape_latex(entry["school"])}}}\\newline\n'
-            latex += '}\n\n'
+            year = start_year(entry['title'], '2025')
+            yield f'\\label{{ED:MSC}}\n'
+            yield f'\\cvitem{{MSc Candidate {year}-Present}}{{\n'
+            yield '  \\textbf{Currently pursuing Master\\\'s Degree in Computer Science}\\newline\n'
+            yield f'  School: \\textbf{{{escape_latex(entry["school"])}}}\\newline\n'
+            yield '}\n\n'
         elif 'BSc' in entry['title']:
-            year_match = re.search(r'(\d{4})[–-](\d{4})', entry['title'])
-            if year_match:
-                year_range = f'{year_match.group(1)}-{year_match.group(2)}'
-            else:
-                year_range = '2021-2025'
+            years = year_range(entry['title'], '2021-2025')
             
             grade_text = entry.get('grade', '').replace('Grade: ', '').replace(' (Ranked second)', '')
-            latex += f'\\label{{ED:BSC}}\n'
-            latex += f'\\cvitem{{BSc {year_range}}}{{\n'
-            latex += f'  \\textbf{{Bachelor Degree in Computer Science}}\\newline\n'
-            latex += f'  School: \\textbf{{{escape_latex(entry["school"])}}}\\newline\n'
+            yield f'\\label{{ED:BSC}}\n'
+            yield f'\\cvitem{{BSc {years}}}{{\n'
+            yield f'  \\textbf{{Bachelor Degree in Computer Science}}\\newline\n'
+            yield f'  School: \\textbf{{{escape_latex(entry["school"])}}}\\newline\n'
             if grade_text:
-                latex += f'  Grade: \\textbf{{{escape_latex(grade_text)}}} \\hyperref[HA:KARAMITZOU2025] {{(Ranked second)}}\\newline\n'
-            latex += '}\n\n'
-    
-    return latex
+                yield f'  Grade: \\textbf{{{escape_latex(grade_text)}}} \\hyperref[HA:KARAMITZOU2025] {{(Ranked second)}}\\newline\n'
+            yield '}\n\n'
 
+@REGISTRY.register('honors_awards', ('honorsAwards',))
 def generate_honors_awards(data):
-    """Generate Honors and Awards section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Honors and Awards section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Honors and Awards
 %-------------------------------------------------------------------------------
 \\label{sec:HonorsAndAwards}
@@ -244,32 +209,22 @@ def generate_honors_awards(data):
         date = entry['date']
         label = label_map.get(date, f'HA:{date.replace(" ", "")[:15]}')
         
-        date_parts = date.split(' ')
-        month = date_parts[0]
-        year = date_parts[1] if len(date_parts) > 1 else date_parts[-1]
-        
-        if ',' in date:
-            parts = date.split(',')
-            month = parts[0].split(' ')[0]
-            year = f"{parts[0].split(' ')[1]}, {parts[1].strip()}"
-        
-        month_esc = format_date_for_latex(month)
-        year_esc = format_date_for_latex(year)
+        date_esc = format_date_for_latex(date)
         
         title_esc = escape_latex(entry['title'])
         inst_esc = escape_latex(entry['institution'])
         desc_esc = escape_latex(entry['description'])
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{{month_esc} {year_esc}}}\n'
-        latex += '{\n'
-        latex += f'\\textbf{{"{title_esc}"\\newline}}\n'
-        latex += f'Issued by: \\textbf{{{inst_esc}}}\\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{{date_esc}}}\n'
+        yield '{\n'
+        yield f'\\textbf{{"{title_esc}"\\newline}}\n'
+        yield f'Issued by: \\textbf{{{inst_esc}}}\\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
     
     if 'contests' in data['honorsAwards'] and data['honorsAwards']['contests']:
-        latex += '''%-------------------------------------------------------------------------------
+        yield '''%-------------------------------------------------------------------------------
 % Contests
 %-------------------------------------------------------------------------------
 \\label{sec:Contests}
@@ -284,19 +239,18 @@ def generate_honors_awards(data):
             desc_esc = escape_latex(contest['description'])
             
             label_base = contest['title'].replace(' ', '').replace(',', '').replace('(', '').replace(')', '').replace('-', '')[:20]
-            latex += f'\\label{{HA:CONTEST:{label_base}}}\n'
-            latex += f'\\cvitem{{{date_esc}}}\n'
-            latex += '{\n'
-            latex += f'\\textbf{{{title_esc}\\newline}}\n'
-            latex += f'Issued by: \\textbf{{{inst_esc}}}\\newline\n'
-            latex += f'{desc_esc}\n'
-            latex += '}\n\n'
-    
-    return latex
-
+            yield f'\\label{{HA:CONTEST:{label_base}}}\n'
+            yield f'\\cvitem{{{date_esc}}}\n'
+            yield '{\n'
+            yield f'\\textbf{{{title_esc}\\newline}}\n'
+            yield f'Issued by: \\textbf{{{inst_esc}}}\\newline\n'
+            yield f'{desc_esc}\n'
+            yield '}\n\n'
+
+@REGISTRY.register('publications', ('publications', 'personal'))
 def generate_publications(data):
-    """Generate Publications section"""
-    latex = '''\\label{sec:Publications}
+    """Yield Publications section fragments"""
+    yield '''\\label{sec:Publications}
 \\section{Publications}
 
 '''
@@ -310,8 +264,7 @@ def generate_publications(data):
     
     pub_num = len(all_pubs)
     for pub in all_pubs:
-        authors = pub['authors'].replace('Valantis Zervos', '\\textbf{Valantis Zervos}')
-        authors_esc = escape_latex(authors)
+        authors_esc = highlight_latex(pub['authors'], data.get('personal'), escape_latex)
         title_esc = escape_latex(pub['title'])
         
         status = ''
@@ -324,19 +277,18 @@ def generate_publications(data):
         else:
             status = f'({escape_latex(pub["year"])}, {escape_latex(pub.get("status", "under preparation").lower())})'
         
-        latex += f'\\label{{PUB:P{pub_num}}}\n'
-        latex += f'\\cvitem{{P{pub_num}}}\n'
-        latex += f'{{{authors_esc}}},\n'
-        latex += f'{title_esc}\n'
-        latex += f'{status}\n'
-        latex += '}\n\n'
+        yield f'\\label{{PUB:P{pub_num}}}\n'
+        yield f'\\cvitem{{P{pub_num}}}\n'
+        yield f'{{{authors_esc}}},\n'
+        yield f'{title_esc}\n'
+        yield f'{status}\n'
+        yield '}\n\n'
         pub_num -= 1
-    
-    return latex
 
+@REGISTRY.register('technical_reports', ('technicalReports', 'personal'))
 def generate_technical_reports(data):
-    """Generate Technical Reports section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Technical Reports section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Technical Reports
 %-------------------------------------------------------------------------------
 \\label{sec:TechnicalReports}
@@ -348,22 +300,20 @@ def generate_technical_reports(data):
     
     for idx, year in enumerate(report_years):
         for report in data['technicalReports']['byYear'][year]:
-            authors = report['authors'].replace('Valantis Zervos', '\\textbf{Valantis Zervos}')
-            authors_esc = escape_latex(authors)
+            authors_esc = highlight_latex(report['authors'], data.get('personal'), escape_latex)
             title_esc = escape_latex(report['title'])
             status_esc = escape_latex(report['status'].replace('Delivered to FAO-UN, ', 'delivered to FAO, '))
             
-            latex += f'\\label{{TR:TR{idx + 1}}}\n'
-            latex += f'\\cvitem{{TR{idx + 1}}}\n'
-            latex += f'{{{authors_esc}}},\n'
-            latex += f'{title_esc}, {status_esc}\n'
-            latex += '}\n\n'
-    
-    return latex
+            yield f'\\label{{TR:TR{idx + 1}}}\n'
+            yield f'\\cvitem{{TR{idx + 1}}}\n'
+            yield f'{{{authors_esc}}},\n'
+            yield f'{title_esc}, {status_esc}\n'
+            yield '}\n\n'
 
+@REGISTRY.register('software_projects', ('softwareProjects',))
 def generate_software_projects(data):
-    """Generate Software Projects sections"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Software Projects section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Software Projects
 %-------------------------------------------------------------------------------
 \\label{sec:ResearchProfessionalProjects}
@@ -374,22 +324,22 @@ def generate_software_projects(data):
 '''
     
     for idx, project in enumerate(data['softwareProjects']['researchProfessional']):
-        date_range = format_date_range(project['date'])
+        date_range = format_date_for_latex(project['date'])
         title_esc = escape_latex(project['title'])
         inst_esc = escape_latex(project['institution'])
         desc_esc = escape_latex(project['description'])
         
         project_num = len(data['softwareProjects']['researchProfessional']) - idx
-        latex += f'\\label{{RPP:SP{project_num}}}\n'
-        latex += f'\\cvitem{{SP{project_num}}}{{\n'
-        latex += f'\\textbf{{{title_esc}}} \\newline\n'
-        latex += f'Duration: {date_range} \\newline\n'
-        latex += f'Host: {inst_esc} \\newline\n'
-        latex += f'My Role: \\textbf{{Full-Stack Developer}} \\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
-    
-    latex += '''%-------------------------------------------------------------------------------
+        yield f'\\label{{RPP:SP{project_num}}}\n'
+        yield f'\\cvitem{{SP{project_num}}}{{\n'
+        yield f'\\textbf{{{title_esc}}} \\newline\n'
+        yield f'Duration: {date_range} \\newline\n'
+        yield f'Host: {inst_esc} \\newline\n'
+        yield f'My Role: \\textbf{{Full-Stack Developer}} \\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
+    
+    yield '''%-------------------------------------------------------------------------------
 % Course Projects
 %-------------------------------------------------------------------------------
 \\label{sec:CourseProjects}
@@ -403,25 +353,24 @@ def generate_software_projects(data):
     cp_num = len(course_projects)
     
     for project in course_projects:
-        date_range = format_date_range(project['date']).replace(' - ', ' – ')
+        date_range = format_date_for_latex(project['date']).replace(' - ', ' – ')
         title_esc = escape_latex(project['title'])
         inst_esc = escape_latex(project['institution'])
         desc_esc = escape_latex(project['description'])
         
         cp_num_str = str(cp_num)
-        latex += f'\\label{{CP:CP{cp_num_str}}}\n'
-        latex += f'\\cvitem{{\\label{{CP:CP{cp_num_str}}} CP{cp_num_str}}}{{\n'
-        latex += f'\\textbf{{{title_esc}}} \\newline\n'
-        latex += f'Duration: {date_range} \\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
+        yield f'\\label{{CP:CP{cp_num_str}}}\n'
+        yield f'\\cvitem{{\\label{{CP:CP{cp_num_str}}} CP{cp_num_str}}}{{\n'
+        yield f'\\textbf{{{title_esc}}} \\newline\n'
+        yield f'Duration: {date_range} \\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
         cp_num -= 1
-    
-    return latex
 
+@REGISTRY.register('work_experience', ('workExperience',))
 def generate_work_experience(data):
-    """Generate Work Experience section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Work Experience section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Work Experience
 %-------------------------------------------------------------------------------
 \\label{sec:WorkExperience}
@@ -449,30 +398,30 @@ def generate_work_experience(data):
         else:
             title = entry['title']
         
-        date_formatted = format_date_range(entry['date'])
+        date_formatted = format_date_for_latex(entry['date'])
         title_esc = escape_latex(title)
         inst_esc = escape_latex(entry['institution'])
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{{date_formatted}}}\n'
-        latex += '{\n'
-        latex += f'\\textbf{{{title_esc}\\newline}}\n'
-        latex += f'{inst_esc}\\newline\n'
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{{date_formatted}}}\n'
+        yield '{\n'
+        yield f'\\textbf{{{title_esc}\\newline}}\n'
+        yield f'{inst_esc}\\newline\n'
         
         if 'courses' in entry:
             desc_esc = escape_latex(entry['description'])
-            latex += f'{desc_esc}:\n'
-            latex += '\\begin{itemize}\n'
+            yield f'{desc_esc}:\n'
+            yield '\\begin{itemize}\n'
             for course in entry['courses']:
                 course_esc = escape_latex(course).replace('\\textasciitilde{}', '\\(\\sim \\)')
-                latex += f'    \\item {course_esc}\n'
-            latex += '\\end{itemize}\n'
+                yield f'    \\item {course_esc}\n'
+            yield '\\end{itemize}\n'
         elif 'workItems' in entry:
             desc_esc = escape_latex(entry.get('description', ''))
             if desc_esc:
-                latex += f'{desc_esc}\n'
-            latex += 'Indicative work:\n'
-            latex += '\\begin{itemize}\n'
+                yield f'{desc_esc}\n'
+            yield 'Indicative work:\n'
+            yield '\\begin{itemize}\n'
             
             for item in entry['workItems']:
                 if isinstance(item, str):
@@ -483,31 +432,30 @@ def generate_work_experience(data):
                         processed_item = processed_item.replace('November 2023 to September 2024', 'November 2023 to September 2024. [\\hyperref[RPP:SP2]{SP2}, \\hyperref[PUB:P1]{P1}]')
                     if 'RAG' in processed_item and 'LLMs' in processed_item:
                         processed_item = processed_item.replace('RAG) systems.', 'RAG) systems. [\\hyperref[PUB:P2]{P2}]')
-                    latex += f'    \\item {processed_item}\n'
+                    yield f'    \\item {processed_item}\n'
                 elif isinstance(item, dict) and 'title' in item:
-                    latex += f"    \\item {escape_latex(item['title'])}\n"
-                    latex += '    \\begin{itemize}\n'
+                    yield f"    \\item {escape_latex(item['title'])}\n"
+                    yield '    \\begin{itemize}\n'
                     for sub_item in item.get('items', []):
-                        latex += f"        \\item {escape_latex(sub_item)}\n"
-                    latex += '    \\end{itemize}\n'
+                        yield f"        \\item {escape_latex(sub_item)}\n"
+                    yield '    \\end{itemize}\n'
                     if 'note' in item:
                         note_esc = escape_latex(item['note'])
                         if 'November 2023 to September 2024' in note_esc:
                             note_esc = note_esc.replace('November 2023 to September 2024', 'November 2023 to September 2024. [\\hyperref[RPP:SP2]{SP2}, \\hyperref[PUB:P1]{P1}]')
-                        latex += f'    {note_esc}\n'
+                        yield f'    {note_esc}\n'
             
-            latex += '\\end{itemize}\n'
+            yield '\\end{itemize}\n'
         else:
             desc_esc = escape_latex(entry['description'])
-            latex += f'{desc_esc}\n'
+            yield f'{desc_esc}\n'
         
-        latex += '}\n\n'
-    
-    return latex
+        yield '}\n\n'
 
+@REGISTRY.register('schools_seminars', ('schoolsSeminars',))
 def generate_schools_seminars(data):
-    """Generate Schools & Seminars section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Schools & Seminars section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Schools & Seminars
 %-------------------------------------------------------------------------------
 \\label{sec:SchoolsSeminars}
@@ -524,28 +472,26 @@ def generate_schools_seminars(data):
         subtitle = entry.get('subtitle', '')
         label = label_map.get(subtitle, f'SS:{subtitle.replace(" ", "")[:15]}')
         
-        year_match = re.search(r'\d{4}', entry['date'])
-        year = year_match.group(0) if year_match else '2025'
+        year = start_year(entry['date'], '2025')
         
         date_esc = escape_latex(entry['date'])
         subtitle_esc = escape_latex(subtitle) if subtitle else ''
         title_esc = escape_latex(entry['title'])
         desc_esc = escape_latex(entry['description'])
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{{year}}}{{\n'
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{{year}}}{{\n'
         if subtitle_esc:
-            latex += f'\\textbf{{{subtitle_esc} \\newline}}\n'
-        latex += f'\\textbf{{{date_esc}}} \\newline\n'
-        latex += f'{title_esc} \\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
-    
-    return latex
+            yield f'\\textbf{{{subtitle_esc} \\newline}}\n'
+        yield f'\\textbf{{{date_esc}}} \\newline\n'
+        yield f'{title_esc} \\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
 
+@REGISTRY.register('volunteering', ('volunteering',))
 def generate_volunteering(data):
-    """Generate Volunteering sections"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Volunteering section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Academic Volunteering
 %-------------------------------------------------------------------------------
 \\label{sec:AcademicVolunteering}
@@ -577,15 +523,15 @@ def generate_volunteering(data):
         inst_esc = escape_latex(entry['institution'])
         desc_esc = escape_latex(entry['description'])
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{{year}}}\n'
-        latex += '{\n'
-        latex += f'{title_esc} \\newline\n'
-        latex += f'{inst_esc}\\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
-    
-    latex += '''%-------------------------------------------------------------------------------
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{{year}}}\n'
+        yield '{\n'
+        yield f'{title_esc} \\newline\n'
+        yield f'{inst_esc}\\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
+    
+    yield '''%-------------------------------------------------------------------------------
 % Other Volunteering
 %-------------------------------------------------------------------------------
 \\label{sec:OtherVolunteering}
@@ -612,19 +558,18 @@ def generate_volunteering(data):
         inst_esc = escape_latex(entry['institution'])
         desc_esc = escape_latex(entry['description'])
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{{date_esc}}}\n'
-        latex += '{\n'
-        latex += f'{title_esc} \\newline\n'
-        latex += f'{inst_esc} \\newline\n'
-        latex += f'{desc_esc}\n'
-        latex += '}\n\n'
-    
-    return latex
-
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{{date_esc}}}\n'
+        yield '{\n'
+        yield f'{title_esc} \\newline\n'
+        yield f'{inst_esc} \\newline\n'
+        yield f'{desc_esc}\n'
+        yield '}\n\n'
+
+@REGISTRY.register('languages', ('languages',))
 def generate_languages(data):
-    """Generate Languages section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Languages section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Languages
 %-------------------------------------------------------------------------------
 \\label{sec:Languages}
@@ -634,13 +579,12 @@ def generate_languages(data):
     for lang in data['languages']['entries']:
         name_esc = escape_latex(lang['name'])
         level_esc = escape_latex(lang['level'])
-        latex += f'\\cvitem{{\\textbf{{{name_esc}}} }}{{{level_esc}}}\n'
-    
-    return latex
+        yield f'\\cvitem{{\\textbf{{{name_esc}}} }}{{{level_esc}}}\n'
 
+@REGISTRY.register('hobbies', ('hobbies',))
 def generate_hobbies(data):
-    """Generate Hobbies and Interests section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield Hobbies and Interests section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % Hobbies and Interests
 %-------------------------------------------------------------------------------
 \\label{sec:HobbiesInterests}
@@ -650,13 +594,12 @@ def generate_hobbies(data):
     for hobby in data['hobbies']['entries']:
         title_esc = escape_latex(hobby['title'])
         desc_esc = escape_latex(hobby['description'])
-        latex += f'\\cvitem{{\\textbf{{{title_esc}}}}}{{{desc_esc}}}\n'
-    
-    return latex
+        yield f'\\cvitem{{\\textbf{{{title_esc}}}}}{{{desc_esc}}}\n'
 
+@REGISTRY.register('references', ('references',))
 def generate_references(data):
-    """Generate References section"""
-    latex = '''%-------------------------------------------------------------------------------
+    """Yield References section fragments"""
+    yield '''%-------------------------------------------------------------------------------
 % References
 %-------------------------------------------------------------------------------
 \\label{sec:References}
@@ -680,50 +623,130 @@ def generate_references(data):
         email_esc = escape_latex(ref['email'])
         positions = ref['positions']
         
-        latex += f'\\label{{{label}}}\n'
-        latex += f'\\cvitem{{\\textbf{{{name_esc}}}}} {{\n'
+        yield f'\\label{{{label}}}\n'
+        yield f'\\cvitem{{\\textbf{{{name_esc}}}}} {{\n'
         for idx, pos in enumerate(positions):
             pos_esc = escape_latex(pos)
             if idx < len(positions) - 1:
-                latex += f'{pos_esc},\\newline\n'
+                yield f'{pos_esc},\\newline\n'
             else:
-                latex += f'{pos_esc}\\newline\n'
-        latex += f'{email_esc}\n'
-        latex += '}\n\n'
-    
-    return latex
-
-def main():
+                yield f'{pos_esc}\\newline\n'
+        yield f'{email_esc}\n'
+        yield '}\n\n'
+
+# The registered body sections, in document order
+SECTIONS = REGISTRY.table()
+
+def generate_header_fragments(data):
+    """Yield the LaTeX header as a single fragment"""
+    yield generate_header(data)
+
+HEADER_SECTION = Section('header', generate_header_fragments, ('personal', 'contact'))
+
+def iter_cv_latex(data, cache=None, profiler=None, sections=None):
+    """Yield the complete LaTeX CV fragment by fragment; sections defaults to SECTIONS"""
+    yield from render_section(cache, *HEADER_SECTION, data, profiler)
+    for name, section, keys in SECTIONS if sections is None else sections:
+        yield from render_section(cache, name, section, keys, data, profiler)
+    yield '\\end{document}\n'
+
+def write_fragments(path, fragments):
+    """Stream fragments straight into the output file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(fragments)
+
+def render_latex(data, output_path=OUTPUT_PATH, cache_dir=None, profiler=None, sections=None, cache=None):
+    """Render cv.tex for already loaded data, optionally through the section cache
+
+    An open section cache can be passed instead of cache_dir, to share it
+    between several renders; it is then left for the caller to save.
+    """
+    shared = cache is not None
+    if not shared:
+        cache = open_cache(sys.modules[__name__], 'latex', cache_dir) if cache_dir else None
+    write_fragments(output_path, iter_cv_latex(data, cache, profiler, sections))
+    if cache is not None and not shared:
+        cache.save()
+    return cache
+
+def render_latex_streaming(data_path, output_path=OUTPUT_PATH, cache_dir=None, profiler=None, sections=None):
+    """Render cv.tex while reading the data section by section (see cv_stream.py)"""
+    cache = open_cache(sys.modules[__name__], 'latex', cache_dir) if cache_dir else None
+    sections = [HEADER_SECTION] + (SECTIONS if sections is None else sections)
+    spool, _data = render_streaming(data_path, sections, cache=cache, profiler=profiler)
+    try:
+        sections = itertools.chain.from_iterable(spool.sections())
+        write_fragments(output_path, itertools.chain(sections, ['\\end{document}\n']))
+    finally:
+        spool.close()
+    if cache is not None:
+        cache.save()
+    return cache
+
+def main(argv=None):
     """Main function to generate LaTeX CV"""
-    print('Loading CV data...')
-    with open('data/cv-data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print('Generating LaTeX CV...')
-    
-    latex = generate_header(data)
-    latex += generate_short_bio(data)
-    latex += generate_education(data)
-    latex += generate_honors_awards(data)
-    latex += generate_publications(data)
-    latex += generate_technical_reports(data)
-    latex += generate_software_projects(data)
-    latex += generate_work_experience(data)
-    latex += generate_schools_seminars(data)
-    latex += generate_volunteering(data)
-    latex += generate_languages(data)
-    latex += generate_hobbies(data)
-    latex += generate_references(data)
-    latex += '\\end{document}\n'
-    
-    with open('cv.tex', 'w', encoding='utf-8') as f:
-        f.write(latex)
-    
-    print('LaTeX CV generated successfully!')
-    print('Output: cv.tex')
-    print('\nTo compile:')
-    print('   pdflatex cv.tex')
-    print('   (Run twice for proper cross-references)')
+    parser = argparse.ArgumentParser(description='Generate cv.tex from cv-data.json')
+    parser.add_argument('--data', default=DATA_PATH, help='CV data file (default: %(default)s)')
+    parser.add_argument('--output', help=f'output file (default: {OUTPUT_PATH}, {PREVIEW_PATH} with --sections)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='re-render only the sections whose data changed since the last run')
+    parser.add_argument('--profile', action='store_true',
+                        help='report time, CPU, output size and allocations of every section')
+    parser.add_argument('--pdf', action='store_true',
+                        help='compile the PDF too, skipping pdflatex when nothing changed')
+    parser.add_argument('--stream', action='store_true',
+                        help='read the data section by section, for CV files too large to load at once')
+    parser.add_argument('--sections', type=split_names, metavar='NAMES',
+                        help=f'render only the header and these sections (names or data keys, comma-separated) '
+                             f'into a preview; available: {", ".join(REGISTRY.names())}')
+    args = parser.parse_args(argv)
+
+    sections = None
+    if args.sections:
+        try:
+            sections = REGISTRY.select(args.sections)
+        except ValueError as error:
+            parser.error(str(error))
+    output = args.output or (PREVIEW_PATH if sections else OUTPUT_PATH)
+    what = f'LaTeX preview of {", ".join(section.name for section in sections)}' if sections else 'LaTeX CV'
+
+    profiler = None
+    if args.profile:
+        from profiling import SectionProfiler, print_profile
+        profiler = SectionProfiler()
+    cache_dir = CACHE_DIR if args.incremental else None
+    try:
+        if args.stream:
+            print(f'Generating {what} while streaming the CV data...')
+            if profiler is not None:
+                profiler.start()
+            cache = render_latex_streaming(args.data, output, cache_dir, profiler, sections)
+        else:
+            print('Loading CV data...')
+            data = load_data(args.data, None if sections is None else section_keys([HEADER_SECTION] + sections))
+            print(f'Generating {what}...')
+            if profiler is not None:
+                profiler.start()
+            cache = render_latex(data, output, cache_dir, profiler, sections)
+    except SchemaError as error:
+        sys.exit(str(error))
+    if cache is not None:
+        print(f'Sections re-rendered: {cache.misses}, reused from cache: {cache.hits}')
+    
+    print(f'{what} generated successfully!')
+    print(f'Output: {output}')
+    if args.pdf:
+        try:
+            compile_pdf(output)
+        except RuntimeError as error:
+            sys.exit(str(error))
+    else:
+        print('\nTo compile:')
+        print(f'   python pdf_compile.py {output}')
+        print('   (Reruns pdflatex only when the source or its cross-references changed)')
+    if profiler is not None:
+        print_profile(profiler, output)
+        profiler.stop()
 
 if __name__ == '__main__':
     main()
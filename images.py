@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Responsive image variants for the page
+Reads PNG/JPEG dimensions with the standard library, resizes every image in
+resources/ to a few widths as AVIF, WebP and JPEG with whatever converter is
+installed (ImageMagick, cwebp), and renders <picture>/srcset markup
+Variant file names carry the source hash, so an unchanged image is never
+converted twice
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import struct
+import subprocess
+
+from escaping import escape_html
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIR = 'resources'
+VARIANT_DIR = 'resources/variants'
+WIDTHS = (160, 320, 640)
+QUALITY = '80'
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+# Formats in <source> preference order; JPEG is the <img> fallback
+FORMATS = (('avif', 'image/avif'), ('webp', 'image/webp'), ('jpg', 'image/jpeg'))
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def png_size(header):
+    """(width, height) from a PNG IHDR chunk"""
+    return struct.unpack('>II', header[16:24])
+
+def jpeg_size(f):
+    """(width, height) from the first start-of-frame segment of a JPEG"""
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise ValueError('not a baseline/progressive JPEG')
+        if marker[1] in (0x01, 0xD8) or 0xD0 <= marker[1] <= 0xD7:
+            continue
+        length = struct.unpack('>H', f.read(2))[0]
+        if marker[1] in JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>xHH', f.read(5))
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+def image_size(path):
+    """(width, height) of a PNG or JPEG file"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+        if header.startswith(b'\x89PNG\r\n\x1a\n'):
+            return png_size(header)
+        if header.startswith(b'\xff\xd8'):
+            return jpeg_size(f)
+    raise ValueError(f'{path}: unsupported image format')
+
+def converter(extension):
+    """Command template resizing an image into the given format, or None if no tool can"""
+    for tool in ('magick', 'convert'):
+        if shutil.which(tool):
+            return [tool, '{source}', '-resize', '{width}x', '-strip', '-quality', QUALITY, '{target}']
+    if extension == 'webp' and shutil.which('cwebp'):
+        return ['cwebp', '-quiet', '-q', QUALITY, '-resize', '{width}', '0', '{source}', '-o', '{target}']
+    return None
+
+def variant_widths(width):
+    """Target widths for a source image; never upscaled"""
+    return [w for w in WIDTHS if w < width] + [width]
+
+def convert(command, source, target, width):
+    """Run one conversion into target (atomically); False if the tool failed"""
+    tmp_path = f'{os.path.splitext(target)[0]}.tmp{os.path.splitext(target)[1]}'
+    args = [arg.format(source=source, target=tmp_path, width=width) for arg in command]
+    result = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if result.returncode != 0 or not os.path.exists(tmp_path):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, target)
+    return True
+
+def build_image(relative_path, site_dir, root=ROOT):
+    """Convert one image into its variants; returns {'size': (w, h), 'variants': {ext: [(width, href)]}}"""
+    source = os.path.join(root, relative_path)
+    with open(source, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:10]
+    width, height = image_size(source)
+    stem = os.path.splitext(os.path.basename(relative_path))[0]
+    output_dir = os.path.join(site_dir, VARIANT_DIR)
+    commands = {extension: converter(extension) for extension, _mime in FORMATS}
+    variants = {}
+    current = set()
+    if not any(commands.values()):
+        return {'size': (width, height), 'variants': variants}
+
+    os.makedirs(output_dir, exist_ok=True)
+    for extension, command in commands.items():
+        if command is None:
+            continue
+        for target_width in variant_widths(width):
+            filename = f'{stem}-{target_width}.{digest}.{extension}'
+            target = os.path.join(output_dir, filename)
+            if os.path.exists(target) or convert(command, source, target, target_width):
+                variants.setdefault(extension, []).append((target_width, f'{VARIANT_DIR}/{filename}'))
+                current.add(filename)
+
+    stale = re.compile(re.escape(stem) + r'-\d+\.[0-9a-f]{10}\.\w+$')
+    for other in os.listdir(output_dir):
+        if other not in current and stale.match(other):
+            os.remove(os.path.join(output_dir, other))
+    return {'size': (width, height), 'variants': variants}
+
+def build_images(site_dir, root=ROOT):
+    """Variants of every PNG/JPEG in resources/, keyed by site-relative path"""
+    images = {}
+    for name in sorted(os.listdir(os.path.join(root, IMAGE_DIR))):
+        if name.lower().endswith(SOURCE_EXTENSIONS):
+            relative_path = f'{IMAGE_DIR}/{name}'
+            images[relative_path] = build_image(relative_path, site_dir, root)
+    return images
+
+def srcset(variants):
+    """srcset value from (width, href) pairs"""
+    return ', '.join(f'{href} {width}w' for width, href in variants)
+
+def picture_html(src, alt, images=None, root=ROOT, sizes='100vw', css_class='',
+                 loading='lazy', fetchpriority='auto', indent=''):
+    """<picture> (or a plain <img> when there are no variants) with explicit dimensions"""
+    info = (images or {}).get(src)
+    width, height = info['size'] if info else image_size(os.path.join(root, src))
+    variants = info['variants'] if info else {}
+
+    fallback = variants.get('jpg')
+    img = (f'<img src="{src}"'
+           + (f' srcset="{srcset(fallback)}" sizes="{sizes}"' if fallback else '')
+           + f' width="{width}" height="{height}" alt="{escape_html(alt)}"'
+           + (f' class="{css_class}"' if css_class else '')
+           + f' loading="{loading}" fetchpriority="{fetchpriority}" decoding="async">')
+    sources = [f'{indent}    <source type="{mime}" srcset="{srcset(variants[extension])}" sizes="{sizes}">'
+               for extension, mime in FORMATS if extension != 'jpg' and extension in variants]
+    if not sources:
+        return img
+    return '\n'.join(['<picture>', *sources, f'{indent}    {img}', f'{indent}</picture>'])
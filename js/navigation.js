@@ -17,6 +17,7 @@ class EnhancedNavigation {
     init() {
         this.setupEventListeners();
         this.setupScrollSpy();
+        this.setupLazySections();
         this.setupAccessibility();
         this.updateScrollToTopVisibility();
     }
@@ -30,11 +31,23 @@ class EnhancedNavigation {
                 
                 if (targetSection) {
                     e.preventDefault();
-                    this.scrollToSection(targetSection);
+                    this.loadThrough(targetId).then(section => this.scrollToSection(section));
                 }
             });
         });
         
+        // In-page links (e.g. from the short bio) into sections that are not loaded yet
+        document.addEventListener('click', (e) => {
+            const link = e.target.closest('a[href^="#"]');
+            if (link && this.pendingSections && this.pendingSections.size) {
+                const targetId = decodeURIComponent(link.getAttribute('href').substring(1));
+                if (targetId && !document.getElementById(targetId)) {
+                    e.preventDefault();
+                    this.revealTarget(targetId);
+                }
+            }
+        });
+        
         // Scroll to top button
         if (this.scrollToTopBtn) {
             this.scrollToTopBtn.addEventListener('click', () => {
@@ -86,6 +99,102 @@ class EnhancedNavigation {
         });
     }
     
+    setupLazySections() {
+        // Sections written as separate fragments (generate_html.py --lazy), in document order
+        this.pendingSections = new Map();
+        document.querySelectorAll('section[data-fragment]').forEach(section => {
+            this.pendingSections.set(section.id, section);
+        });
+        if (!this.pendingSections.size) {
+            return;
+        }
+        
+        if ('IntersectionObserver' in window) {
+            // Start fetching about a screen before the placeholder scrolls into view
+            this.lazyObserver = new IntersectionObserver((entries) => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        this.loadSection(entry.target.id);
+                    }
+                });
+            }, { root: null, rootMargin: '100% 0px' });
+            this.pendingSections.forEach(section => this.lazyObserver.observe(section));
+        } else {
+            this.loadAllSections();
+        }
+        
+        if (window.location.hash) {
+            this.revealTarget(decodeURIComponent(window.location.hash.substring(1)));
+        }
+    }
+    
+    loadSection(sectionId) {
+        const placeholder = this.pendingSections.get(sectionId);
+        if (!placeholder) {
+            return Promise.resolve(document.getElementById(sectionId));
+        }
+        if (!placeholder.loading) {
+            placeholder.loading = fetch(placeholder.dataset.fragment)
+                .then(response => response.ok ? response.text() : Promise.reject(new Error(response.statusText)))
+                .then(html => {
+                    const template = document.createElement('template');
+                    template.innerHTML = html.trim();
+                    const section = template.content.firstElementChild;
+                    
+                    if (this.lazyObserver) {
+                        this.lazyObserver.unobserve(placeholder);
+                    }
+                    if (this.observer) {
+                        this.observer.unobserve(placeholder);
+                        this.observer.observe(section);
+                    }
+                    section.setAttribute('aria-labelledby', `${sectionId}-heading`);
+                    const heading = section.querySelector('h2');
+                    if (heading) {
+                        heading.id = `${sectionId}-heading`;
+                    }
+                    
+                    placeholder.replaceWith(section);
+                    this.pendingSections.delete(sectionId);
+                    this.sections = document.querySelectorAll('section[id]');
+                    return section;
+                })
+                .catch(error => {
+                    // Leave the placeholder (and its link to the fragment) in place and allow a retry
+                    placeholder.loading = null;
+                    console.error(`❌ Could not load section ${sectionId}:`, error);
+                    return placeholder;
+                });
+        }
+        return placeholder.loading;
+    }
+    
+    loadThrough(sectionId) {
+        // Load a section and every pending section above it, so the scroll target does not move
+        const loads = [];
+        for (const id of this.pendingSections.keys()) {
+            loads.push(this.loadSection(id));
+            if (id === sectionId) {
+                break;
+            }
+        }
+        return Promise.all(loads).then(() => document.getElementById(sectionId));
+    }
+    
+    loadAllSections() {
+        return Promise.all([...this.pendingSections.keys()].map(id => this.loadSection(id)));
+    }
+    
+    revealTarget(targetId) {
+        this.loadAllSections().then(() => {
+            const target = document.getElementById(targetId);
+            if (target) {
+                history.replaceState(null, '', `#${targetId}`);
+                target.scrollIntoView({ behavior: 'smooth' });
+            }
+        });
+    }
+    
     setupAccessibility() {
         // Add ARIA attributes
         this.navItems.forEach(item => {
@@ -0,0 +1,132 @@
+/**
+ * CV Search Box
+ * Answers queries from the precomputed search-index.json (generate_html.py --search):
+ * every query word is matched as a prefix and the results must contain all of them
+ */
+
+class CvSearch {
+    constructor(form) {
+        this.form = form;
+        this.input = form.querySelector('input[type="search"]');
+        this.results = form.querySelector('.cv-search-results');
+        this.index = null;
+        this.loading = null;
+        this.maxResults = 10;
+
+        this.input.addEventListener('focus', () => this.load(), { once: true });
+        this.input.addEventListener('input', () => {
+            this.load().then(() => this.show(this.input.value));
+        });
+        this.form.addEventListener('submit', (e) => {
+            e.preventDefault();
+            const first = this.results.querySelector('a');
+            if (first) {
+                first.click();
+            }
+        });
+        this.results.addEventListener('click', (e) => {
+            if (e.target.closest('a')) {
+                this.results.hidden = true;
+            }
+        });
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape') {
+                this.results.hidden = true;
+            }
+        });
+    }
+
+    load() {
+        // Fetch the index once, on first use
+        if (!this.loading) {
+            this.loading = fetch(this.form.dataset.index)
+                .then(response => response.ok ? response.json() : Promise.reject(new Error(response.statusText)))
+                .then(index => {
+                    this.index = index;
+                })
+                .catch(error => {
+                    this.loading = null;
+                    console.error('❌ Could not load the search index:', error);
+                });
+        }
+        return this.loading;
+    }
+
+    static fold(text) {
+        // Same folding as search_index.fold: lowercase, accents stripped
+        return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
+    }
+
+    lowerBound(prefix) {
+        const terms = this.index.terms;
+        let low = 0;
+        let high = terms.length;
+        while (low < high) {
+            const middle = (low + high) >> 1;
+            if (terms[middle] < prefix) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+        return low;
+    }
+
+    matches(prefix) {
+        // Documents containing any term that starts with prefix (postings are delta-encoded)
+        const ids = new Set();
+        const terms = this.index.terms;
+        for (let i = this.lowerBound(prefix); i < terms.length && terms[i].startsWith(prefix); i++) {
+            let id = 0;
+            this.index.postings[i].forEach(delta => {
+                id += delta;
+                ids.add(id);
+            });
+        }
+        return ids;
+    }
+
+    search(query) {
+        const words = CvSearch.fold(query).match(/[\p{L}\p{N}_]+/gu) || [];
+        let found = null;
+        for (const word of words) {
+            const ids = this.matches(word);
+            found = found ? new Set([...found].filter(id => ids.has(id))) : ids;
+            if (!found.size) {
+                break;
+            }
+        }
+        return found ? [...found].sort((a, b) => a - b).slice(0, this.maxResults) : [];
+    }
+
+    show(query) {
+        if (!this.index) {
+            return;
+        }
+        this.results.replaceChildren();
+        const ids = query.trim() ? this.search(query) : [];
+        ids.forEach(id => {
+            const [title, anchor, heading] = this.index.docs[id];
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = `#${anchor}`;
+            link.textContent = title;
+            const section = document.createElement('small');
+            section.textContent = heading;
+            link.appendChild(section);
+            item.appendChild(link);
+            this.results.appendChild(item);
+        });
+        if (query.trim() && !ids.length) {
+            const item = document.createElement('li');
+            item.className = 'cv-search-empty';
+            item.textContent = 'No matches';
+            this.results.appendChild(item);
+        }
+        this.results.hidden = !query.trim();
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('form.cv-search').forEach(form => new CvSearch(form));
+});
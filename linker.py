@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+In-document links for free text, driven by shortBio.links in cv-data.json
+All phrases are matched in a single scan per paragraph using one compiled
+alternation, built once per set of links
+"""
+
+import re
+from functools import lru_cache
+
+def link_key(links):
+    """Hashable form of a list of {phrase, label, target} links"""
+    return tuple((link['phrase'], link.get('label', ''), link.get('target', '')) for link in links or ())
+
+@lru_cache(maxsize=64)
+def compile_links(key):
+    """Compile link definitions into (pattern, phrase -> (label, target)) once
+
+    Empty phrases are skipped: they would match between every character.
+    """
+    lookup = {phrase: (label, target) for phrase, label, target in key if phrase}
+    if not lookup:
+        return None, {}
+    phrases = sorted(lookup, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(phrase) for phrase in phrases)), lookup
+
+def clear_caches():
+    """Drop all memoized results"""
+    compile_links.cache_clear()
+
+def split_links(text, links):
+    """Yield (segment, link) pairs; link is (label, target) for linked phrases, else None"""
+    pattern, lookup = compile_links(link_key(links))
+    if pattern is None:
+        yield text, None
+        return
+    position = 0
+    for match in pattern.finditer(text):
+        if match.start() > position:
+            yield text[position:match.start()], None
+        yield match.group(), lookup[match.group()]
+        position = match.end()
+    if position < len(text):
+        yield text[position:], None
+
+def link_latex(text, links, escape):
+    """Escape text for LaTeX, wrapping linked phrases in \\hyperref"""
+    parts = []
+    for segment, link in split_links(text, links):
+        if link and link[0]:
+            parts.append(f'\\hyperref[{link[0]}]{{{escape(segment)}}}')
+        else:
+            parts.append(escape(segment))
+    return ''.join(parts)
+
+def link_html(text, links, escape):
+    """Escape text for HTML, wrapping linked phrases in in-page anchors"""
+    parts = []
+    for segment, link in split_links(text, links):
+        if link and link[1]:
+            parts.append(f'<a href="#{escape(link[1])}">{escape(segment)}</a>')
+        else:
+            parts.append(escape(segment))
+    return ''.join(parts)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Precompiled page templates with {{slot}} placeholders
+A template is parsed once into literal segments and slot names; the
+compiled form is kept in memory and in .cache/templates so later runs and
+batch workers skip the parse entirely
+"""
+
+import hashlib
+import marshal
+import os
+import re
+
+from section_cache import CACHE_DIR
+
+SLOT = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+_compiled = {}
+
+def compile_template(text):
+    """Split template text into (literals, slots); len(literals) == len(slots) + 1"""
+    literals = []
+    slots = []
+    position = 0
+    for match in SLOT.finditer(text):
+        literals.append(text[position:match.start()])
+        slots.append(match.group(1))
+        position = match.end()
+    literals.append(text[position:])
+    return tuple(literals), tuple(slots)
+
+def load_template(path, cache_dir=CACHE_DIR):
+    """Return the compiled template at path, reusing the in-memory or on-disk compiled form"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    compiled = _compiled.get(key[0])
+    if compiled and compiled[0] == key:
+        return compiled[1]
+
+    # One entry per template file: templates with the same name in different directories do not collide
+    path_digest = hashlib.sha256(key[0].encode('utf-8')).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir, 'templates', f'{os.path.basename(path)}.{path_digest}.marshal')
+    template = None
+    try:
+        with open(cache_path, 'rb') as f:
+            stored_key, template = marshal.load(f)
+        if tuple(stored_key) != key:
+            template = None
+    except (OSError, EOFError, ValueError, TypeError):
+        template = None
+
+    if template is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            template = compile_template(f.read())
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                marshal.dump((key, template), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    _compiled[key[0]] = (key, template)
+    return template
+
+def render_template(template, slots):
+    """Yield the template's literals interleaved with slot values
+
+    A slot value is either a string or an iterable of string fragments.
+    """
+    literals, names = template
+    for literal, name in zip(literals, names):
+        yield literal
+        value = slots[name]
+        if isinstance(value, str):
+            yield value
+        else:
+            yield from value
+    yield literals[-1]
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Incremental pdflatex compilation
+Runs pdflatex in a persistent build directory so .aux/.out files survive
+between builds, skips compilation when the .tex and its local inputs are
+unchanged, reruns only while the aux/label files keep changing, and leaves
+the target PDF untouched when the new one is byte-identical
+pdflatex runs with SOURCE_DATE_EPOCH set, so the dates and trailer /ID it
+writes (and thus the PDF bytes) depend only on the inputs; generated CVs
+also omit the dates altogether
+With a format directory, the static preamble (everything before
+\\csname endofdump\\endcsname) is dumped once per preamble hash with
+mylatexformat and every compile loads that format instead of the packages
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+BUILD_DIR = os.path.join('build', 'latex')
+FORMAT_DIR = os.path.join(BUILD_DIR, 'formats')
+END_OF_DUMP = '\\csname endofdump\\endcsname'
+MAX_PASSES = 3
+# Timestamp pdflatex writes instead of the current time (the caller's SOURCE_DATE_EPOCH wins)
+SOURCE_DATE_EPOCH = '0'
+AUX_EXTENSIONS = ('.aux', '.out', '.toc')
+INPUT_COMMAND = re.compile(r'\\(input|include|includegraphics|documentclass|usepackage)(?:\[[^\]]*\])?\{([^}]+)\}')
+INPUT_EXTENSIONS = {
+    'input': ('', '.tex'),
+    'include': ('.tex',),
+    'includegraphics': ('', '.pdf', '.png', '.jpg', '.jpeg'),
+    'documentclass': ('.cls',),
+    'usepackage': ('.sty',),
+}
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def local_inputs(tex_path, source):
+    """Files next to the .tex that it pulls in (inputs, graphics, local classes and packages)"""
+    directory = os.path.dirname(os.path.abspath(tex_path))
+    found = []
+    for command, names in INPUT_COMMAND.findall(source):
+        for name in names.split(','):
+            for extension in INPUT_EXTENSIONS[command]:
+                path = os.path.join(directory, name.strip() + extension)
+                if os.path.isfile(path):
+                    found.append(path)
+                    break
+    return sorted(set(found))
+
+def inputs_digest(tex_path):
+    """Digest of the .tex and every local file it depends on"""
+    with open(tex_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw)
+    for path in local_inputs(tex_path, raw.decode('utf-8', 'replace')):
+        digest.update(f'\0{os.path.basename(path)}\0{file_digest(path)}'.encode('utf-8'))
+    return digest.hexdigest()
+
+def aux_digests(build_dir, job):
+    """Digests of the aux/label files of a job, used to decide whether another pass is needed"""
+    return [file_digest(os.path.join(build_dir, job + extension)) for extension in AUX_EXTENSIONS]
+
+def load_state(path):
+    """Previous compile state, or an empty one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(path, state):
+    """Store the compile state of a job"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def split_preamble(source):
+    """The static preamble before the end-of-dump marker, or None if the source has none"""
+    index = source.find(END_OF_DUMP)
+    return source[:index] if index >= 0 else None
+
+@functools.lru_cache(maxsize=None)
+def pdflatex_version():
+    """First line of pdflatex --version; formats only load in the engine that dumped them"""
+    result = subprocess.run(['pdflatex', '--version'], capture_output=True, text=True)
+    return result.stdout.split('\n', 1)[0]
+
+@functools.lru_cache(maxsize=None)
+def has_mylatexformat():
+    """Whether the TeX installation provides mylatexformat.ltx"""
+    if shutil.which('kpsewhich') is None:
+        return False
+    result = subprocess.run(['kpsewhich', 'mylatexformat.ltx'], capture_output=True, text=True)
+    return bool(result.stdout.strip())
+
+def reproducible_env(**extra):
+    """Environment for pdflatex with a fixed SOURCE_DATE_EPOCH (\\today is left alone)"""
+    return dict(os.environ, SOURCE_DATE_EPOCH=os.environ.get('SOURCE_DATE_EPOCH', SOURCE_DATE_EPOCH), **extra)
+
+def build_format(preamble, format_dir, texinputs):
+    """Dump preamble into a format cached by its hash; returns the -fmt path, or None if it cannot be built"""
+    key = hashlib.sha256(f'{pdflatex_version()}\0{preamble}'.encode('utf-8')).hexdigest()[:16]
+    name = f'preamble-{key}'
+    target = os.path.join(format_dir, name + '.fmt')
+    if os.path.exists(target):
+        return target[:-len('.fmt')]
+    if not has_mylatexformat():
+        print('mylatexformat not found, compiling without a precompiled preamble')
+        return None
+
+    os.makedirs(format_dir, exist_ok=True)
+    # Per-process job name: concurrent batch workers may dump the same preamble
+    job = f'{name}-{os.getpid()}'
+    with open(os.path.join(format_dir, job + '.tex'), 'w', encoding='utf-8') as f:
+        f.write(preamble + END_OF_DUMP + '\n\\begin{document}\n\\end{document}\n')
+    result = subprocess.run(['pdflatex', '-ini', '-interaction=nonstopmode', '-halt-on-error',
+                             f'-jobname={job}', '&pdflatex', 'mylatexformat.ltx', job + '.tex'],
+                            cwd=format_dir, env=reproducible_env(TEXINPUTS=texinputs),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    built = os.path.join(format_dir, job + '.fmt')
+    if result.returncode != 0 or not os.path.exists(built):
+        print(f'Could not dump the preamble format, see {os.path.join(format_dir, job + ".log")}')
+        return None
+    os.replace(built, target)
+    for extension in ('.tex', '.log'):
+        os.remove(os.path.join(format_dir, job + extension))
+    return target[:-len('.fmt')]
+
+def run_pdflatex(tex_path, build_dir, fmt=None):
+    """One pdflatex pass writing into build_dir; raises RuntimeError with the log path on failure"""
+    directory, name = os.path.split(os.path.abspath(tex_path))
+    options = [f'-fmt={fmt}'] if fmt else []
+    result = subprocess.run(['pdflatex', '-interaction=nonstopmode', '-halt-on-error', *options,
+                             f'-output-directory={build_dir}', name],
+                            cwd=directory, env=reproducible_env(), stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+    if result.returncode != 0:
+        log = os.path.join(build_dir, os.path.splitext(name)[0] + '.log')
+        raise RuntimeError(f'pdflatex failed on {tex_path}, see {log}')
+
+def install_pdf(built, target):
+    """Copy the built PDF over target unless they are identical; True if target changed"""
+    if file_digest(built) == file_digest(target):
+        return False
+    tmp_path = f'{target}.{os.getpid()}.tmp'
+    shutil.copyfile(built, tmp_path)
+    os.replace(tmp_path, target)
+    return True
+
+def compile_pdf(tex_path, pdf_path=None, build_dir=BUILD_DIR, format_dir=None):
+    """Compile tex_path into pdf_path incrementally; returns the number of passes, or None without pdflatex
+
+    With format_dir, the preamble is loaded from a format dumped (and cached)
+    in that directory, shared by every document with the same preamble.
+    """
+    if shutil.which('pdflatex') is None:
+        print('pdflatex not found, skipping PDF compilation')
+        return None
+    job = os.path.splitext(os.path.basename(tex_path))[0]
+    pdf_path = pdf_path or os.path.splitext(tex_path)[0] + '.pdf'
+    build_dir = os.path.abspath(build_dir)
+    os.makedirs(build_dir, exist_ok=True)
+    state_path = os.path.join(build_dir, job + '.state.json')
+    state = load_state(state_path)
+
+    digest = inputs_digest(tex_path)
+    if state.get('inputs') == digest and state.get('pdf') is not None and file_digest(pdf_path) == state['pdf']:
+        print(f'{pdf_path} is up to date')
+        return 0
+
+    fmt = None
+    if format_dir is not None:
+        with open(tex_path, 'r', encoding='utf-8') as f:
+            preamble = split_preamble(f.read())
+        if preamble is not None:
+            texinputs = os.path.dirname(os.path.abspath(tex_path)) + os.pathsep
+            fmt = build_format(preamble, os.path.abspath(format_dir), texinputs)
+
+    passes = 0
+    while passes < MAX_PASSES:
+        before = aux_digests(build_dir, job)
+        run_pdflatex(tex_path, build_dir, fmt)
+        passes += 1
+        if aux_digests(build_dir, job) == before:
+            break
+
+    built = os.path.join(build_dir, job + '.pdf')
+    if install_pdf(built, pdf_path):
+        print(f'Compiled {pdf_path} ({passes} pdflatex pass{"es" if passes > 1 else ""})')
+    else:
+        print(f'{pdf_path} unchanged ({passes} pdflatex pass{"es" if passes > 1 else ""})')
+    save_state(state_path, {'inputs': digest, 'pdf': file_digest(pdf_path)})
+    return passes
+
+def main(argv=None):
+    """Compile a .tex file incrementally"""
+    parser = argparse.ArgumentParser(description='Compile a .tex file with pdflatex, only when it changed')
+    parser.add_argument('tex', nargs='?', default='cv.tex', help='LaTeX source (default: %(default)s)')
+    parser.add_argument('-o', '--output', help='PDF to write (default: next to the source)')
+    parser.add_argument('--build-dir', default=BUILD_DIR, help='persistent pdflatex directory (default: %(default)s)')
+    parser.add_argument('--format', action='store_true',
+                        help=f'load the static preamble from a precompiled format cached in {FORMAT_DIR}')
+    args = parser.parse_args(argv)
+    try:
+        compile_pdf(args.tex, args.output, args.build_dir, FORMAT_DIR if args.format else None)
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
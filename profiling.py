@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Per-section profiling for the generators (--profile)
+Records wall time, CPU time, output bytes and tracemalloc peak/allocation
+counts for every section, and can dump cProfile stats for the slowest one
+Timings are taken while tracemalloc is on, so compare them with each other
+rather than with unprofiled runs
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+
+class SectionProfiler:
+    """Collects measurements for each section rendered through render_section"""
+
+    def __init__(self):
+        self.sections = {}
+        self.functions = {}
+        self.data = None
+        self.started = False
+
+    def start(self):
+        """Begin tracing allocations"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+
+    def stop(self):
+        """Stop tracing allocations if this profiler started it"""
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def measure(self, name, section, data, fragments):
+        """Yield fragments, timing only the work spent producing them"""
+        self.functions[name] = section
+        self.data = data
+        wall = cpu = 0.0
+        size = 0
+        count = 0
+        tracemalloc.reset_peak()
+        before_memory = tracemalloc.get_traced_memory()[0]
+        before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        iterator = iter(fragments)
+        while True:
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            try:
+                fragment = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                wall += time.perf_counter() - wall_start
+                cpu += time.process_time() - cpu_start
+            size += len(fragment.encode('utf-8'))
+            count += 1
+            yield fragment
+        peak = tracemalloc.get_traced_memory()[1] - before_memory
+        after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        self.sections[name] = {
+            'wallSeconds': wall,
+            'cpuSeconds': cpu,
+            'outputBytes': size,
+            'fragments': count,
+            'peakAllocatedBytes': max(peak, 0),
+            'netAllocatedBlocks': after_blocks - before_blocks,
+        }
+
+    def slowest(self):
+        """Name of the section with the largest wall time"""
+        if not self.sections:
+            return None
+        return max(self.sections, key=lambda name: self.sections[name]['wallSeconds'])
+
+    def profile_slowest(self, stats_path=None, limit=15):
+        """Re-run the slowest section under cProfile; return the top functions as text"""
+        name = self.slowest()
+        if name is None:
+            return ''
+        section = self.functions[name]
+        profiler = cProfile.Profile()
+        profiler.runcall(lambda: ''.join(section(self.data)))
+        if stats_path:
+            profiler.dump_stats(stats_path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+        return out.getvalue()
+
+    def report(self):
+        """Machine-readable report of all sections"""
+        return {
+            'sections': self.sections,
+            'slowest': self.slowest(),
+            'totalWallSeconds': sum(s['wallSeconds'] for s in self.sections.values()),
+            'totalOutputBytes': sum(s['outputBytes'] for s in self.sections.values()),
+        }
+
+    def table(self):
+        """Human-readable table of all sections, slowest first"""
+        lines = [f'{"section":<30} {"wall ms":>9} {"cpu ms":>9} {"bytes":>10} {"peak KB":>9} {"blocks":>8}']
+        for name, s in sorted(self.sections.items(), key=lambda item: -item[1]['wallSeconds']):
+            lines.append(f'{name:<30} {s["wallSeconds"] * 1000:>9.2f} {s["cpuSeconds"] * 1000:>9.2f} '
+                         f'{s["outputBytes"]:>10} {s["peakAllocatedBytes"] / 1024:>9.1f} {s["netAllocatedBlocks"]:>8}')
+        return '\n'.join(lines)
+
+    def write_report(self, path):
+        """Write the machine-readable report as JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+def print_profile(profiler, output_path):
+    """Print the section table and write the report and cProfile stats next to the output"""
+    report_path = output_path + '.profile.json'
+    stats_path = output_path + '.slowest.prof'
+    profiler.write_report(report_path)
+    print('\nSection profile:')
+    print(profiler.table())
+    print(f'\nSlowest section: {profiler.slowest()} (cProfile stats in {stats_path})')
+    print(profiler.profile_slowest(stats_path))
+    print(f'Profile report: {report_path}')
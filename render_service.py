@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+HTTP service rendering CVs for many tenants on demand
+A tenant is a CV JSON file from a directory or manifest (as for
+batch_render.py); /<tenant>/ serves its page and /<tenant>/cv.tex its LaTeX
+Parsed data and rendered pages live in LRU caches bounded by size, cache
+misses are rendered in a worker pool so the event loop never blocks, and
+every response carries a content-hash ETag so revalidations get a 304
+/_stats reports hit ratios and latency percentiles
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import unquote
+
+import generate_html
+import generate_latex
+from batch_render import load_jobs, percentile
+from schema import SchemaError
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PAGE_CACHE_MB = 64
+DATA_CACHE_MB = 256
+LATENCY_WINDOW = 10000
+# Unknown tenant names rescan the source at most this often
+RESCAN_SECONDS = 5.0
+MAX_HEADER_SIZE = 64 << 10
+TENANT_NAME = re.compile(r'[\w.-]+')
+# Site assets the page links to relatively, served under every tenant
+STATIC_PATHS = ('css/', 'js/', 'resources/', 'index.js')
+# Rendered documents per tenant: path under /<tenant>/ -> (kind, content type)
+DOCUMENTS = {
+    '': ('html', 'text/html; charset=utf-8'),
+    'index.html': ('html', 'text/html; charset=utf-8'),
+    'cv.tex': ('latex', 'text/x-tex; charset=utf-8'),
+}
+
+class LRUCache:
+    """Least-recently-used mapping bounded by the total size of its values"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Value for key (now most recently used), or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Store value, evicting the least recently used entries until it fits"""
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _key, (_value, evicted) = self.entries.popitem(last=False)
+                self.size -= evicted
+                self.evictions += 1
+
+    def stats(self):
+        """Counters for /_stats"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'maxBytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRatio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+        }
+
+# Parsed data of each worker (process or thread pool), set up by init_worker
+_data_cache = None
+
+def init_worker(max_bytes):
+    """Pool initializer: give the worker its parsed-data cache"""
+    global _data_cache
+    if _data_cache is None:
+        _data_cache = LRUCache(max_bytes)
+
+def file_version(path):
+    """(path, mtime, size): changes whenever the file is rewritten"""
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+def render_document(version, kind):
+    """Worker: render one tenant document; returns (body bytes, whether the parsed data was cached)
+
+    The parsed data is charged to the cache at its file size, a stable
+    proxy for its size in memory.
+    """
+    data = _data_cache.get(version)
+    cached = data is not None
+    if not cached:
+        data = generate_html.load_data(version[0])
+        _data_cache.put(version, data, version[2])
+    if kind == 'html':
+        text = generate_html.generate_index_html(data)
+    else:
+        text = ''.join(generate_latex.iter_cv_latex(data))
+    return text.encode('utf-8'), cached
+
+def etag_of(body):
+    """Strong ETag from the content hash (as in compress.py)"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header names etag (weak comparison, '*' matches anything)"""
+    if header is None:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+class HttpError(Exception):
+    """An error response with a status and a plain-text message"""
+
+    def __init__(self, status, message=None):
+        self.status = status
+        super().__init__(message or HTTPStatus(status).phrase)
+
+class RenderService:
+    """Tenant lookup, caches, worker pool and statistics behind the HTTP front end"""
+
+    def __init__(self, source, pool, page_bytes=PAGE_CACHE_MB << 20, static_dir=ROOT):
+        self.source = source
+        self.pool = pool
+        self.static_dir = os.path.realpath(static_dir)
+        self.static_roots = tuple(os.path.join(self.static_dir, path) for path in STATIC_PATHS if path.endswith('/'))
+        self.static_files = {os.path.join(self.static_dir, path) for path in STATIC_PATHS if not path.endswith('/')}
+        self.tenants = dict(load_jobs(source))
+        self.scanned = time.monotonic()
+        self.scanning = None
+        self.pages = LRUCache(page_bytes)
+        self.rendering = {}
+        self.data_hits = 0
+        self.data_misses = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.started = time.time()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    async def tenant_path(self, tenant):
+        """Data file of a tenant; unknown names rescan the source for tenants added since startup"""
+        if tenant not in self.tenants:
+            await self.rescan()
+        if tenant not in self.tenants:
+            raise HttpError(404, f'unknown tenant "{tenant}"')
+        return self.tenants[tenant]
+
+    async def rescan(self):
+        """Reload the tenant list in the default executor, at most once per RESCAN_SECONDS
+
+        Requests arriving during a rescan wait for it instead of starting another.
+        """
+        if self.scanning is None:
+            if time.monotonic() - self.scanned < RESCAN_SECONDS:
+                return
+            self.scanned = time.monotonic()
+            self.scanning = asyncio.ensure_future(self.load_tenants())
+        await asyncio.shield(self.scanning)
+
+    async def load_tenants(self):
+        """Replace the tenant list with a fresh load_jobs of the source; keep the old one on errors"""
+        try:
+            jobs = await asyncio.get_running_loop().run_in_executor(None, load_jobs, self.source)
+            self.tenants = dict(jobs)
+        except (OSError, ValueError) as error:
+            print(f'Could not rescan {self.source}: {error}')
+        finally:
+            self.scanning = None
+
+    async def document(self, tenant, kind):
+        """(body, etag) of a tenant document, rendered in the pool on a cache miss
+
+        Concurrent misses for the same document wait for a single render.
+        """
+        path = await self.tenant_path(tenant)
+        try:
+            version = file_version(path)
+        except OSError:
+            raise HttpError(404, f'no data for tenant "{tenant}"')
+        key = (kind, version)
+        page = self.pages.get(key)
+        if page is not None:
+            if page[0] is None:
+                raise HttpError(422, page[1])
+            return page
+        if key not in self.rendering:
+            self.rendering[key] = asyncio.ensure_future(self.render(key))
+        return await asyncio.shield(self.rendering[key])
+
+    async def render(self, key):
+        """Render a missed document in the pool and cache it
+
+        A version of the data that fails the schema is cached as (None,
+        message), so it is not rendered again until the file changes.
+        """
+        kind, version = key
+        loop = asyncio.get_running_loop()
+        try:
+            body, cached = await loop.run_in_executor(self.pool, render_document, version, kind)
+        except SchemaError as error:
+            message = str(error)
+            self.pages.put(key, (None, message), len(message))
+            raise HttpError(422, message)
+        finally:
+            del self.rendering[key]
+        if cached:
+            self.data_hits += 1
+        else:
+            self.data_misses += 1
+        page = (body, etag_of(body))
+        self.pages.put(key, page, len(body))
+        return page
+
+    async def static_file(self, relative_path):
+        """(body, etag) of a site asset (css/, js/, resources/ ...), cached like the pages
+
+        Paths with '..' segments are refused, and the resolved file must still
+        lie under one of STATIC_PATHS, so symlinks cannot lead out of them.
+        """
+        path = unquote(relative_path)
+        if '..' in path.split('/') or posixpath.normpath(path) != path or not path.startswith(STATIC_PATHS):
+            raise HttpError(404)
+        path = os.path.realpath(os.path.join(self.static_dir, path))
+        if not (path.startswith(self.static_roots) or path in self.static_files) or not os.path.isfile(path):
+            raise HttpError(404)
+        key = ('static', file_version(path))
+        page = self.pages.get(key)
+        if page is None:
+            body = await asyncio.get_running_loop().run_in_executor(None, read_bytes, path)
+            page = (body, etag_of(body))
+            self.pages.put(key, page, len(body))
+        return page
+
+    async def handle(self, method, target, headers):
+        """(status, headers, body) for one request"""
+        if method not in ('GET', 'HEAD'):
+            raise HttpError(405)
+        path, query = target.split('?', 1) if '?' in target else (target, '')
+        if path == '/_stats':
+            body = json.dumps(self.stats(), indent=2).encode('utf-8') + b'\n'
+            return 200, {'Content-Type': 'application/json', 'Cache-Control': 'no-store'}, body
+
+        tenant, slash, rest = path.lstrip('/').partition('/')
+        if not TENANT_NAME.fullmatch(tenant):
+            raise HttpError(404)
+        if not slash:
+            # The page links its assets relatively, so it must be served from /<tenant>/
+            await self.tenant_path(tenant)
+            location = f'/{tenant}/' + (f'?{query}' if query else '')
+            return 301, {'Location': location, 'Content-Type': 'text/plain; charset=utf-8'}, f'{location}\n'.encode('utf-8')
+        if rest in DOCUMENTS:
+            kind, content_type = DOCUMENTS[rest]
+            body, etag = await self.document(tenant, kind)
+        else:
+            await self.tenant_path(tenant)
+            body, etag = await self.static_file(rest)
+            content_type = mimetypes.guess_type(rest)[0] or 'application/octet-stream'
+        response_headers = {'Content-Type': content_type, 'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag_matches(headers.get('if-none-match'), etag):
+            self.not_modified += 1
+            return 304, response_headers, b''
+        return 200, response_headers, body
+
+    def stats(self):
+        """Request counts, cache hit ratios and latency percentiles"""
+        latencies = list(self.latencies)
+        renders = self.data_hits + self.data_misses
+        return {
+            'uptimeSeconds': round(time.time() - self.started, 1),
+            'tenants': len(self.tenants),
+            'requests': self.requests,
+            'notModified': self.not_modified,
+            'errors': self.errors,
+            'rendersInFlight': len(self.rendering),
+            'pageCache': self.pages.stats(),
+            'dataCache': {
+                'hits': self.data_hits,
+                'misses': self.data_misses,
+                'hitRatio': round(self.data_hits / renders, 4) if renders else 0.0,
+            },
+            'latencyMs': {
+                'samples': len(latencies),
+                'p50': round(percentile(latencies, 0.50) * 1000, 2),
+                'p90': round(percentile(latencies, 0.90) * 1000, 2),
+                'p99': round(percentile(latencies, 0.99) * 1000, 2),
+            },
+        }
+
+    async def serve_connection(self, reader, writer):
+        """Answer requests on one connection until the client closes it or asks to"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                started = time.perf_counter()
+                method, target, version, headers = parse_head(head)
+                head_only = method == 'HEAD'
+                try:
+                    if not method:
+                        raise HttpError(400, 'malformed request line')
+                    status, response_headers, body = await self.handle(method, target, headers)
+                except HttpError as error:
+                    status, response_headers = error.status, {'Content-Type': 'text/plain; charset=utf-8'}
+                    body = f'{error}\n'.encode('utf-8')
+                except Exception as error:
+                    status, response_headers = 500, {'Content-Type': 'text/plain; charset=utf-8'}
+                    body = f'{type(error).__name__}: {error}\n'.encode('utf-8')
+                if status >= 500:
+                    self.errors += 1
+                # Request bodies are never read, so a request carrying one (or a
+                # malformed one) ends the connection rather than desync the next
+                keep_alive = should_keep_alive(version, headers) and bool(method) and not has_body(headers)
+                writer.write(format_response(status, response_headers, body, head_only, keep_alive))
+                await writer.drain()
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - started)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+def read_bytes(path):
+    """Whole file as bytes"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def parse_head(head):
+    """(method, target, version, lower-cased headers) of a request head; method is '' if malformed"""
+    lines = head.decode('latin-1').split('\r\n')
+    parts = lines[0].split()
+    method, target, version = parts if len(parts) == 3 else ('', '/', 'HTTP/1.0')
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+def should_keep_alive(version, headers):
+    """HTTP/1.1 keeps the connection open unless told otherwise; HTTP/1.0 only if asked"""
+    connection = headers.get('connection', '').lower()
+    if version == 'HTTP/1.1':
+        return connection != 'close'
+    return connection == 'keep-alive'
+
+def has_body(headers):
+    """Whether a request declares a body after its head"""
+    return 'transfer-encoding' in headers or headers.get('content-length', '0') != '0'
+
+def format_response(status, headers, body, head_only=False, keep_alive=True):
+    """Status line, headers and body of a response as bytes"""
+    lines = [f'HTTP/1.1 {status} {HTTPStatus(status).phrase}']
+    lines += [f'{name}: {value}' for name, value in headers.items()]
+    if status != 304:
+        lines.append(f'Content-Length: {len(body)}')
+    lines.append('Connection: keep-alive' if keep_alive else 'Connection: close')
+    head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    return head if head_only or status == 304 else head + body
+
+async def serve(service, host, port):
+    """Run the HTTP front end until cancelled"""
+    server = await asyncio.start_server(service.serve_connection, host, port, limit=MAX_HEADER_SIZE)
+    print(f'Serving {len(service.tenants)} tenants on http://{host}:{port}/<tenant>/ (Ctrl+C to stop)')
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    """Main function to run the rendering service"""
+    parser = argparse.ArgumentParser(description='Serve CVs for many tenants, rendered on demand')
+    parser.add_argument('source', help='directory of CV JSON files or a JSON manifest listing them')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8080, help='port to bind (default: %(default)s)')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='render workers (default: CPU count)')
+    parser.add_argument('--threads', action='store_true',
+                        help='render in a thread pool (one parsed-data cache) instead of processes')
+    parser.add_argument('--page-cache-mb', type=int, default=PAGE_CACHE_MB,
+                        help='rendered page cache size (default: %(default)s)')
+    parser.add_argument('--data-cache-mb', type=int, default=DATA_CACHE_MB,
+                        help='parsed data cache size per worker (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    executor = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+    pool = executor(max_workers=args.workers, initializer=init_worker, initargs=(args.data_cache_mb << 20,))
+    try:
+        service = RenderService(args.source, pool, args.page_cache_mb << 20)
+    except (OSError, ValueError) as error:
+        pool.shutdown()
+        sys.exit(str(error))
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown(cancel_futures=True)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Schema of cv-data.json, compiled once into a tree of checking functions
+Validation walks a document in one pass and collects every problem with
+its JSON path, so a broken file fails before any rendering or pdflatex run
+Spec language: a type checks isinstance; a tuple accepts any of its specs;
+[spec] is a list of spec; {'key': spec, 'key?': spec} is an object with
+required and optional keys (others are allowed); {'*': spec} is an object
+whose every value matches spec; NonEmpty(spec) also rejects an empty value
+"""
+
+import argparse
+import glob
+import json
+import sys
+import time
+
+from cv_loader import load_cv
+
+TYPE_NAMES = {str: 'string', int: 'integer', float: 'number', bool: 'boolean', list: 'array', dict: 'object'}
+
+class NonEmpty:
+    """Spec of a value matching spec that is not empty ('' or [])"""
+
+    def __init__(self, spec):
+        self.spec = spec
+
+DATED_ENTRY = {'date': str, 'title': str, 'institution': str, 'description': str}
+
+CV_SCHEMA = {
+    'personal': {
+        'firstName': str, 'lastName': str, 'title': [str],
+        'addressLine1': str, 'addressLine2': str, 'phone': str,
+        'displayName?': str, 'headline?': [str], 'description?': str, 'keywords?': str,
+        'email?': str, 'github?': str, 'linkedin?': str, 'authorNames?': [str],
+    },
+    'shortBio': {
+        'paragraphs': [str],
+        'links?': [{'phrase': NonEmpty(str), 'label?': str, 'target?': str}],
+    },
+    'education': {'entries': [{'title': str, 'school': str, 'grade?': str, 'note?': str}]},
+    'honorsAwards': {'entries': [DATED_ENTRY], 'contests?': [DATED_ENTRY]},
+    'publications': {
+        'byYear': {'*': [{'authors': str, 'title': str, 'url?': str, 'status?': str, 'status2?': str}]},
+    },
+    'technicalReports': {'byYear': {'*': [{'authors': str, 'title': str, 'status': str}]}},
+    'workExperience': {
+        'entries': [{
+            **DATED_ENTRY,
+            'courses?': [str],
+            'workItems?': [(str, {'title': str, 'items?': [str], 'note?': str})],
+        }],
+    },
+    'softwareProjects': {
+        'researchProfessional': [DATED_ENTRY],
+        'courseProjects': {'note': str, 'entries': [DATED_ENTRY]},
+    },
+    'schoolsSeminars': {'entries': [{**DATED_ENTRY, 'subtitle?': str}]},
+    'volunteering': {
+        'academic': [{**DATED_ENTRY, 'subtitle?': str}],
+        'other': {'note': str, 'entries': [DATED_ENTRY]},
+    },
+    'languages': {'entries': [{'name': str, 'level': str}]},
+    'hobbies': {'entries': [{'title': str, 'description': str}]},
+    'references': {'entries': [{'name': str, 'email': str, 'positions': [str]}]},
+    'contact': {
+        'emails': [{'address': str, 'label': str}],
+        'links': [{'name': str, 'url': str}],
+    },
+}
+
+class SchemaError(ValueError):
+    """A document does not match the schema; errors lists every problem"""
+
+    def __init__(self, source, errors):
+        self.source = source
+        self.errors = errors
+        lines = '\n'.join(f'  {error}' for error in errors)
+        super().__init__(f'{source}: {len(errors)} schema error(s):\n{lines}')
+
+    def __reduce__(self):
+        # Rebuilt from source and errors, so it survives a process pool
+        return type(self), (self.source, self.errors)
+
+def type_name(value):
+    """Schema name of a JSON value's type"""
+    if value is None:
+        return 'null'
+    return TYPE_NAMES.get(type(value), type(value).__name__)
+
+def format_path(path):
+    """'$.a.b[0]' from the (parent, step) chain built during validation"""
+    steps = []
+    while path is not None:
+        path, step = path
+        if isinstance(step, int):
+            steps.append(f'[{step}]')
+        else:
+            steps.append(f'.{step}' if step.isidentifier() else f'[{json.dumps(step)}]')
+    return '$' + ''.join(reversed(steps))
+
+def compile_spec(spec):
+    """Compile a spec into check(value, path, errors), with the Python type it expects as .kind"""
+    if isinstance(spec, type):
+        name = TYPE_NAMES.get(spec, spec.__name__)
+        def check(value, path, errors):
+            if not isinstance(value, spec) or (isinstance(value, bool) and spec is not bool):
+                errors.append(f'{format_path(path)}: expected {name}, got {type_name(value)}')
+        check.kind = spec
+        return check
+
+    if isinstance(spec, NonEmpty):
+        value_check = compile_spec(spec.spec)
+        def check(value, path, errors):
+            if isinstance(value, value_check.kind) and not value:
+                errors.append(f'{format_path(path)}: must not be empty')
+            else:
+                value_check(value, path, errors)
+        check.kind = value_check.kind
+        return check
+
+    if isinstance(spec, tuple):
+        alternatives = [compile_spec(item) for item in spec]
+        expected = ' or '.join(TYPE_NAMES.get(item.kind, item.kind.__name__) for item in alternatives)
+        def check(value, path, errors):
+            for alternative in alternatives:
+                if isinstance(value, alternative.kind):
+                    alternative(value, path, errors)
+                    return
+            errors.append(f'{format_path(path)}: expected {expected}, got {type_name(value)}')
+        check.kind = tuple(item.kind for item in alternatives)
+        return check
+
+    if isinstance(spec, list):
+        item_check = compile_spec(spec[0])
+        def check(value, path, errors):
+            if not isinstance(value, list):
+                errors.append(f'{format_path(path)}: expected array, got {type_name(value)}')
+                return
+            for index, item in enumerate(value):
+                item_check(item, (path, index), errors)
+        check.kind = list
+        return check
+
+    if '*' in spec:
+        value_check = compile_spec(spec['*'])
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f'{format_path(path)}: expected object, got {type_name(value)}')
+                return
+            for key, item in value.items():
+                value_check(item, (path, key), errors)
+        check.kind = dict
+        return check
+
+    required = [(key, compile_spec(item)) for key, item in spec.items() if not key.endswith('?')]
+    optional = [(key[:-1], compile_spec(item)) for key, item in spec.items() if key.endswith('?')]
+    def check(value, path, errors):
+        if not isinstance(value, dict):
+            errors.append(f'{format_path(path)}: expected object, got {type_name(value)}')
+            return
+        for key, key_check in required:
+            if key in value:
+                key_check(value[key], (path, key), errors)
+            else:
+                errors.append(f'{format_path(path)}: missing required key "{key}"')
+        for key, key_check in optional:
+            if key in value:
+                key_check(value[key], (path, key), errors)
+    check.kind = dict
+    return check
+
+_check_cv = compile_spec(CV_SCHEMA)
+# Per top-level key, for documents that arrive one section at a time (see cv_stream.py)
+SECTION_CHECKS = {key.rstrip('?'): compile_spec(spec) for key, spec in CV_SCHEMA.items()}
+
+def validate(data, check=_check_cv):
+    """Every schema error of a document, as 'path: problem' strings"""
+    errors = []
+    check(data, None, errors)
+    return errors
+
+def validate_section(key, value):
+    """Schema errors of one top-level section of a document"""
+    errors = []
+    check = SECTION_CHECKS.get(key)
+    if check is not None:
+        check(value, (None, key), errors)
+    return errors
+
+def missing_sections(keys):
+    """Errors for the required top-level keys not among keys"""
+    return [f'$: missing required key "{key}"' for key in CV_SCHEMA if not key.endswith('?') and key not in keys]
+
+def check_cv(data, source='cv-data.json'):
+    """Raise SchemaError listing all problems unless data matches the CV schema"""
+    errors = validate(data)
+    if errors:
+        raise SchemaError(source, errors)
+    return data
+
+def check_sections(data, keys, source='cv-data.json'):
+    """check_cv for only the top-level keys a partial render reads"""
+    errors = [f'$: missing required key "{key}"' for key in keys if key in CV_SCHEMA and key not in data]
+    for key in keys:
+        if key in data:
+            errors += validate_section(key, data[key])
+    if errors:
+        raise SchemaError(source, errors)
+    return data
+
+def main(argv=None):
+    """Validate CV data files"""
+    parser = argparse.ArgumentParser(description='Check CV JSON files against the cv-data.json schema')
+    parser.add_argument('paths', nargs='*', default=['data/cv-data.json'],
+                        help='files or glob patterns (default: data/cv-data.json)')
+    args = parser.parse_args(argv)
+
+    paths = [path for pattern in args.paths for path in sorted(glob.glob(pattern)) or [pattern]]
+    started = time.perf_counter()
+    failed = 0
+    for path in paths:
+        try:
+            errors = validate(load_cv(path))
+        except (OSError, ValueError) as error:
+            errors = [f'$: {error}']
+        if errors:
+            failed += 1
+            print(SchemaError(path, errors))
+    elapsed = time.perf_counter() - started
+    rate = f', {len(paths) / elapsed:.0f} files/sec' if elapsed else ''
+    print(f'{len(paths) - failed}/{len(paths)} files valid ({elapsed * 1000:.1f} ms{rate})')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Compact client-side search index over cv-data.json
+Every list entry (publication, award, project, ...) becomes a document with
+a title and the anchor of the page section that shows it; its text fields
+are folded into tokens and stored as a sorted term list with delta-encoded
+postings, so js/search.js can answer prefix queries without a server
+Tokenized sections are cached by content hash and only redone when changed
+"""
+
+import json
+import os
+import re
+import unicodedata
+
+from section_cache import hash_json
+from section_registry import SHARED_KEYS
+
+INDEX_PATH = 'search-index.json'
+CACHE_NAME = 'search.json'
+INDEX_VERSION = 1
+TOKEN = re.compile(r'\w{2,}')
+LATEX_ARTIFACT = re.compile(r'\\hyperref\[\]\{\}')
+TITLE_KEYS = ('title', 'name', 'phrase')
+SKIPPED_KEYS = {'url', 'links'}
+
+def fold(text):
+    """Lowercase and strip accents, the same way js/search.js folds queries"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+def tokens(text):
+    """Distinct search tokens of a text"""
+    return set(TOKEN.findall(fold(LATEX_ARTIFACT.sub('', text))))
+
+def strings(value):
+    """Every searchable string in a JSON value"""
+    if isinstance(value, str):
+        if not value.startswith(('http://', 'https://')):
+            yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in SKIPPED_KEYS:
+                yield from strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from strings(item)
+
+def entry_title(entry):
+    """Display title of an entry"""
+    if isinstance(entry, dict):
+        for key in TITLE_KEYS:
+            if isinstance(entry.get(key), str):
+                return LATEX_ARTIFACT.sub('', entry[key])
+    text = LATEX_ARTIFACT.sub('', next(strings(entry), ''))
+    return text if len(text) <= 80 else text[:77].rsplit(' ', 1)[0] + '...'
+
+def entries(value):
+    """The entries of a section: the outermost items of every list in it"""
+    if isinstance(value, list):
+        yield from value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in SKIPPED_KEYS:
+                yield from entries(item)
+
+def index_section(value, anchor, heading):
+    """Documents ([title, anchor, heading]) and their token lists for one top-level key"""
+    docs = []
+    token_lists = []
+    for entry in entries(value):
+        words = set()
+        for text in strings(entry):
+            words |= tokens(text)
+        if words:
+            docs.append([entry_title(entry), anchor, heading])
+            token_lists.append(sorted(words))
+    return docs, token_lists
+
+def load_cache(path):
+    """Tokenized sections from the previous build"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def build_index(data, anchors, cache_dir=None):
+    """Build the index for the keys in anchors ({data key: (section id, heading)})
+
+    Shared keys (personal) are read by sections without being shown as
+    entries of them, so they are never indexed.
+    """
+    cache_path = os.path.join(cache_dir, CACHE_NAME) if cache_dir else None
+    cache = load_cache(cache_path) if cache_path else {}
+    sections = {}
+    for key, (anchor, heading) in anchors.items():
+        if key not in data or key in SHARED_KEYS:
+            continue
+        digest = hash_json([INDEX_VERSION, anchor, heading, data[key]])
+        cached = cache.get(key)
+        if cached is None or cached['hash'] != digest:
+            docs, token_lists = index_section(data[key], anchor, heading)
+            cached = {'hash': digest, 'docs': docs, 'tokens': token_lists}
+        sections[key] = cached
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(sections, f, ensure_ascii=False)
+
+    docs = []
+    postings = {}
+    for section in sections.values():
+        for doc, words in zip(section['docs'], section['tokens']):
+            for word in words:
+                postings.setdefault(word, []).append(len(docs))
+            docs.append(doc)
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        ids = postings[term]
+        encoded.append([ids[0]] + [b - a for a, b in zip(ids, ids[1:])])
+    return {'version': INDEX_VERSION, 'docs': docs, 'terms': terms, 'postings': encoded}
+
+def write_index(index, path):
+    """Write the index as compact JSON, leaving the file alone if nothing changed"""
+    text = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return True
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of rendered section fragments for incremental rebuilds
+Each section is keyed by a hash of the cv-data.json keys it reads, plus a
+hash of the generator source so that code changes invalidate everything
+A section can hold several fragments at once (one per distinct input), so
+CV variants rendered together share every section they have in common
+"""
+
+import hashlib
+import json
+import os
+import sys
+import types
+
+CACHE_DIR = '.cache'
+
+def hash_json(value):
+    """Stable content hash of a JSON-compatible value"""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def source_digest(module):
+    """Hash the source of a generator module and the local modules it uses"""
+    base_dir = os.path.dirname(os.path.abspath(module.__file__))
+    names = {module.__name__}
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            names.add(value.__name__)
+        elif getattr(value, '__module__', None):
+            names.add(value.__module__)
+
+    files = set()
+    for name in names:
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == base_dir:
+            files.add(os.path.abspath(path))
+
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        with open(path, 'rb') as f:
+            digest.update(os.path.basename(path).encode('utf-8'))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+class SectionCache:
+    """Rendered fragments of each section, reused while their inputs are unchanged
+
+    With path None the cache lives in memory only, e.g. for watch mode.
+    Fragments of a rendered section that no render asked for since the last
+    save are dropped on save.
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        self.entries = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if stored.get('source') == source:
+            self.entries = stored.get('sections', {})
+
+    def render(self, name, section, keys, data):
+        """Yield the fragments of a section, from the cache when its inputs are unchanged"""
+        digest = hash_json([data.get(key) for key in keys])
+        fragments = self.entries.setdefault(name, {})
+        self.used.add((name, digest))
+        if digest in fragments:
+            self.hits += 1
+            yield fragments[digest]
+            return
+
+        self.misses += 1
+        parts = []
+        for fragment in section(data):
+            parts.append(fragment)
+            yield fragment
+        fragments[digest] = ''.join(parts)
+        self.dirty = True
+
+    def prune(self):
+        """Drop the fragments of inputs that were not rendered since the last prune
+
+        Sections not rendered at all (outside a partial render) are kept.
+        """
+        rendered = {name for name, _digest in self.used}
+        for name, fragments in self.entries.items():
+            if name not in rendered:
+                continue
+            for digest in [digest for digest in fragments if (name, digest) not in self.used]:
+                del fragments[digest]
+                self.dirty = True
+        self.used = set()
+
+    def save(self):
+        """Write the cache back to disk if any section was re-rendered"""
+        self.prune()
+        if not self.dirty or self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'source': self.source, 'sections': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+def open_cache(module, name, cache_dir=CACHE_DIR):
+    """Open the section cache of a generator module"""
+    return SectionCache(os.path.join(cache_dir, f'{name}-sections.json'), source_digest(module))
+
+def render_section(cache, name, section, keys, data, profiler=None):
+    """Yield a section's fragments, going through the cache and profiler when given"""
+    if cache is None:
+        fragments = section(data)
+    else:
+        fragments = cache.render(name, section, keys, data)
+    if profiler is not None:
+        return profiler.measure(name, section, data, fragments)
+    return fragments
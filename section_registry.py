@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Registry of the sections of a generated document
+Each generator registers its section functions next to their definitions,
+with the cv-data.json keys they read; the registry lists them in document
+order and picks out the few a partial render (--sections) asks for, whose
+keys are then the only data loaded and validated
+"""
+
+from collections import namedtuple
+
+# Unpacks like the (name, function, keys) entries of a section table
+Section = namedtuple('Section', 'name render keys')
+
+# Keys read by many sections without selecting any of them
+SHARED_KEYS = ('personal',)
+
+class SectionRegistry:
+    """Sections of one document, iterated in document order"""
+
+    def __init__(self, order=()):
+        self.order = list(order)
+        self.sections = {}
+
+    def register(self, name, keys):
+        """Decorator registering a section function under name, as reading keys"""
+        def decorator(render):
+            self.add(name, render, keys)
+            return render
+        return decorator
+
+    def add(self, name, render, keys):
+        """Register a section; names outside the declared order go last"""
+        if name in self.sections:
+            raise ValueError(f'section "{name}" is registered twice')
+        self.sections[name] = Section(name, render, tuple(keys))
+        if name not in self.order:
+            self.order.append(name)
+
+    def __iter__(self):
+        return (self.sections[name] for name in self.order if name in self.sections)
+
+    def __len__(self):
+        return len(self.sections)
+
+    def names(self):
+        """Registered section names in document order"""
+        return [section.name for section in self]
+
+    def table(self):
+        """The sections as a list, in document order"""
+        return list(self)
+
+    def select(self, requested):
+        """Sections matching requested names, in document order
+
+        A request matches a section by name or by a data key it reads
+        (shared keys aside), so 'workExperience' selects 'work_experience'.
+        Raises ValueError naming the requests that match no section.
+        """
+        selected = set()
+        unknown = []
+        for request in requested:
+            matches = [section.name for section in self if section.name == request]
+            if not matches and request not in SHARED_KEYS:
+                matches = [section.name for section in self if request in section.keys]
+            if not matches:
+                unknown.append(request)
+            selected.update(matches)
+        if unknown:
+            raise ValueError(f'unknown section(s): {", ".join(unknown)} (available: {", ".join(self.names())})')
+        return [section for section in self if section.name in selected]
+
+def section_keys(sections, extra=()):
+    """Data keys read by sections (and extra), each once"""
+    return list(dict.fromkeys([*extra, *(key for section in sections for key in section.keys)]))
+
+def split_names(text):
+    """argparse type of --sections: 'a, b,c' -> ['a', 'b', 'c']"""
+    return [name.strip() for name in text.split(',') if name.strip()]
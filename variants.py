@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Render several variants of the CV (full, academic, industry, ...) in one run
+A variant selects and orders the cv-data.json sections it shows and can
+filter, sort and truncate the entries of any list in the data; every
+variant is rendered from one parse of the data, through one section cache
+per generator, so sections a variant shares with another are rendered once
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import generate_html
+import generate_latex
+from dates import filter_by_date, sort_by_date, start_year
+from pdf_compile import FORMAT_DIR, compile_pdf
+from schema import SchemaError
+from section_cache import CACHE_DIR, SectionCache, open_cache, source_digest
+from section_registry import SHARED_KEYS
+
+VARIANTS_PATH = 'data/variants.json'
+OUTPUT_DIR = 'build/variants'
+LABEL = re.compile(r'\\label\{([^}]*)\}')
+# \hyperref[label]{text}, the text possibly holding one level of braces
+HYPERREF = re.compile(r'\\hyperref\[([^\]]*)\](\s*\{(?:[^{}]|\{[^{}]*\})*\})')
+
+def load_variants(path=VARIANTS_PATH):
+    """Variant definitions by name, in file order"""
+    with open(path, 'r', encoding='utf-8') as f:
+        variants = json.load(f)
+    if not isinstance(variants, dict):
+        raise ValueError(f'{path}: expected an object mapping variant names to definitions')
+    return variants
+
+def select_sections(table, keys):
+    """Entries of a generator's section table that show any of keys, in the order of keys
+
+    keys None keeps the whole table in its own order.
+    """
+    if keys is None:
+        return table
+    order = {key: index for index, key in enumerate(keys)}
+    selected = []
+    for entry in table:
+        shown = [order[key] for key in entry[2] if key in order and key not in SHARED_KEYS]
+        if shown:
+            selected.append((min(shown), entry))
+    return [entry for _position, entry in sorted(selected, key=lambda item: item[0])]
+
+def partial_sections(table, keys):
+    """(section, unselected keys) of the sections in table that keys select only partly
+
+    A section showing several keys (the HTML page's languages, hobbies and
+    references) is rendered whole, so selecting one of its keys would show
+    the others too.
+    """
+    if keys is None:
+        return []
+    partial = []
+    for name, _section, section_keys in table:
+        shown = [key for key in section_keys if key not in SHARED_KEYS]
+        missing = [key for key in shown if key not in keys]
+        if missing and len(missing) < len(shown):
+            partial.append((name, missing))
+    return partial
+
+def check_variant(name, variant):
+    """Raise ValueError if the variant's sections select part of a combined section"""
+    keys = variant.get('sections')
+    for table in (generate_html.SECTIONS, generate_latex.SECTIONS):
+        for section, missing in partial_sections(table, keys):
+            raise ValueError(f'variant "{name}": section "{section}" also shows {", ".join(missing)}; '
+                             f'select all of its keys or none')
+
+def contains_any(entry, words):
+    """Whether any string value of an entry contains one of words (case-insensitive)"""
+    text = ' '.join(value for value in entry.values() if isinstance(value, str)).lower()
+    return any(word.lower() in text for word in words)
+
+def filter_entries(value, rules):
+    """Apply one variant's rules to a list of entries, or to a {year: entries} mapping
+
+    Rules: since/until (years), include/exclude (words), sort ("newest" or
+    "oldest" by date) and limit (entries kept; for a mapping, counted across
+    its years, newest first, and years left empty are dropped).
+    """
+    since, until = rules.get('since'), rules.get('until')
+    if isinstance(value, dict):
+        kept = {}
+        for year, entries in value.items():
+            year_value = start_year(year)
+            if year_value and ((since is not None and year_value < since)
+                               or (until is not None and year_value > until)):
+                continue
+            kept[year] = filter_entries(entries, {**rules, 'since': None, 'until': None, 'limit': None})
+        limit = rules.get('limit')
+        if limit is not None:
+            # In the order the generators list the years
+            for year in sorted(kept, reverse=True):
+                kept[year] = kept[year][:limit]
+                limit -= len(kept[year])
+        return {year: entries for year, entries in kept.items() if entries}
+
+    entries = list(value)
+    if since is not None or until is not None:
+        entries = filter_by_date(entries, since, until)
+    if rules.get('include'):
+        entries = [entry for entry in entries if contains_any(entry, rules['include'])]
+    if rules.get('exclude'):
+        entries = [entry for entry in entries if not contains_any(entry, rules['exclude'])]
+    if rules.get('sort'):
+        entries = sort_by_date(entries, reverse=rules['sort'] == 'newest')
+    if rules.get('limit') is not None:
+        entries = entries[:rules['limit']]
+    return entries
+
+def replace_path(data, path, update):
+    """Copy of data with the value at a dotted path replaced by update(value); the rest is shared"""
+    key, _, rest = path.partition('.')
+    if key not in data:
+        raise KeyError(f'no "{key}" in the CV data (entry path "{path}")')
+    copy = dict(data)
+    copy[key] = replace_path(data[key], rest, update) if rest else update(data[key])
+    return copy
+
+def html_anchors(sections):
+    """Section ids of a page showing the given main sections"""
+    names = {name for name, _section, _keys in sections}
+    return {anchor for name, anchor, *_rest in generate_html.NAV_ITEMS if name in names}
+
+def unlink_dangling(path):
+    """Rewrite the LaTeX file at path with every \\hyperref to a label it does not define replaced by its text
+
+    Covers the short bio links and the cross-references the generator
+    writes itself (education to honors, work experience to projects and
+    publications) once a variant drops their section or entry.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    labels = set(LABEL.findall(text))
+    unlinked = HYPERREF.sub(lambda match: match.group(0) if match.group(1) in labels else match.group(2), text)
+    if unlinked != text:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(unlinked)
+
+def unlink_short_bio(data, field, kept):
+    """Copy of data whose shortBio links lose field (target or label) when it is not in kept"""
+    if not data.get('shortBio', {}).get('links'):
+        return data
+    return replace_path(data, 'shortBio.links', lambda links: [
+        link if link.get(field) in kept else {key: value for key, value in link.items() if key != field}
+        for link in links])
+
+def apply_variant(data, variant):
+    """The CV data as a variant shows it"""
+    for path, rules in variant.get('entries', {}).items():
+        data = replace_path(data, path, lambda value, rules=rules: filter_entries(value, rules))
+    return data
+
+def render_variant(name, variant, data, output_dir, caches, pdf=False):
+    """Render one variant's index.html and cv.tex into output_dir/name"""
+    variant_dir = os.path.join(output_dir, name)
+    os.makedirs(variant_dir, exist_ok=True)
+    variant_data = apply_variant(data, variant)
+    keys = variant.get('sections')
+    html_cache, latex_cache = caches
+    html_sections = select_sections(generate_html.SECTIONS, keys)
+    latex_sections = select_sections(generate_latex.SECTIONS, keys)
+    # Links into sections or entries this variant leaves out become plain text
+    html_data = unlink_short_bio(variant_data, 'target', html_anchors(html_sections))
+    generate_html.render_html(html_data, os.path.join(variant_dir, 'index.html'),
+                              sections=html_sections, cache=html_cache)
+    generate_latex.render_latex(variant_data, os.path.join(variant_dir, 'cv.tex'),
+                                sections=latex_sections, cache=latex_cache)
+    unlink_dangling(os.path.join(variant_dir, 'cv.tex'))
+    if pdf:
+        compile_pdf(os.path.join(variant_dir, 'cv.tex'), build_dir=os.path.join(variant_dir, 'latex'),
+                    format_dir=FORMAT_DIR)
+    return variant_dir
+
+def render_variants(data, variants, output_dir=OUTPUT_DIR, cache_dir=None, pdf=False):
+    """Render every variant, sharing one section cache per generator; returns the caches"""
+    for name, variant in variants.items():
+        check_variant(name, variant)
+    caches = tuple(open_cache(module, f'{name}-variants', cache_dir) if cache_dir
+                   else SectionCache(None, source_digest(module))
+                   for module, name in ((generate_html, 'html'), (generate_latex, 'latex')))
+    for name, variant in variants.items():
+        started = time.perf_counter()
+        variant_dir = render_variant(name, variant, data, output_dir, caches, pdf)
+        print(f'  {name:<12} {(time.perf_counter() - started) * 1000:7.1f} ms  {variant_dir}')
+    for cache in caches:
+        cache.save()
+    return caches
+
+def main(argv=None):
+    """Render the CV variants"""
+    parser = argparse.ArgumentParser(description='Render CV variants from one cv-data.json')
+    parser.add_argument('names', nargs='*', help='variants to render (default: all)')
+    parser.add_argument('--data', default=generate_html.DATA_PATH, help='CV data file (default: %(default)s)')
+    parser.add_argument('--variants', default=VARIANTS_PATH, help='variant definitions (default: %(default)s)')
+    parser.add_argument('-o', '--output-dir', default=OUTPUT_DIR, help='output root (default: %(default)s)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'keep the shared section cache in {CACHE_DIR} between runs')
+    parser.add_argument('--pdf', action='store_true', help='compile every variant\'s cv.tex too')
+    args = parser.parse_args(argv)
+
+    variants = load_variants(args.variants)
+    unknown = [name for name in args.names if name not in variants]
+    if unknown:
+        parser.error(f'unknown variant(s): {", ".join(unknown)} (defined: {", ".join(variants)})')
+    if args.names:
+        variants = {name: variants[name] for name in args.names}
+    try:
+        for name, variant in variants.items():
+            check_variant(name, variant)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    try:
+        data = generate_html.load_data(args.data)
+    except SchemaError as error:
+        sys.exit(str(error))
+    print(f'Rendering {len(variants)} variants...')
+    html_cache, latex_cache = render_variants(data, variants, args.output_dir,
+                                              CACHE_DIR if args.incremental else None, args.pdf)
+    hits = html_cache.hits + latex_cache.hits
+    misses = html_cache.misses + latex_cache.misses
+    print(f'Sections rendered: {misses}, shared between variants or reused: {hits}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
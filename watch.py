@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Watch mode: rebuild on save and serve the result from memory
+Keeps the parsed data and rendered sections warm in one process, detects
+changes with inotify (polling where it is unavailable) and pushes a reload
+to connected browsers over server-sent events
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import glob
+import ipaddress
+import os
+import posixpath
+import select
+import struct
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import generate_html
+import generate_latex
+from schema import SchemaError
+from section_cache import SectionCache, source_digest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_PATTERNS = ('css/*.css', 'js/*.js', 'index.js')
+# The only files served from disk: what the page links to, never data/ or .git/
+ASSET_PATHS = ('/css/', '/js/', '/resources/', '/index.js')
+DEBOUNCE_SECONDS = 0.02
+POLL_SECONDS = 0.1
+
+RELOAD_SCRIPT = '''<script>
+    new EventSource('/__reload').onmessage = () => location.reload();
+</script>
+'''
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+def watched_files(data_path):
+    """Absolute paths of every file whose change triggers a rebuild or reload"""
+    files = {os.path.abspath(data_path), os.path.abspath(generate_html.TEMPLATE_PATH)}
+    for pattern in STATIC_PATTERNS:
+        files.update(os.path.abspath(path) for path in glob.glob(os.path.join(ROOT, pattern)))
+    return files
+
+def watch_inotify(files):
+    """Yield sets of changed files using inotify on their directories"""
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+    directories = {}
+    for directory in {os.path.dirname(path) for path in files}:
+        wd = libc.inotify_add_watch(fd, directory.encode(), WATCH_MASK)
+        if wd < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+        directories[wd] = directory
+
+    def read_events(changed):
+        buffer = os.read(fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0').decode()
+            offset += length
+            path = os.path.join(directories.get(wd, ''), name)
+            if path in files or path.endswith(('.css', '.js')):
+                changed.add(path)
+
+    try:
+        while True:
+            changed = set()
+            read_events(changed)
+            while select.select([fd], [], [], DEBOUNCE_SECONDS)[0]:
+                read_events(changed)
+            if changed:
+                yield changed
+    finally:
+        os.close(fd)
+
+def watch_polling(files):
+    """Yield sets of changed files by polling their modification times"""
+    def snapshot():
+        stamps = {}
+        for path in files:
+            try:
+                stat = os.stat(path)
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stamps[path] = None
+        return stamps
+
+    previous = snapshot()
+    while True:
+        time.sleep(POLL_SECONDS)
+        current = snapshot()
+        changed = {path for path in files if current[path] != previous[path]}
+        previous = current
+        if changed:
+            yield changed
+
+def watch_files(files, polling=False):
+    """Yield sets of changed files, preferring inotify and falling back to polling"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            yield from watch_inotify(files)
+            return
+        except OSError as error:
+            print(f'inotify unavailable ({error}), polling instead')
+    yield from watch_polling(files)
+
+class Preview:
+    """In-memory build of index.html and cv.tex that is kept warm between changes"""
+
+    def __init__(self, data_path):
+        self.data_path = os.path.abspath(data_path)
+        self.html_cache = SectionCache(None, source_digest(generate_html))
+        self.latex_cache = SectionCache(None, source_digest(generate_latex))
+        self.data = None
+        self.pages = {}
+        self.version = 0
+        self.changed = threading.Condition()
+
+    def rebuild(self, changed=None):
+        """Rebuild the outputs affected by the changed files and notify browsers"""
+        started = time.perf_counter()
+        rebuilt = []
+        try:
+            if changed is None or self.data_path in changed:
+                self.data = generate_html.load_data(self.data_path)
+                self.pages['/cv.tex'] = ''.join(generate_latex.iter_cv_latex(self.data, self.latex_cache))
+                self.latex_cache.prune()
+                rebuilt.append('cv.tex')
+            if changed is None or self.data_path in changed or generate_html.TEMPLATE_PATH in changed:
+                html = ''.join(generate_html.iter_index_html(self.data, self.html_cache))
+                self.html_cache.prune()
+                self.pages['/index.html'] = html.replace('</body>', RELOAD_SCRIPT + '</body>', 1)
+                rebuilt.append('index.html')
+        except SchemaError as error:
+            print(f'Rebuild failed: {error}')
+            return
+        except Exception as error:
+            print(f'Rebuild failed: {error!r}')
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f'Rebuilt {", ".join(rebuilt) or "nothing (static files only)"} in {elapsed:.1f} ms')
+        with self.changed:
+            self.version += 1
+            self.changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """Block until the build version moves past version or timeout expires"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """Serves built pages from memory, static files from disk, and the reload stream"""
+
+    preview = None
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            path = '/index.html'
+        if path == '/__reload':
+            return self.stream_reloads()
+        page = self.preview.pages.get(path)
+        if page is None:
+            return super().do_GET()
+        body = page.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8' if path.endswith('.html') else 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_head(self):
+        """Serve a file from disk only if it is one of the page's assets"""
+        path = posixpath.normpath(unquote(self.path.split('?', 1)[0].split('#', 1)[0]))
+        if not path.startswith(ASSET_PATHS) or path.endswith('/'):
+            self.send_error(404)
+            return None
+        return super().send_head()
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def stream_reloads(self):
+        """Server-sent events: one message per rebuild, comments as keep-alive"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        version = self.preview.version
+        try:
+            while True:
+                current = self.preview.wait_for_change(version, timeout=15)
+                self.wfile.write(b'data: reload\n\n' if current != version else b': keep-alive\n\n')
+                self.wfile.flush()
+                version = current
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def is_loopback(host):
+    """Whether host only accepts connections from this machine"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def serve(data_path, host='127.0.0.1', port=8000, polling=False):
+    """Build once, then serve the preview and rebuild on every change"""
+    preview = Preview(data_path)
+    preview.rebuild()
+
+    handler = partial(type('Handler', (PreviewHandler,), {'preview': preview}), directory=ROOT)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f'Serving preview on http://{host}:{port}/ (Ctrl+C to stop)')
+    if not is_loopback(host):
+        print(f'Warning: {host} is not a loopback address; the preview and the page assets are reachable '
+              f'from other machines')
+
+    try:
+        for changed in watch_files(watched_files(data_path), polling):
+            preview.rebuild(changed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+def main(argv=None):
+    """Main function to run the watch mode preview server"""
+    parser = argparse.ArgumentParser(description='Rebuild on change and serve a live preview')
+    parser.add_argument('--data', default=generate_html.DATA_PATH, help='CV data file (default: %(default)s)')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8000, help='port to bind (default: %(default)s)')
+    parser.add_argument('--poll', action='store_true', help='poll for changes instead of using inotify')
+    args = parser.parse_args(argv)
+    serve(args.data, args.host, args.port, args.poll)
+
+if __name__ == '__main__':
+    main()